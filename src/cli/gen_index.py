@@ -3,7 +3,6 @@ Generate an index file of all the json fixtures in the specified directory.
 """
 
 import datetime
-import json
 import os
 from pathlib import Path
 from typing import List
@@ -141,8 +140,8 @@ def generate_fixtures_index(
     if not force_flag and output_file.exists():
         index_data: IndexFile
         try:
-            with open(output_file, "r") as f:
-                index_data = IndexFile(**json.load(f))
+            with open(output_file, "rb") as f:
+                index_data = IndexFile.model_validate_json(f.read())
             if index_data.root_hash and index_data.root_hash == HexNumber(root_hash):
                 if not quiet_mode:
                     rich.print(f"Index file [bold cyan]{output_file}[/] is up-to-date.")
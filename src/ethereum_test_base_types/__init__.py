@@ -31,7 +31,8 @@ from .constants import (
     TestPrivateKey2,
 )
 from .conversions import to_bytes, to_hex
-from .json import to_json
+from .json import canonical_json_chunks, json_dumps, to_json
+from .profiling import StageProfiler
 from .pydantic import CamelModel
 from .reference_spec import ReferenceSpec
 
@@ -57,6 +58,7 @@ __all__ = (
     "NumberBoundTypeVar",
     "PaddedFixedSizeBytes",
     "ReferenceSpec",
+    "StageProfiler",
     "Storage",
     "StorageRootType",
     "TestAddress",
@@ -65,6 +67,8 @@ __all__ = (
     "TestPrivateKey2",
     "Wei",
     "ZeroPaddedHexNumber",
+    "canonical_json_chunks",
+    "json_dumps",
     "to_bytes",
     "to_hex",
     "to_json",
@@ -29,6 +29,8 @@ class ToStringSchema:
     Type converter to add a simple pydantic schema that correctly parses and serializes the type.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def __get_pydantic_core_schema__(
         source_type: Any, handler: GetCoreSchemaHandler
@@ -168,6 +170,8 @@ class Bytes(bytes, ToStringSchema):
         """
         if type(input) is cls:
             return input
+        if isinstance(input, bytes):
+            return super(Bytes, cls).__new__(cls, input)
         return super(Bytes, cls).__new__(cls, to_bytes(input))
 
     def __hash__(self) -> int:
@@ -201,8 +205,7 @@ class Bytes(bytes, ToStringSchema):
         """
         Return the keccak256 hash of the opcode byte representation.
         """
-        k = keccak.new(digest_bits=256)
-        return Hash(k.update(bytes(self)).digest())
+        return Hash(keccak.new(digest_bits=256, data=self).digest())
 
 
 S = TypeVar("S", bound="FixedSizeHexNumber")
@@ -215,8 +218,12 @@ class FixedSizeHexNumber(int, ToStringSchema):
 
     This class is used to dynamically generate subclasses of a specific byte
     length.
+
+    Instances have no `__dict__`, since large numbers of them are kept in storage maps.
     """
 
+    __slots__ = ()
+
     byte_length: ClassVar[int]
     max_value: ClassVar[int]
 
@@ -226,6 +233,7 @@ class FixedSizeHexNumber(int, ToStringSchema):
         """
 
         class Sized(cls):  # type: ignore
+            __slots__ = ()
             byte_length = length
             max_value = 2 ** (8 * length) - 1
 
@@ -269,7 +277,7 @@ class HashInt(FixedSizeHexNumber[32]):  # type: ignore
     Class that helps represent hashes in tests.
     """
 
-    pass
+    __slots__ = ()
 
 
 T = TypeVar("T", bound="FixedSizeBytes")
@@ -298,7 +306,11 @@ class FixedSizeBytes(Bytes):
         """
         if type(input) is cls:
             return input
-        return super(FixedSizeBytes, cls).__new__(cls, to_fixed_size_bytes(input, cls.byte_length))
+        # Skip the conversion of values that already are bytes of the right size, and of
+        # the converted value in `Bytes.__new__`.
+        if isinstance(input, bytes) and len(input) == cls.byte_length:
+            return super(Bytes, cls).__new__(cls, input)
+        return super(Bytes, cls).__new__(cls, to_fixed_size_bytes(input, cls.byte_length))
 
     def __hash__(self) -> int:
         """
@@ -319,15 +331,17 @@ class FixedSizeBytes(Bytes):
         """
         Compares two FixedSizeBytes objects to be equal.
         """
-        if not isinstance(other, FixedSizeBytes):
-            assert (
-                isinstance(other, str)
-                or isinstance(other, int)
-                or isinstance(other, bytes)
-                or isinstance(other, SupportsBytes)
-            )
-            other = self.__class__(other)
-        return super().__eq__(other)
+        if isinstance(other, FixedSizeBytes) or (
+            type(other) is bytes and len(other) == self.byte_length
+        ):
+            return super().__eq__(other)
+        assert (
+            isinstance(other, str)
+            or isinstance(other, int)
+            or isinstance(other, bytes)
+            or isinstance(other, SupportsBytes)
+        )
+        return super().__eq__(self.__class__(other))
 
     def __ne__(self, other: object) -> bool:
         """
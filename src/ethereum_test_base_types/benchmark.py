@@ -0,0 +1,55 @@
+"""
+Micro-benchmarks of the construction, hashing and comparison of the base types.
+
+Run with:
+
+```console
+python -m ethereum_test_base_types.benchmark
+```
+"""
+
+import timeit
+from typing import Any, Callable, Dict
+
+from .base_types import Address, Bytes, Hash
+from .composite_types import Storage
+
+ADDRESS_BYTES = bytes(range(20))
+HASH_BYTES = bytes(range(32))
+CODE_BYTES = bytes(range(256)) * 96
+
+
+def benchmarks() -> Dict[str, Callable[[], Any]]:
+    """
+    Return the benchmarked operations, by name.
+    """
+    address = Address(ADDRESS_BYTES)
+    code = Bytes(CODE_BYTES)
+    storage = Storage({i: i for i in range(64)})  # type: ignore
+    alloc_keys = {Address(i): i for i in range(64)}
+    return {
+        "Address(Address)": lambda: Address(address),
+        "Address(bytes)": lambda: Address(ADDRESS_BYTES),
+        "Address(str)": lambda: Address("0x000102030405060708090a0b0c0d0e0f10111213"),
+        "Address(int)": lambda: Address(0x1000),
+        "Hash(bytes)": lambda: Hash(HASH_BYTES),
+        "Bytes(bytes)": lambda: Bytes(CODE_BYTES),
+        "Bytes.keccak256 (24KiB code)": code.keccak256,
+        "Address == Address": lambda: address == Address(ADDRESS_BYTES),
+        "Address == bytes": lambda: address == ADDRESS_BYTES,
+        "Address in dict": lambda: Address(0x20) in alloc_keys,
+        "Storage[int]": lambda: storage[0x20],
+    }
+
+
+def main(number: int = 20_000) -> None:
+    """
+    Print the mean duration of each benchmarked operation.
+    """
+    for name, operation in benchmarks().items():
+        seconds = min(timeit.repeat(operation, number=number, repeat=3)) / number
+        print(f"{name:<30} {seconds * 1e9:>10.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
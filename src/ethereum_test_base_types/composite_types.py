@@ -2,7 +2,7 @@
 Base composite types for Ethereum test cases.
 """
 from dataclasses import dataclass
-from typing import Any, ClassVar, Dict, SupportsBytes, Type, TypeAlias
+from typing import Any, ClassVar, Dict, List, SupportsBytes, Type, TypeAlias
 
 from pydantic import Field, PrivateAttr, RootModel, TypeAdapter
 
@@ -16,6 +16,20 @@ StorageKeyValueTypeAdapter = TypeAdapter(StorageKeyValueType)
 StorageRootType = Dict[NumberConvertible, NumberConvertible]
 
 
+def to_storage_key_value(
+    key_or_value: StorageKeyValueTypeConvertible | StorageKeyValueType,
+) -> StorageKeyValueType:
+    """
+    Converts a storage key or value to its type, skipping the pydantic validation of the most
+    common inputs (storage keys and values, and plain integers).
+    """
+    if type(key_or_value) is StorageKeyValueType:
+        return key_or_value
+    if type(key_or_value) is int and 0 <= key_or_value <= StorageKeyValueType.max_value:
+        return int.__new__(StorageKeyValueType, key_or_value)
+    return StorageKeyValueTypeAdapter.validate_python(key_or_value)
+
+
 class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
     """
     Definition of a storage in pre or post state of a test
@@ -114,13 +128,13 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
 
     def __contains__(self, key: StorageKeyValueTypeConvertible | StorageKeyValueType) -> bool:
         """Checks for an item in the storage"""
-        return StorageKeyValueTypeAdapter.validate_python(key) in self.root
+        return to_storage_key_value(key) in self.root
 
     def __getitem__(
         self, key: StorageKeyValueTypeConvertible | StorageKeyValueType
     ) -> StorageKeyValueType:
         """Returns an item from the storage"""
-        return self.root[StorageKeyValueTypeAdapter.validate_python(key)]
+        return self.root[to_storage_key_value(key)]
 
     def __setitem__(
         self,
@@ -128,13 +142,11 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
         value: StorageKeyValueTypeConvertible | StorageKeyValueType,
     ):  # noqa: SC200
         """Sets an item in the storage"""
-        self.root[
-            StorageKeyValueTypeAdapter.validate_python(key)
-        ] = StorageKeyValueTypeAdapter.validate_python(value)
+        self.root[to_storage_key_value(key)] = to_storage_key_value(value)
 
     def __delitem__(self, key: StorageKeyValueTypeConvertible | StorageKeyValueType):
         """Deletes an item from the storage"""
-        del self.root[StorageKeyValueTypeAdapter.validate_python(key)]
+        del self.root[to_storage_key_value(key)]
 
     def __iter__(self):
         """Returns an iterator over the storage"""
@@ -190,9 +202,9 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
         Increments the key counter so the next time this function is called,
         the next key is used.
         """
-        slot = StorageKeyValueTypeAdapter.validate_python(self._current_slot)
+        slot = to_storage_key_value(self._current_slot)
         self._current_slot += 1
-        self[slot] = StorageKeyValueTypeAdapter.validate_python(value)
+        self[slot] = to_storage_key_value(value)
         return slot
 
     def peek_slot(self) -> int:
@@ -208,12 +220,7 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
         Used for comparison with test expected post state and alloc returned
         by the transition tool.
         """
-        for key in other.keys():
-            if key not in self:
-                return False
-            if self[key] != other[key]:
-                return False
-        return True
+        return other.root.items() <= self.root.items()
 
     def must_contain(self, address: Address, other: "Storage"):
         """
@@ -223,44 +230,56 @@ class Storage(RootModel[Dict[StorageKeyValueType, StorageKeyValueType]]):
         by the transition tool.
         Raises detailed exception when a difference is found.
         """
-        for key in other.keys():
-            if key not in self:
+        # Compare all items at once, and only look for the mismatching key if any.
+        if other.root.items() <= self.root.items():
+            return
+        for key, value in other.root.items():
+            if key not in self.root:
                 # storage[key]==0 is equal to missing storage
-                if other[key] != 0:
+                if value != 0:
                     raise Storage.MissingKey(key=key)
-            elif self[key] != other[key]:
+            elif self.root[key] != value:
                 raise Storage.KeyValueMismatch(
-                    address=address, key=key, want=self[key], got=other[key]
+                    address=address, key=key, want=self.root[key], got=value
                 )
 
     def must_be_equal(self, address: Address, other: "Storage | None"):
         """
         Succeeds only if "self" is equal to "other" storage.
         """
-        # Test keys contained in both storage objects
+        if mismatches := self.diff(address, other):
+            raise mismatches[0]
+
+    def diff(self, address: Address, other: "Storage | None") -> List["Storage.KeyValueMismatch"]:
+        """
+        Returns all the keys whose value in "other" storage is different from the value in
+        "self", where a missing key is equal to a key with a zero value.
+        """
         if other is None:
             other = Storage({})
-        for key in self.keys() & other.keys():
-            if self[key] != other[key]:
-                raise Storage.KeyValueMismatch(
-                    address=address, key=key, want=self[key], got=other[key]
+        # Compare all items at once, and only look for the mismatching keys if any.
+        if self.root == other.root:
+            return []
+        mismatches: List[Storage.KeyValueMismatch] = []
+        for key, want in self.root.items():
+            got = other.root.get(key, 0)
+            if want != got:
+                mismatches.append(
+                    Storage.KeyValueMismatch(address=address, key=key, want=want, got=got)
                 )
-
-        # Test keys contained in either one of the storage objects
-        for key in self.keys() ^ other.keys():
-            if key in self:
-                if self[key] != 0:
-                    raise Storage.KeyValueMismatch(address=address, key=key, want=self[key], got=0)
-
-            elif other[key] != 0:
-                raise Storage.KeyValueMismatch(address=address, key=key, want=0, got=other[key])
+        for key, got in other.root.items():
+            if got != 0 and key not in self.root:
+                mismatches.append(
+                    Storage.KeyValueMismatch(address=address, key=key, want=0, got=got)
+                )
+        return mismatches
 
     def canary(self) -> "Storage":
         """
         Returns a canary storage filled with non-zero values where the current storage expects
         zero values, to guarantee that the test overwrites the storage.
         """
-        return Storage({key: HashInt(0xBA5E) for key in self.keys() if self[key] == 0})
+        return Storage({key: HashInt(0xBA5E) for key, value in self.root.items() if value == 0})
 
 
 class Account(CamelModel):
@@ -379,32 +398,48 @@ class Account(CamelModel):
         Checks the returned alloc against an expected account in post state.
         Raises exception on failure.
         """
+        if mismatches := self.diff_alloc(address, account):
+            raise mismatches[0]
+
+    def diff_alloc(self: "Account", address: Address, account: "Account") -> List[Exception]:
+        """
+        Returns all the differences between the returned alloc and an expected account in post
+        state, only comparing the fields that are set in the expected account.
+        """
+        mismatches: List[Exception] = []
         if "nonce" in self.model_fields_set:
             if self.nonce != account.nonce:
-                raise Account.NonceMismatch(
-                    address=address,
-                    want=self.nonce,
-                    got=account.nonce,
+                mismatches.append(
+                    Account.NonceMismatch(
+                        address=address,
+                        want=self.nonce,
+                        got=account.nonce,
+                    )
                 )
 
         if "balance" in self.model_fields_set:
             if self.balance != account.balance:
-                raise Account.BalanceMismatch(
-                    address=address,
-                    want=self.balance,
-                    got=account.balance,
+                mismatches.append(
+                    Account.BalanceMismatch(
+                        address=address,
+                        want=self.balance,
+                        got=account.balance,
+                    )
                 )
 
         if "code" in self.model_fields_set:
             if self.code != account.code:
-                raise Account.CodeMismatch(
-                    address=address,
-                    want=self.code,
-                    got=account.code,
+                mismatches.append(
+                    Account.CodeMismatch(
+                        address=address,
+                        want=self.code,
+                        got=account.code,
+                    )
                 )
 
         if "storage" in self.model_fields_set:
-            self.storage.must_be_equal(address=address, other=account.storage)
+            mismatches.extend(self.storage.diff(address=address, other=account.storage))
+        return mismatches
 
     def __bool__(self: "Account") -> bool:
         """
@@ -36,12 +36,12 @@ def to_bytes(input: BytesConvertible) -> bytes:
     """
     Converts multiple types into bytes.
     """
+    if isinstance(input, bytes):
+        return bytes(input)
+
     if input is None:
         raise Exception("Cannot convert `None` input to bytes")
 
-    if isinstance(input, SupportsBytes) or isinstance(input, bytes) or isinstance(input, list):
-        return bytes(input)
-
     if isinstance(input, str):
         # We can have a hex representation of bytes with spaces for
         # readability
@@ -52,6 +52,10 @@ def to_bytes(input: BytesConvertible) -> bytes:
             input = "0" + input
         return bytes.fromhex(input)
 
+    # Checking against the `SupportsBytes` protocol is slow, so it's done last.
+    if isinstance(input, list) or isinstance(input, SupportsBytes):
+        return bytes(input)
+
     raise Exception("invalid type for `bytes`")
 
 
@@ -2,10 +2,16 @@
 JSON encoding and decoding for Ethereum types.
 """
 
-from typing import Any, AnyStr, List
+import json
+from typing import Any, AnyStr, Iterator, List
 
 from pydantic import BaseModel, RootModel
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # orjson is an optional dependency
+    orjson = None  # type: ignore
+
 
 def to_json(
     input: BaseModel | RootModel | AnyStr | List[BaseModel | RootModel | AnyStr],
@@ -19,3 +25,55 @@ def to_json(
         return input.model_dump(mode="json", by_alias=True, exclude_none=True)
     else:
         return str(input)
+
+
+def json_dumps(data: Any) -> bytes:
+    """
+    Serializes data as compact JSON, using `orjson` if it's installed.
+
+    The exact output may differ between the two encoders, so this must not be used for
+    files or hashes that need to be reproducible, such as the fixture files.
+
+    There's no `orjson` counterpart for decoding, since `orjson.loads` silently converts
+    integers that don't fit in 64 bits to floats; use pydantic's `model_validate_json` or
+    the standard library instead.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+CANONICAL_JSON_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+CANONICAL_JSON_STREAMED_LEVELS = 3
+
+
+def canonical_json_chunks(
+    data: Any, streamed_levels: int = CANONICAL_JSON_STREAMED_LEVELS
+) -> Iterator[str]:
+    """
+    Yields the canonical JSON representation of the data, with sorted keys and no whitespace,
+    in chunks whose concatenation is exactly `json.dumps(data, sort_keys=True,
+    separators=(",", ":"))`.
+
+    Only the outer `streamed_levels` levels of objects and arrays are streamed; the values
+    nested deeper are encoded at once by the C encoder of the standard library, so the
+    chunks stay small without giving up its speed.
+    """
+    if streamed_levels > 0 and isinstance(data, dict) and all(isinstance(k, str) for k in data):
+        yield "{"
+        for i, key in enumerate(sorted(data)):
+            yield ("," if i else "") + CANONICAL_JSON_ENCODER.encode(key) + ":"
+            yield from canonical_json_chunks(data[key], streamed_levels - 1)
+        yield "}"
+    elif streamed_levels > 0 and isinstance(data, (list, tuple)):
+        yield "["
+        for i, item in enumerate(data):
+            if i:
+                yield ","
+            yield from canonical_json_chunks(item, streamed_levels - 1)
+        yield "]"
+    else:
+        yield CANONICAL_JSON_ENCODER.encode(data)
@@ -0,0 +1,67 @@
+"""
+Opt-in timing of the stages of the fixture filling pipeline.
+
+The code of each stage is wrapped with `StageProfiler.stage`, which accumulates the time
+spent in the stage until the totals are collected with `StageProfiler.pop_stage_seconds`
+(e.g. once per test item by the filler plugin). While profiling is disabled, the only
+overhead is a flag check.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import ClassVar, Dict, Iterator, Tuple
+
+
+class StageProfiler:
+    """
+    Process-wide accumulator of the time spent in each stage of the filling pipeline.
+    """
+
+    PRE_ALLOC: ClassVar[str] = "pre_alloc"
+    TX_SIGNING: ClassVar[str] = "tx_signing"
+    T8N_SERIALIZATION: ClassVar[str] = "t8n_serialization"
+    T8N_EXECUTION: ClassVar[str] = "t8n_execution"
+    T8N_OUTPUT_VALIDATION: ClassVar[str] = "t8n_output_validation"
+    POST_STATE_VERIFICATION: ClassVar[str] = "post_state_verification"
+    FIXTURE_SERIALIZATION: ClassVar[str] = "fixture_serialization"
+    FIXTURE_VERIFICATION: ClassVar[str] = "fixture_verification"
+
+    STAGES: ClassVar[Tuple[str, ...]] = (
+        PRE_ALLOC,
+        TX_SIGNING,
+        T8N_SERIALIZATION,
+        T8N_EXECUTION,
+        T8N_OUTPUT_VALIDATION,
+        POST_STATE_VERIFICATION,
+        FIXTURE_SERIALIZATION,
+        FIXTURE_VERIFICATION,
+    )
+
+    enabled: ClassVar[bool] = False
+    _stage_seconds: ClassVar[Dict[str, float]] = {}
+
+    @classmethod
+    @contextmanager
+    def stage(cls, name: str) -> Iterator[None]:
+        """
+        Add the time spent in the context to the total of the given stage.
+        """
+        if not cls.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls._stage_seconds[name] = (
+                cls._stage_seconds.get(name, 0.0) + time.perf_counter() - start
+            )
+
+    @classmethod
+    def pop_stage_seconds(cls) -> Dict[str, float]:
+        """
+        Return the time spent in each stage since the last call and reset the totals.
+        """
+        stage_seconds = cls._stage_seconds
+        cls._stage_seconds = {}
+        return stage_seconds
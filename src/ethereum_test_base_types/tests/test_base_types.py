@@ -6,7 +6,7 @@ from typing import Any
 
 import pytest
 
-from ..base_types import Address, Hash, Wei
+from ..base_types import Address, Bytes, Hash, Wei
 
 
 @pytest.mark.parametrize(
@@ -40,6 +40,11 @@ from ..base_types import Address, Hash, Wei
         ("0x2", Hash("0x1"), False),
         (1, Hash("0x1"), True),
         (2, Hash("0x1"), False),
+        (Address("0x1"), bytes(19) + b"\x01", True),
+        (Address("0x1"), bytes(20), False),
+        (Address("0x1"), Bytes(bytes(19) + b"\x01"), True),
+        (Hash("0x1"), bytes(31) + b"\x01", True),
+        (Hash("0x1"), Address("0x1"), False),
     ],
 )
 def test_comparisons(a: Any, b: Any, equal: bool):
@@ -91,3 +96,37 @@ def test_wei_parsing(s: str, expected: int):
     Test the parsing of wei values.
     """
     assert Wei(s) == expected
+
+
+@pytest.mark.parametrize(
+    "input",
+    [
+        bytes(19) + b"\x01",
+        Bytes(bytes(19) + b"\x01"),
+        Hash(1)[12:],
+        [0] * 19 + [1],
+        "0x01",
+        1,
+        b"\x01",
+    ],
+)
+def test_fixed_size_bytes_construction(input: Any):
+    """
+    Test that the construction of fixed size bytes from the supported input types, with or
+    without the conversion fast path, produces the same values.
+    """
+    address = Address(input)
+    assert type(address) is Address
+    assert bytes(address) == bytes(19) + b"\x01"
+    assert Address(address) is address
+
+
+def test_keccak256():
+    """
+    Test that the keccak256 digest of the bytes types only depends on their bytes.
+    """
+    empty_code_hash = Hash("0xc5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470")
+    assert Bytes(b"").keccak256() == empty_code_hash
+    assert Address(0).keccak256() == Bytes(bytes(20)).keccak256()
+    assert Hash(0).keccak256() == Bytes(bytes(32)).keccak256()
+    assert Address(0).keccak256() != Hash(0).keccak256()
@@ -0,0 +1,57 @@
+"""
+Test suite for the JSON helpers of `ethereum_test_base_types`.
+"""
+
+import json
+from typing import Any
+
+import pytest
+
+from .. import json as json_module
+from ..json import canonical_json_chunks, json_dumps
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"alloc": {"0x00": {"nonce": "0x01", "storage": {}}}, "txs": [], "env": None},
+        {"unicode": "é中", "bool": True, "list": [1, -2, 3]},
+        {"big_int": 2**256 - 1},
+    ],
+)
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_dumps(monkeypatch: pytest.MonkeyPatch, data: Any, use_orjson: bool):
+    """
+    Test that `json_dumps` produces compact JSON that round-trips, with and without orjson.
+    """
+    if not use_orjson:
+        monkeypatch.setattr(json_module, "orjson", None)
+    elif json_module.orjson is None:
+        pytest.skip("orjson is not installed")
+    encoded = json_dumps(data)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == data
+    assert encoded == json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        [],
+        "0x00",
+        {"b": [{"d": 1, "c": [None, True]}], "a": {"nested": {"deeper": {"deepest": [1, 2]}}}},
+        {"unicode": "é中\n", "big_int": 2**256 - 1, "empty": {"list": [], "dict": {}}},
+        [[[[{"z": 0, "y": ("tuple", 1)}]]]],
+    ],
+)
+@pytest.mark.parametrize("streamed_levels", [0, 1, 3, 10])
+def test_canonical_json_chunks(data: Any, streamed_levels: int):
+    """
+    Test that the canonical JSON chunks are exactly the compact JSON with sorted keys.
+    """
+    chunks = list(canonical_json_chunks(data, streamed_levels))
+    assert "".join(chunks) == json.dumps(data, sort_keys=True, separators=(",", ":"))
+    if streamed_levels == 0:
+        assert len(chunks) == 1
@@ -0,0 +1,44 @@
+"""
+Test suite for the stage profiler of `ethereum_test_base_types`.
+"""
+
+import pytest
+
+from ..profiling import StageProfiler
+
+
+@pytest.fixture
+def stage_profiler(monkeypatch: pytest.MonkeyPatch):
+    """
+    Enable the profiler for the duration of a test, starting with empty totals.
+    """
+    monkeypatch.setattr(StageProfiler, "enabled", True)
+    monkeypatch.setattr(StageProfiler, "_stage_seconds", {})
+    return StageProfiler
+
+
+def test_stage_times_accumulate(stage_profiler):
+    """
+    Test that the time of repeated stages is added up and reset when popped.
+    """
+    for _ in range(2):
+        with stage_profiler.stage(StageProfiler.TX_SIGNING):
+            pass
+    with pytest.raises(ValueError):
+        with stage_profiler.stage(StageProfiler.T8N_EXECUTION):
+            raise ValueError
+    stage_seconds = stage_profiler.pop_stage_seconds()
+    assert set(stage_seconds) == {StageProfiler.TX_SIGNING, StageProfiler.T8N_EXECUTION}
+    assert all(seconds >= 0 for seconds in stage_seconds.values())
+    assert stage_profiler.pop_stage_seconds() == {}
+
+
+def test_disabled(monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that nothing is recorded while the profiler is disabled.
+    """
+    monkeypatch.setattr(StageProfiler, "enabled", False)
+    monkeypatch.setattr(StageProfiler, "_stage_seconds", {})
+    with StageProfiler.stage(StageProfiler.TX_SIGNING):
+        pass
+    assert StageProfiler.pop_stage_seconds() == {}
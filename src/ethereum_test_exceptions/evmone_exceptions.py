@@ -88,6 +88,14 @@ class EvmoneExceptionMapper:
         ExceptionMessage(
             EOFException.INVALID_CODE_SECTION_INDEX, "err: invalid_code_section_index"
         ),
+        ExceptionMessage(
+            EOFException.CALLF_TO_NON_RETURNING, "err: callf_to_non_returning_function"
+        ),
+        ExceptionMessage(
+            EOFException.EOFCREATE_WITH_TRUNCATED_CONTAINER,
+            "err: eofcreate_with_truncated_container",
+        ),
+        ExceptionMessage(EOFException.STACK_OVERFLOW, "err: stack_overflow"),
     )
 
     def __init__(self) -> None:
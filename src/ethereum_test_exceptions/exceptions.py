@@ -746,6 +746,18 @@ class EOFException(ExceptionBase):
     """
     Header parsing encounterd a section kind it wasn't expecting
     """
+    CALLF_TO_NON_RETURNING = auto()
+    """
+    CALLF instruction targeting a non-returning code section.
+    """
+    EOFCREATE_WITH_TRUNCATED_CONTAINER = auto()
+    """
+    EOFCREATE with a sub-container whose data section is truncated.
+    """
+    STACK_OVERFLOW = auto()
+    """
+    CALLF or JUMPF instruction that can overflow the stack.
+    """
 
 
 """
@@ -11,7 +11,7 @@ from .blockchain import FixtureCommon as BlockchainFixtureCommon
 from .collector import FixtureCollector, TestInfo
 from .eof import Fixture as EOFFixture
 from .state import Fixture as StateFixture
-from .verify import FixtureVerifier
+from .verify import FixtureFile, FixtureVerifier
 
 FIXTURE_FORMATS: Dict[str, FixtureFormat] = {
     f.fixture_format_name: f  # type: ignore
@@ -30,6 +30,7 @@ __all__ = [
     "BlockchainEngineFixture",
     "EOFFixture",
     "FixtureCollector",
+    "FixtureFile",
     "FixtureFormat",
     "FixtureVerifier",
     "StateFixture",
@@ -3,13 +3,12 @@ Base fixture definitions used to define all fixture types.
 """
 
 import hashlib
-import json
 from functools import cached_property
 from typing import Any, ClassVar, Dict, Type
 
 from pydantic import Field
 
-from ethereum_test_base_types import CamelModel, ReferenceSpec
+from ethereum_test_base_types import CamelModel, ReferenceSpec, canonical_json_chunks
 from ethereum_test_forks import Fork
 
 
@@ -40,11 +39,15 @@ class BaseFixture(CamelModel):
     @cached_property
     def hash(self) -> str:
         """
-        Returns the hash of the fixture.
+        Returns the hash of the canonical JSON representation of the fixture.
+
+        The representation is hashed as it's encoded, so it's never held in memory as a
+        whole.
         """
-        json_str = json.dumps(self.json_dict, sort_keys=True, separators=(",", ":"))
-        h = hashlib.sha256(json_str.encode("utf-8")).hexdigest()
-        return f"0x{h}"
+        h = hashlib.sha256()
+        for chunk in canonical_json_chunks(self.json_dict):
+            h.update(chunk.encode("utf-8"))
+        return f"0x{h.hexdigest()}"
 
     def json_dict_with_info(self, hash_only: bool = False) -> Dict[str, Any]:
         """
@@ -3,19 +3,18 @@ Fixture collector class used to collect, sort and combine the different types of
 fixtures.
 """
 
-import json
 import os
 import re
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Literal, Optional, Tuple
+from typing import Dict, List, Literal, Optional, Tuple
 
-from ethereum_test_base_types import to_json
+from ethereum_test_base_types import StageProfiler, to_json
 
-from .base import BaseFixture
-from .file import Fixtures
-from .verify import FixtureVerifier
+from .base import BaseFixture, FixtureFormat
+from .file import FIXTURES_FILE_END, format_fixtures_file_entry
+from .verify import FixtureFile, FixtureVerifier
 
 
 def strip_test_prefix(name: str) -> str:
@@ -107,8 +106,9 @@ class FixtureCollector:
     base_dump_dir: Optional[Path] = None
 
     # Internal state
-    all_fixtures: Dict[Path, Fixtures] = field(default_factory=dict)
+    fixture_formats: Dict[Path, FixtureFormat] = field(default_factory=dict)
     json_path_to_test_item: Dict[Path, TestInfo] = field(default_factory=dict)
+    stdout_fixture_count: int = 0
 
     def get_fixture_basename(self, info: TestInfo) -> Path:
         """
@@ -130,9 +130,20 @@ class FixtureCollector:
                 return module_relative_output_dir / strip_test_prefix(info.get_single_test_name())
             return module_relative_output_dir / strip_test_prefix(info.original_name)
 
+    @staticmethod
+    def get_partial_fixture_path(fixture_path: Path) -> Path:
+        """
+        Returns the path of the file the fixtures are written to until the fixture file is
+        complete.
+        """
+        return fixture_path.with_name(f"{fixture_path.name}.{os.getpid()}.partial")
+
     def add_fixture(self, info: TestInfo, fixture: BaseFixture) -> Path:
         """
-        Adds a fixture to the list of fixtures of a given test case.
+        Adds a fixture to the fixture file of a given test case.
+
+        The fixture is written immediately, so that it doesn't need to be kept in memory until
+        the fixture file is complete.
         """
         fixture_basename = self.get_fixture_basename(info)
 
@@ -141,46 +152,76 @@ class FixtureCollector:
             / fixture.output_base_dir_name()
             / fixture_basename.with_suffix(fixture.output_file_extension)
         )
-        if fixture_path not in self.all_fixtures.keys():  # relevant when we group by test function
-            self.all_fixtures[fixture_path] = Fixtures(root={})
+        first = fixture_path not in self.fixture_formats  # relevant when we group by function
+        if first:
+            self.fixture_formats[fixture_path] = fixture.__class__
             self.json_path_to_test_item[fixture_path] = info
-
-        self.all_fixtures[fixture_path][info.id] = fixture
+        elif self.fixture_formats[fixture_path] != fixture.__class__:
+            raise TypeError("All fixtures in a single file must have the same format.")
+
+        with StageProfiler.stage(StageProfiler.FIXTURE_SERIALIZATION):
+            if self.output_dir.name == "stdout":
+                sys.stdout.write(
+                    format_fixtures_file_entry(
+                        info.id, to_json(fixture), first=self.stdout_fixture_count == 0
+                    )
+                )
+                self.stdout_fixture_count += 1
+                return fixture_path
+            if first:
+                os.makedirs(fixture_path.parent, exist_ok=True)
+            with open(self.get_partial_fixture_path(fixture_path), "w" if first else "a") as f:
+                f.write(format_fixtures_file_entry(info.id, fixture.json_dict_with_info(), first))
 
         return fixture_path
 
     def dump_fixtures(self) -> None:
         """
-        Dumps all collected fixtures to their respective files.
-        """
-        if self.output_dir.name == "stdout":
-            combined_fixtures = {
-                k: to_json(v) for fixture in self.all_fixtures.values() for k, v in fixture.items()
-            }
-            json.dump(combined_fixtures, sys.stdout, indent=4)
-            return
-        os.makedirs(self.output_dir, exist_ok=True)
-        for fixture_path, fixtures in self.all_fixtures.items():
-            os.makedirs(fixture_path.parent, exist_ok=True)
-            if len({fixture.__class__ for fixture in fixtures.values()}) != 1:
-                raise TypeError("All fixtures in a single file must have the same format.")
-            fixtures.collect_into_file(fixture_path)
-
-    def verify_fixture_files(self, evm_fixture_verification: FixtureVerifier) -> None:
-        """
-        Runs `evm [state|block]test` on each fixture.
-        """
-        for fixture_path, name_fixture_dict in self.all_fixtures.items():
-            for fixture_name, fixture in name_fixture_dict.items():
-                if evm_fixture_verification.is_verifiable(fixture.__class__):
-                    info = self.json_path_to_test_item[fixture_path]
-                    verify_fixtures_dump_dir = self._get_verify_fixtures_dump_dir(info)
-                    evm_fixture_verification.verify_fixture(
-                        fixture.__class__,
-                        fixture_path,
-                        fixture_name=None,
-                        debug_output_path=verify_fixtures_dump_dir,
+        Completes all fixture files and moves them to their final location.
+        """
+        with StageProfiler.stage(StageProfiler.FIXTURE_SERIALIZATION):
+            if self.output_dir.name == "stdout":
+                sys.stdout.write(FIXTURES_FILE_END if self.stdout_fixture_count else "{}")
+                return
+            for fixture_path in self.fixture_formats:
+                partial_fixture_path = self.get_partial_fixture_path(fixture_path)
+                with open(partial_fixture_path, "a") as f:
+                    f.write(FIXTURES_FILE_END)
+                os.replace(partial_fixture_path, fixture_path)
+
+    def get_verifiable_fixture_files(
+        self, evm_fixture_verification: FixtureVerifier
+    ) -> List[FixtureFile]:
+        """
+        Returns the written fixture files that can be verified by the given verifier.
+
+        All fixtures in a file have the same format and a file is verified as a whole, so each
+        file is returned once regardless of the number of fixtures it contains.
+        """
+        fixture_files: List[FixtureFile] = []
+        for fixture_path, fixture_format in self.fixture_formats.items():
+            if evm_fixture_verification.is_verifiable(fixture_format):
+                info = self.json_path_to_test_item[fixture_path]
+                fixture_files.append(
+                    FixtureFile(
+                        fixture_format=fixture_format,
+                        path=fixture_path,
+                        debug_output_path=self._get_verify_fixtures_dump_dir(info),
                     )
+                )
+        return fixture_files
+
+    def verify_fixture_files(
+        self, evm_fixture_verification: FixtureVerifier, max_workers: int = 1
+    ) -> None:
+        """
+        Runs `evm [state|block]test` on each fixture file.
+        """
+        with StageProfiler.stage(StageProfiler.FIXTURE_VERIFICATION):
+            evm_fixture_verification.verify_fixture_files(
+                self.get_verifiable_fixture_files(evm_fixture_verification),
+                max_workers=max_workers,
+            )
 
     def _get_verify_fixtures_dump_dir(
         self,
@@ -3,7 +3,7 @@ Defines models for interacting with JSON fixture files.
 """
 import json
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Type
 
 from pydantic import RootModel
 
@@ -15,6 +15,21 @@ from .state import Fixture as StateFixture
 
 FixtureModel = BlockchainFixture | BlockchainEngineFixture | StateFixture | EOFFixture
 
+FIXTURES_FILE_END = "\n}"
+
+
+def format_fixtures_file_entry(name: str, fixture_json: Dict[str, Any], first: bool) -> str:
+    """
+    Returns a single (name, fixture) entry of a JSON fixtures file, preceded by the opening
+    brace of the file if it's the first entry or by a separator otherwise.
+
+    Writing all entries followed by `FIXTURES_FILE_END` produces exactly the same output as
+    `json.dump(fixtures, f, indent=4)`, which allows the file to be written incrementally.
+    """
+    # Strings are escaped by json.dumps, so every newline is a line break of the formatting.
+    fixture_str = json.dumps(fixture_json, indent=4).replace("\n", "\n    ")
+    return ("{\n" if first else ",\n") + f"    {json.dumps(name)}: {fixture_str}"
+
 
 class BaseFixturesRootModel(RootModel):
     """
@@ -61,11 +76,12 @@ class BaseFixturesRootModel(RootModel):
         Note: We don't use pydantic model_dump_json() on the Fixtures object as we
         add the hash to the info field on per-fixture basis.
         """
-        json_fixtures: Dict[str, Dict[str, Any]] = {}
-        for name, fixture in self.items():
-            json_fixtures[name] = fixture.json_dict_with_info()
         with open(file_path, "w") as f:
-            json.dump(json_fixtures, f, indent=4)
+            for i, (name, fixture) in enumerate(self.items()):
+                f.write(
+                    format_fixtures_file_entry(name, fixture.json_dict_with_info(), first=i == 0)
+                )
+            f.write(FIXTURES_FILE_END if len(self) else "{}")
 
     @classmethod
     def from_file(
@@ -77,9 +93,9 @@ class BaseFixturesRootModel(RootModel):
         Dynamically create a fixture model from the specified json file and,
         optionally, model format.
         """
-        with open(file_path, "r") as f:
-            json_data = json.load(f)
-        return cls.from_json_data(json_data, fixture_format)
+        with open(file_path, "rb") as f:
+            # Validate the raw json directly, without building the intermediate python objects.
+            return cls.model_class(fixture_format).model_validate_json(f.read())
 
     @classmethod
     def from_json_data(
@@ -96,6 +112,16 @@ class BaseFixturesRootModel(RootModel):
         If json_data only contains fixtures of one model type, specifying the
         fixture_format will provide a speed-up.
         """
+        return cls.model_class(fixture_format)(root=json_data)
+
+    @classmethod
+    def model_class(
+        cls, fixture_format: Optional[FixtureFormat] = None
+    ) -> Type["BaseFixturesRootModel"]:
+        """
+        Returns the model class used to load fixtures of the specified format, or this class
+        if no format is provided.
+        """
         model_mapping = {
             BlockchainFixture: BlockchainFixtures,
             BlockchainEngineFixture: BlockchainEngineFixtures,
@@ -106,11 +132,8 @@ class BaseFixturesRootModel(RootModel):
         if fixture_format is not None:
             if fixture_format not in model_mapping:
                 raise TypeError(f"Unsupported fixture format: {fixture_format}")
-            model_class = model_mapping[fixture_format]
-        else:
-            model_class = cls
-
-        return model_class(root=json_data)
+            return model_mapping[fixture_format]
+        return cls
 
 
 class Fixtures(BaseFixturesRootModel):
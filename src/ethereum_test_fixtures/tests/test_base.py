@@ -2,6 +2,9 @@
 Test cases for the ethereum_test_fixtures.base module.
 """
 
+import hashlib
+import json
+
 from ..base import BaseFixture
 
 
@@ -11,3 +14,13 @@ def test_json_dict():
     """
     fixture = BaseFixture()
     assert "_info" not in fixture.json_dict, "json_dict should exclude the 'info' field"
+
+
+def test_hash():
+    """
+    Test that the hash is computed over the canonical JSON representation of the fixture.
+    """
+    fixture = BaseFixture(_info={"comment": "not hashed"})
+    json_str = json.dumps(fixture.json_dict, sort_keys=True, separators=(",", ":"))
+    assert fixture.hash == f"0x{hashlib.sha256(json_str.encode('utf-8')).hexdigest()}"
+    assert fixture.hash == BaseFixture().hash
@@ -0,0 +1,48 @@
+"""
+Test cases for the ethereum_test_fixtures.file module.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from ..base import BaseFixture
+from ..file import FIXTURES_FILE_END, BaseFixturesRootModel, format_fixtures_file_entry
+
+
+@pytest.mark.parametrize(
+    "fixtures",
+    [
+        {"test_a": {}},
+        {
+            "test_a": {"pre": {"0x00": {"code": "0x", "storage": {}}}, "blocks": [{}, []]},
+            "test_b": {"description": "line 1\nline 2 é", "_info": {"hash": "0x00"}},
+            'test_c[fork_Cancun-"quoted"]': {"nested": {"list": [1, 2, {"a": None}]}},
+        },
+    ],
+)
+def test_format_fixtures_file_entry(fixtures: Dict[str, Any]):
+    """
+    Test that writing the entries incrementally produces the same output as `json.dump`.
+    """
+    incremental = "".join(
+        format_fixtures_file_entry(name, fixture, first=i == 0)
+        for i, (name, fixture) in enumerate(fixtures.items())
+    )
+    assert incremental + FIXTURES_FILE_END == json.dumps(fixtures, indent=4)
+
+
+@pytest.mark.parametrize("fixture_count", [0, 1, 3])
+def test_collect_into_file(tmp_path: Path, fixture_count: int):
+    """
+    Test that the streamed fixtures file is the same as the one written by `json.dump`.
+    """
+    fixtures = BaseFixturesRootModel(
+        {f"test_{i}": BaseFixture(_info={"comment": f"fixture {i}"}) for i in range(fixture_count)}
+    )
+    file_path = tmp_path / "fixtures.json"
+    fixtures.collect_into_file(file_path)
+    expected = {name: fixture.json_dict_with_info() for name, fixture in fixtures.items()}
+    assert file_path.read_text() == json.dumps(expected, indent=4)
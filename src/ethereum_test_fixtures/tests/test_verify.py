@@ -0,0 +1,70 @@
+"""
+Test cases for the ethereum_test_fixtures.verify module.
+"""
+
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from ..base import BaseFixture, FixtureFormat
+from ..verify import FixtureFile, FixtureVerifier
+
+
+class RecordingVerifier(FixtureVerifier):
+    """
+    Verifier that records the verified paths and fails for the paths named "invalid*".
+    """
+
+    def __init__(self):
+        """
+        Initialize the list of verified paths.
+        """
+        self.verified_paths: List[Path] = []
+        self.lock = threading.Lock()
+
+    def verify_fixture(
+        self,
+        fixture_format: FixtureFormat,
+        fixture_path: Path,
+        fixture_name: str | None = None,
+        debug_output_path: Path | None = None,
+    ):
+        """
+        Record the verified path.
+        """
+        assert fixture_name is None
+        with self.lock:
+            self.verified_paths.append(fixture_path)
+        if fixture_path.name.startswith("invalid"):
+            raise Exception(f"invalid fixture: {fixture_path}")
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_verify_fixture_files(max_workers: int):
+    """
+    Test that every fixture file is verified once.
+    """
+    fixture_files = [
+        FixtureFile(fixture_format=BaseFixture, path=Path(f"fixture_{i}.json")) for i in range(8)
+    ]
+    verifier = RecordingVerifier()
+    verifier.verify_fixture_files(fixture_files, max_workers=max_workers)
+    assert sorted(verifier.verified_paths) == sorted(f.path for f in fixture_files)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_verify_fixture_files_failure(max_workers: int):
+    """
+    Test that the error of the first failing fixture file is raised.
+    """
+    fixture_files = [
+        FixtureFile(fixture_format=BaseFixture, path=Path(name))
+        for name in ["valid.json", "invalid_1.json", "invalid_2.json"]
+    ]
+    verifier = RecordingVerifier()
+    with pytest.raises(Exception, match="invalid_1.json"):
+        verifier.verify_fixture_files(fixture_files, max_workers=max_workers)
+    if max_workers > 1:
+        assert len(verifier.verified_paths) == 3
@@ -3,11 +3,25 @@ Ethereum test fixture verifyer abstract class.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Sequence
 
 from .base import FixtureFormat
 
 
+@dataclass(kw_only=True, frozen=True)
+class FixtureFile:
+    """
+    A written fixture file to be verified as a whole.
+    """
+
+    fixture_format: FixtureFormat
+    path: Path
+    debug_output_path: Path | None = None
+
+
 class FixtureVerifier(ABC):
     """
     Abstract class for verifying Ethereum test fixtures.
@@ -38,3 +52,35 @@ class FixtureVerifier(ABC):
         raise NotImplementedError(
             "The `verify_fixture()` function is not supported by this tool. Use geth's evm tool."
         )
+
+    def verify_fixture_files(self, fixture_files: Sequence[FixtureFile], max_workers: int = 1):
+        """
+        Verifies each of the fixture files, running up to `max_workers` verifications
+        concurrently.
+
+        All verifications are completed before the error of the first failing file (in the
+        given order) is raised.
+        """
+        if max_workers <= 1 or len(fixture_files) <= 1:
+            for fixture_file in fixture_files:
+                self.verify_fixture(
+                    fixture_file.fixture_format,
+                    fixture_file.path,
+                    fixture_name=None,
+                    debug_output_path=fixture_file.debug_output_path,
+                )
+            return
+        # The verification runs in a subprocess, so threads are enough to verify in parallel.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.verify_fixture,
+                    fixture_file.fixture_format,
+                    fixture_file.path,
+                    fixture_name=None,
+                    debug_output_path=fixture_file.debug_output_path,
+                )
+                for fixture_file in fixture_files
+            ]
+        for future in futures:
+            future.result()
@@ -2,6 +2,7 @@
 Ethereum test fork definitions.
 """
 
+from .base_decorators import fork_method_cache_stats
 from .base_fork import Fork, ForkAttribute
 from .forks.forks import (
     ArrowGlacier,
@@ -70,6 +71,7 @@ __all__ = [
     "EIP6800Transition",
     "Cancun",
     "Prague",
+    "fork_method_cache_stats",
     "get_transition_forks",
     "forks_from",
     "forks_from_until",
@@ -2,6 +2,10 @@
 Decorators for the fork methods.
 """
 
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping
+
 
 def prefer_transition_to_method(method):
     """
@@ -10,3 +14,63 @@ def prefer_transition_to_method(method):
     """
     method.__prefer_transition_to_method__ = True
     return method
+
+
+def memoized_fork_method(method):
+    """
+    Decorator to mark a base method whose result only depends on the fork, the block number and
+    the timestamp, so the implementations of every fork are memoized.
+    """
+    method.__memoized_fork_method__ = True
+    return method
+
+
+_memoized_methods: List[Any] = []
+
+
+def freeze(value: Any) -> Any:
+    """
+    Returns a read-only version of a fork method result: mappings are wrapped in read-only
+    views and lists are converted to tuples, recursively.
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def memoize_fork_method(method: Callable) -> Callable:
+    """
+    Memoizes the implementation of a fork method.
+
+    Results are cached as read-only structures. Mappings are returned as read-only views,
+    while lists are returned as new lists, since they are cheap to copy and callers often
+    extend them.
+    """
+
+    @lru_cache(maxsize=None)
+    def cached_method(cls, *args, **kwargs) -> Any:
+        return freeze(method(cls, *args, **kwargs))
+
+    _memoized_methods.append(cached_method)
+
+    @wraps(method)
+    def wrapper(cls, *args, **kwargs) -> Any:
+        result = cached_method(cls, *args, **kwargs)
+        if isinstance(result, tuple):
+            return list(result)
+        return result
+
+    return wrapper
+
+
+def fork_method_cache_stats() -> Dict[str, int]:
+    """
+    Returns the hit and miss counters of the memoized fork methods.
+    """
+    cache_infos = [method.cache_info() for method in _memoized_methods]
+    return {
+        "hits": sum(cache_info.hits for cache_info in cache_infos),
+        "misses": sum(cache_info.misses for cache_info in cache_infos),
+    }
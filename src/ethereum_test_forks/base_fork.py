@@ -10,7 +10,11 @@ from semver import Version
 from ethereum_test_base_types import Address
 from ethereum_test_vm import EVMCodeType, Opcodes
 
-from .base_decorators import prefer_transition_to_method
+from .base_decorators import (
+    memoize_fork_method,
+    memoized_fork_method,
+    prefer_transition_to_method,
+)
 
 
 class ForkAttribute(Protocol):
@@ -88,12 +92,18 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         ignore: bool = False,
     ) -> None:
         """
-        Initializes the new fork with values that don't carry over to subclass forks.
+        Initializes the new fork with values that don't carry over to subclass forks, and
+        memoizes the methods of the fork whose base method is marked as memoized.
         """
         cls._transition_tool_name = transition_tool_name
         cls._blockchain_test_network_name = blockchain_test_network_name
         cls._solc_name = solc_name
         cls._ignore = ignore
+        for method_name, method in list(vars(cls).items()):
+            if isinstance(method, classmethod) and getattr(
+                getattr(BaseFork, method_name, None), "__memoized_fork_method__", False
+            ):
+                setattr(cls, method_name, classmethod(memoize_fork_method(method.__func__)))
 
     # Header information abstract methods
     @classmethod
@@ -177,6 +187,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         pass
 
     @classmethod
+    @memoized_fork_method
     @abstractmethod
     def tx_types(cls, block_number: int = 0, timestamp: int = 0) -> List[int]:
         """
@@ -185,6 +196,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         pass
 
     @classmethod
+    @memoized_fork_method
     @abstractmethod
     def contract_creating_tx_types(cls, block_number: int = 0, timestamp: int = 0) -> List[int]:
         """
@@ -193,6 +205,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         pass
 
     @classmethod
+    @memoized_fork_method
     @abstractmethod
     def precompiles(cls, block_number: int = 0, timestamp: int = 0) -> List[Address]:
         """
@@ -201,6 +214,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         pass
 
     @classmethod
+    @memoized_fork_method
     @abstractmethod
     def system_contracts(cls, block_number: int = 0, timestamp: int = 0) -> List[Address]:
         """
@@ -210,6 +224,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
 
     @classmethod
     @prefer_transition_to_method
+    @memoized_fork_method
     @abstractmethod
     def pre_allocation(cls) -> Mapping:
         """
@@ -222,6 +237,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
 
     @classmethod
     @prefer_transition_to_method
+    @memoized_fork_method
     @abstractmethod
     def pre_allocation_blockchain(cls) -> Mapping:
         """
@@ -299,6 +315,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
 
     # EVM information abstract methods
     @classmethod
+    @memoized_fork_method
     @abstractmethod
     def evm_code_types(cls, block_number: int = 0, timestamp: int = 0) -> List[EVMCodeType]:
         """
@@ -307,6 +324,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         pass
 
     @classmethod
+    @memoized_fork_method
     @abstractmethod
     def call_opcodes(
         cls, block_number: int = 0, timestamp: int = 0
@@ -317,6 +335,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         pass
 
     @classmethod
+    @memoized_fork_method
     @abstractmethod
     def valid_opcodes(
         cls,
@@ -327,6 +346,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         pass
 
     @classmethod
+    @memoized_fork_method
     @abstractmethod
     def create_opcodes(
         cls, block_number: int = 0, timestamp: int = 0
@@ -361,6 +381,7 @@ class BaseFork(ABC, metaclass=BaseForkMeta):
         return 0
 
     @classmethod
+    @memoized_fork_method
     @abstractmethod
     def transition_tool_name(cls, block_number: int = 0, timestamp: int = 0) -> str:
         """
@@ -4,8 +4,10 @@ Test fork utilities.
 
 from typing import Mapping, cast
 
+import pytest
 from semver import Version
 
+from ..base_decorators import fork_method_cache_stats
 from ..base_fork import Fork
 from ..forks.forks import Berlin, Cancun, Frontier, London, Paris, Prague, Shanghai
 from ..forks.transition import BerlinToLondonAt5, ParisToShanghaiAtTime15k
@@ -227,3 +229,26 @@ def test_closest_fork_supported_by_solc():
     assert get_closest_fork_with_solc_support(Cancun, Version.parse("0.8.20")) == Shanghai
     assert get_closest_fork_with_solc_support(Cancun, Version.parse("0.8.24")) == Cancun
     assert get_closest_fork_with_solc_support(Prague, Version.parse("0.8.24")) == Cancun
+
+
+def test_memoized_fork_methods():
+    """
+    Test that the fork methods are memoized, and that callers can't modify the cached result.
+    """
+    stats = fork_method_cache_stats()
+    precompiles = Prague.precompiles()
+    assert Prague.precompiles() == precompiles
+    assert fork_method_cache_stats()["hits"] > stats["hits"]
+    precompiles.clear()
+    assert Prague.precompiles() != precompiles
+
+    pre_allocation = Prague.pre_allocation_blockchain()
+    assert pre_allocation is Prague.pre_allocation_blockchain()
+    with pytest.raises(TypeError):
+        pre_allocation[0] = {}  # type: ignore
+    for account in pre_allocation.values():
+        with pytest.raises(TypeError):
+            account["nonce"] = 2
+    assert Cancun.pre_allocation_blockchain().keys() < Prague.pre_allocation_blockchain().keys()
+    assert ParisToShanghaiAtTime15k.transition_tool_name(0, 0) == "Merge"
+    assert ParisToShanghaiAtTime15k.transition_tool_name(0, 15_000) == "Shanghai"
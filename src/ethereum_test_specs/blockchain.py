@@ -2,11 +2,15 @@
 Ethereum blockchain test spec definition and filler.
 """
 
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import sha256
 from pprint import pformat
 from typing import Any, Callable, ClassVar, Dict, Generator, List, Optional, Tuple, Type
 
 import pytest
 from pydantic import ConfigDict, Field, field_validator
+from pydantic_core import to_json
 
 from ethereum_test_base_types import (
     Address,
@@ -19,6 +23,7 @@ from ethereum_test_base_types import (
     HeaderNonce,
     HexNumber,
     Number,
+    StageProfiler,
 )
 from ethereum_test_exceptions import (
     BlockException,
@@ -57,6 +62,7 @@ from ethereum_test_types import (
     Transaction,
     Withdrawal,
     WithdrawalRequest,
+    fork_pre_allocation_blockchain,
 )
 from ethereum_test_types.verkle import StateDiff, VerkleTree, Witness, WitnessCheck
 from evm_transition_tool import TransitionTool
@@ -101,6 +107,19 @@ def apply_new_parent(env: Environment, new_parent: FixtureHeader) -> Environment
     return env.copy(**updated)
 
 
+def check_block_rlp_and_exception(block: "Block"):
+    """
+    Raises an exception if the block's rlp is supplied and the block is expected to
+    produce an exception, since its post-state cannot be verified.
+    """
+    if block.rlp and block.exception is not None:
+        raise Exception(
+            "test correctness: post-state cannot be verified if the "
+            + "block's rlp is supplied and the block is not supposed "
+            + "to produce an exception"
+        )
+
+
 def count_blobs(txs: List[Transaction]) -> int:
     """
     Returns the number of blobs in a list of transactions.
@@ -335,6 +354,49 @@ class Block(Header):
         return env.copy(**new_env_values)
 
 
+@dataclass(kw_only=True)
+class ProducedBlock:
+    """
+    Data of a block produced by the transition tool, shared by all fixture formats.
+    """
+
+    env: Environment
+    header: FixtureHeader
+    txs: List[Transaction]
+    requests: Optional[Requests]
+    witness: Optional[Witness]
+
+
+@dataclass(kw_only=True)
+class BlockProduction:
+    """
+    Result of executing all the blocks of a blockchain test.
+
+    `blocks` contains one entry per test block, which is `None` for blocks with a
+    hard-coded rlp that are expected to produce an exception, `env`, `alloc`, `vkt` and
+    `head` describe the state after the last valid block, and `last_header` is the header
+    of the last executed block.
+    """
+
+    pre: Alloc
+    genesis: FixtureBlock
+    blocks: List[Optional[ProducedBlock]]
+    env: Environment
+    alloc: Alloc | Dict[str, Any]
+    vkt: Optional[VerkleTree]
+    head: Hash
+    last_header: FixtureHeader
+
+
+BLOCK_PRODUCTION_CACHE_SIZE = 32
+"""
+Maximum number of block productions kept in memory to be re-used by the next fixture
+format filled for the same test.
+"""
+
+block_production_cache: "OrderedDict[str, BlockProduction]" = OrderedDict()
+
+
 class BlockchainTest(BaseTest):
     """
     Filler type that tests multiple blocks (valid or invalid) in a chain.
@@ -369,19 +431,20 @@ class BlockchainTest(BaseTest):
             or env.parent_beacon_block_root == Hash(0)
         ), "parent_beacon_block_root must be empty at genesis"
 
-        pre_alloc = Alloc.merge(
-            Alloc.model_validate(fork.pre_allocation_blockchain()),
-            self.pre,
-        )
-        if empty_accounts := pre_alloc.empty_accounts():
-            raise Exception(f"Empty accounts in pre state: {empty_accounts}")
+        with StageProfiler.stage(StageProfiler.PRE_ALLOC):
+            pre_alloc = Alloc.merge(
+                fork_pre_allocation_blockchain(fork),
+                self.pre,
+            )
+            if empty_accounts := pre_alloc.empty_accounts():
+                raise Exception(f"Empty accounts in pre state: {empty_accounts}")
 
-        state_root: bytes
-        # TODO: refine, currently uses `evm verkle state-root` to get this.
-        if fork < Verkle or fork is EIP6800Transition:
-            state_root = pre_alloc.state_root()
-        else:
-            state_root = t8n.get_verkle_state_root(mpt_alloc=pre_alloc)
+            state_root: bytes
+            # TODO: refine, currently uses `evm verkle state-root` to get this.
+            if fork < Verkle or fork is EIP6800Transition:
+                state_root = pre_alloc.state_root()
+            else:
+                state_root = t8n.get_verkle_state_root(mpt_alloc=pre_alloc)
 
         genesis = FixtureHeader(
             parent_hash=0,
@@ -437,32 +500,31 @@ class BlockchainTest(BaseTest):
         fork: Fork,
         block: Block,
         previous_env: Environment,
-        previous_alloc: Alloc,
+        previous_alloc: Alloc | Dict[str, Any],
         previous_vkt: Optional[VerkleTree] = None,
         eips: Optional[List[int]] = None,
     ) -> Tuple[
         Environment,
         FixtureHeader,
         List[Transaction],
-        Alloc,
+        Alloc | Dict[str, Any],
         Optional[Requests],
         Optional[VerkleTree],
         Optional[Witness],
     ]:
         """
         Generate common block data for both make_fixture and make_hive_fixture.
+
+        The returned alloc is the raw alloc of the transition tool output, which is passed to
+        the next block and to the post state verification without validating all of it.
         """
-        if block.rlp and block.exception is not None:
-            raise Exception(
-                "test correctness: post-state cannot be verified if the "
-                + "block's rlp is supplied and the block is not supposed "
-                + "to produce an exception"
-            )
+        check_block_rlp_and_exception(block)
 
         env = block.set_environment(previous_env)
         env = env.set_fork_requirements(fork)
 
-        txs = [tx.with_signature_and_sender() for tx in block.txs]
+        with StageProfiler.stage(StageProfiler.TX_SIGNING):
+            txs = Transaction.with_signatures_and_senders(block.txs)
 
         if failing_tx_count := len([tx for tx in txs if tx.error]) > 0:
             if failing_tx_count > 1:
@@ -515,7 +577,7 @@ class BlockchainTest(BaseTest):
             )
             print(
                 "\nPrevious transition tool alloc:\n"
-                f"{pformat(previous_alloc.model_dump_json())}"
+                f"{pformat(to_json(previous_alloc).decode())}"
             )
             if transition_tool_output.alloc is not None:
                 print(
@@ -599,6 +661,7 @@ class BlockchainTest(BaseTest):
             requests = Requests(root=block.requests)
             header.requests_root = requests.trie_root
 
+        alloc = transition_tool_output.raw_alloc()
         if fork.fork_at(env.number, env.timestamp) == Verkle:
             env = Environment(
                 **(
@@ -606,7 +669,7 @@ class BlockchainTest(BaseTest):
                     | transition_tool_output.result.model_dump(exclude_none=True)
                 )
             )
-            transition_tool_output.alloc = previous_alloc
+            alloc = previous_alloc
             if transition_tool_output.result.verkle_conversion_ended:
                 # TODO: hack for now, replace with actual witness output once available from t8n
                 transition_tool_output.witness = Witness(
@@ -620,7 +683,7 @@ class BlockchainTest(BaseTest):
             env,
             header,
             txs,
-            transition_tool_output.alloc,
+            alloc,
             requests,
             transition_tool_output.vkt,
             transition_tool_output.witness,
@@ -640,7 +703,7 @@ class BlockchainTest(BaseTest):
         self,
         env: Environment,
         t8n: TransitionTool,
-        alloc: Alloc,
+        alloc: Alloc | Dict[str, Any],
         vkt: Optional[VerkleTree] = None,
     ):
         """
@@ -654,7 +717,8 @@ class BlockchainTest(BaseTest):
                 else:
                     raise Exception("vkt conversion started but no vkt was created.")
             else:
-                self.post.verify_post_alloc(got_alloc=alloc)
+                with StageProfiler.stage(StageProfiler.POST_STATE_VERIFICATION):
+                    self.post.verify_post_alloc(got_alloc=alloc)
         except Exception as e:
             print_traces(t8n.get_traces())
             raise e
@@ -802,20 +866,55 @@ class BlockchainTest(BaseTest):
                         )
                     )
 
-    def make_fixture(
+    def block_production_cache_key(
         self,
         t8n: TransitionTool,
         fork: Fork,
         eips: Optional[List[int]] = None,
-    ) -> Fixture:
+    ) -> Optional[str]:
         """
-        Create a fixture from the blockchain test definition.
+        Returns the key used to share the block production of this test between fixture
+        formats, or None if the block production can't be shared.
+
+        Sharing is disabled when the transition tool debug output or traces are requested,
+        since these are collected per fixture format, and for verkle tests, which modify
+        the test blocks and depend on the fixture format during block production.
         """
-        fixture_blocks: List[FixtureBlock | InvalidFixtureBlock] = []
+        if self.t8n_dump_dir or t8n.trace:
+            return None
+        if fork is Verkle or fork is EIP6800Transition:
+            return None
+        if any(block.witness_check is not None for block in self.blocks):
+            return None
+        # Sentinel values such as `Header.REMOVE_FIELD` are not JSON-serializable, but they
+        # are singletons, so their identity can be used within the session.
+        test_json = to_json(
+            self, fallback=lambda obj: f"{type(obj).__name__}@{id(obj)}"
+        )
+        key_parts = [t8n.version().encode(), fork.name().encode(), str(eips).encode()]
+        return sha256(b"\0".join(key_parts + [test_json])).hexdigest()
+
+    def produce_blocks(
+        self,
+        t8n: TransitionTool,
+        fork: Fork,
+        eips: Optional[List[int]] = None,
+    ) -> BlockProduction:
+        """
+        Execute all the blocks of the test and return the resulting block data, which is
+        used to create the fixture of any of the blockchain fixture formats.
+
+        The result is kept in memory, so that the next fixture format filled for the same
+        test and fork doesn't need to execute the blocks again.
+        """
+        cache_key = self.block_production_cache_key(t8n, fork, eips)
+        if cache_key is not None and cache_key in block_production_cache:
+            # All fixture formats that share the block production are filled at this point.
+            return block_production_cache.pop(cache_key)
 
         pre, genesis = self.make_genesis(fork, t8n)
 
-        alloc = pre
+        alloc: Alloc | Dict[str, Any] = pre
         env = environment_from_parent_header(genesis.header)
         head = genesis.header.block_hash
         vkt: Optional[VerkleTree] = None
@@ -824,7 +923,7 @@ class BlockchainTest(BaseTest):
         if fork is Verkle:
             env.verkle_conversion_ended = True
             # convert alloc to vkt
-            vkt = t8n.from_mpt_to_vkt(alloc)
+            vkt = t8n.from_mpt_to_vkt(pre)
 
         # Hack for filling naive verkle transition tests
         if fork is EIP6800Transition:
@@ -838,21 +937,86 @@ class BlockchainTest(BaseTest):
             # Add a dummy block at the end of the test blocks
             self.blocks.append(Block())
 
+        produced_blocks: List[Optional[ProducedBlock]] = []
+        last_header = genesis.header
+        for block in self.blocks:
+            if block.rlp is not None and block.exception is not None:
+                # The RLP is hard-coded and invalid, the block is not executed.
+                produced_blocks.append(None)
+                continue
+            new_env, header, txs, new_alloc, requests, new_vkt, witness = (
+                self.generate_block_data(
+                    t8n=t8n,
+                    fork=fork,
+                    block=block,
+                    previous_env=env,
+                    previous_alloc=alloc,
+                    previous_vkt=vkt,
+                    eips=eips,
+                )
+            )
+            produced_blocks.append(
+                ProducedBlock(
+                    env=new_env,
+                    header=header,
+                    txs=txs,
+                    requests=requests,
+                    witness=witness,
+                )
+            )
+            last_header = header
+            if block.exception is None:
+                # Update env, alloc, vkt, and last block hash for the next block.
+                alloc = new_alloc
+                env = apply_new_parent(new_env, header)
+                head = header.block_hash
+                vkt = new_vkt
+
+        production = BlockProduction(
+            pre=pre,
+            genesis=genesis,
+            blocks=produced_blocks,
+            env=env,
+            alloc=alloc,
+            vkt=vkt,
+            head=head,
+            last_header=last_header,
+        )
+        if cache_key is not None:
+            block_production_cache[cache_key] = production
+            while len(block_production_cache) > BLOCK_PRODUCTION_CACHE_SIZE:
+                block_production_cache.popitem(last=False)
+        return production
+
+    def make_fixture(
+        self,
+        t8n: TransitionTool,
+        fork: Fork,
+        eips: Optional[List[int]] = None,
+    ) -> Fixture:
+        """
+        Create a fixture from the blockchain test definition.
+        """
         for block in self.blocks:
-            if block.rlp is None:
+            if block.rlp is not None:
+                assert block.exception is not None, (
+                    "test correctness: if the block's rlp is hard-coded, "
+                    + "the block is expected to produce an exception"
+                )
+
+        production = self.produce_blocks(t8n, fork, eips)
+
+        fixture_blocks: List[FixtureBlock | InvalidFixtureBlock] = []
+        for block, produced_block in zip(self.blocks, production.blocks):
+            if produced_block is not None:
                 # This is the most common case, the RLP needs to be constructed
                 # based on the transactions to be included in the block.
-                # Set the environment according to the block to execute.
-                new_env, header, txs, new_alloc, requests, new_vkt, witness = (
-                    self.generate_block_data(
-                        t8n=t8n,
-                        fork=fork,
-                        block=block,
-                        previous_env=env,
-                        previous_alloc=alloc,
-                        previous_vkt=vkt,
-                        eips=eips,
-                    )
+                new_env, header, txs, requests, witness = (
+                    produced_block.env,
+                    produced_block.header,
+                    produced_block.txs,
+                    produced_block.requests,
+                    produced_block.witness,
                 )
                 fixture_block = FixtureBlockBase(
                     header=header,
@@ -896,11 +1060,6 @@ class BlockchainTest(BaseTest):
                 ).with_rlp(txs=txs, requests=requests)
                 if block.exception is None:
                     fixture_blocks.append(fixture_block)
-                    # Update env, alloc, vkt, and last block hash for the next block.
-                    alloc = new_alloc
-                    env = apply_new_parent(new_env, header)
-                    head = header.block_hash
-                    vkt = new_vkt
                 else:
                     fixture_blocks.append(
                         InvalidFixtureBlock(
@@ -915,10 +1074,6 @@ class BlockchainTest(BaseTest):
                         ),
                     )
             else:
-                assert block.exception is not None, (
-                    "test correctness: if the block's rlp is hard-coded, "
-                    + "the block is expected to produce an exception"
-                )
                 fixture_blocks.append(
                     InvalidFixtureBlock(
                         rlp=block.rlp,
@@ -926,14 +1081,16 @@ class BlockchainTest(BaseTest):
                     ),
                 )
 
-        self.verify_post_state(env=env, t8n=t8n, alloc=alloc, vkt=vkt)
+        self.verify_post_state(
+            env=production.env, t8n=t8n, alloc=production.alloc, vkt=production.vkt
+        )
         return Fixture(
             fork=self.network_info(fork, eips),
-            genesis=genesis.header,
-            genesis_rlp=genesis.rlp,
+            genesis=production.genesis.header,
+            genesis_rlp=production.genesis.rlp,
             blocks=fixture_blocks,
-            last_block_hash=head,
-            pre=pre,
+            last_block_hash=production.head,
+            pre=production.pre,
             # TODO: post_state=alloc
         )
 
@@ -946,58 +1103,36 @@ class BlockchainTest(BaseTest):
         """
         Create a hive fixture from the blocktest definition.
         """
-        fixture_payloads: List[FixtureEngineNewPayload] = []
-
-        pre, genesis = self.make_genesis(fork, t8n)
-        alloc = pre
-        env = environment_from_parent_header(genesis.header)
-        head_hash = genesis.header.block_hash
-        vkt: Optional[VerkleTree] = None
-
-        # Hack for filling naive verkle transition tests
-        if fork is EIP6800Transition:
-            # Add a dummy block before the fork transition
-            self.blocks.insert(0, Block(timestamp=HexNumber(fork.transition_at() - 1)))
-            # Set timestamp for the next block to verkle transition time
-            self.blocks[1].timestamp = HexNumber(fork.transition_at())
-            # Increment all other block numbers
-            for i, block in enumerate(self.blocks[1:]):
-                block.number = HexNumber(i + 2)
-            # Add a dummy block at the end of the test blocks
-            self.blocks.append(Block())
-
         for block in self.blocks:
+            if block.rlp is not None:
+                check_block_rlp_and_exception(block)
+
+        production = self.produce_blocks(t8n, fork, eips)
+        genesis = production.genesis
+        env, alloc, vkt, head_hash = (
+            production.env,
+            production.alloc,
+            production.vkt,
+            production.head,
+        )
+
+        fixture_payloads: List[FixtureEngineNewPayload] = []
+        for block, produced_block in zip(self.blocks, production.blocks):
             # TODO: fix witness for hive fixture? Do we need it?
-            new_env, header, txs, new_alloc, requests, new_vkt, _ = (
-                self.generate_block_data(
-                    t8n=t8n,
-                    fork=fork,
-                    block=block,
-                    previous_env=env,
-                    previous_alloc=alloc,
-                    previous_vkt=vkt,
-                    eips=eips,
-                )
-            )
-            if block.rlp is None:
+            if produced_block is not None and block.rlp is None:
                 fixture_payloads.append(
                     FixtureEngineNewPayload.from_fixture_header(
                         fork=fork,
-                        header=header,
-                        transactions=txs,
-                        withdrawals=new_env.withdrawals,
-                        requests=requests,
+                        header=produced_block.header,
+                        transactions=produced_block.txs,
+                        withdrawals=produced_block.env.withdrawals,
+                        requests=produced_block.requests,
                         validation_error=block.exception,
                         error_code=block.engine_api_error_code,
                     )
                 )
-                if block.exception is None:
-                    alloc = new_alloc
-                    env = apply_new_parent(new_env, header)
-                    head_hash = header.block_hash
-                    vkt = new_vkt
         fcu_version = fork.engine_forkchoice_updated_version(
-            header.number, header.timestamp
+            production.last_header.number, production.last_header.timestamp
         )
         assert (
             fcu_version is not None
@@ -1040,7 +1175,7 @@ class BlockchainTest(BaseTest):
             genesis=genesis.header,
             payloads=fixture_payloads,
             fcu_version=fcu_version,
-            pre=pre,
+            pre=production.pre,
             # TODO: post_state=alloc
             sync_payload=sync_payload,
             last_block_hash=head_hash,
@@ -2,12 +2,16 @@
 Ethereum EOF test spec definition and filler.
 """
 
+import atexit
+import os
+import select
 import subprocess
+import sys
 import warnings
 from pathlib import Path
 from shutil import which
 from subprocess import CompletedProcess
-from typing import Any, Callable, ClassVar, Dict, Generator, List, Optional, Type
+from typing import Any, Callable, ClassVar, Dict, Generator, List, Optional, Sequence, Tuple, Type
 
 import pytest
 from pydantic import Field, model_validator
@@ -27,6 +31,7 @@ from ethereum_test_fixtures.eof import Result, Vector
 from ethereum_test_forks import Fork
 from ethereum_test_types import Alloc, Environment, Transaction
 from ethereum_test_types.eof.v1 import Container, ContainerKind
+from ethereum_test_types.eof.v1.validation import container_validity_error
 from evm_transition_tool import TransitionTool
 
 from .base import BaseTest
@@ -101,15 +106,102 @@ class EOFExceptionMismatch(EOFBaseException):
         super().__init__(message)
 
 
+class EOFValidationMismatch(EOFBaseException):
+    """
+    Exception used when the in-process validation of EOF code differs from eofparse.
+    """
+
+    def __init__(self, *, code: Bytes, validator: str, eofparse: str):
+        message = (
+            "In-process validation of EOF code differs from eofparse:\n"
+            f"     Code: {self.format_code(code)}\n"
+            f"Validator: {validator}\n"
+            f" Eofparse: {eofparse}"
+        )
+        super().__init__(message)
+
+
+class EOFParseSession:
+    """
+    Long-lived `evmone-eofparse` process that validates containers of one kind, one per line.
+
+    The output of the process is a pseudo-terminal, which makes it line-buffered, so the
+    result of each container can be read before the next one is sent.
+    """
+
+    timeout: float = 10
+
+    def __init__(self, binary: Path, *args: str):
+        import pty
+        import tty
+
+        output_fd, process_output_fd = pty.openpty()
+        # Raw mode, to not translate the newlines of the output.
+        tty.setraw(process_output_fd)
+        try:
+            self.process = subprocess.Popen(
+                [binary, *args],
+                stdin=subprocess.PIPE,
+                stdout=process_output_fd,
+                stderr=subprocess.DEVNULL,
+            )
+        except Exception:
+            os.close(output_fd)
+            raise
+        finally:
+            os.close(process_output_fd)
+        self.output_fd = output_fd
+        self.output = b""
+
+    def validate(self, code: Bytes) -> str:
+        """
+        Validate a container and return the line output by `evmone-eofparse` for it.
+        """
+        assert self.process.stdin is not None
+        self.process.stdin.write(f"{code}\n".encode())
+        self.process.stdin.flush()
+        while b"\n" not in self.output:
+            ready, _, _ = select.select([self.output_fd], [], [], self.timeout)
+            if not ready:
+                raise TimeoutError(f"`evmone-eofparse` did not respond in {self.timeout}s.")
+            output = os.read(self.output_fd, 65536)
+            if not output:
+                raise EOFError("`evmone-eofparse` closed its output.")
+            self.output += output
+        line, self.output = self.output.split(b"\n", 1)
+        return line.decode().strip()
+
+    def close(self):
+        """
+        Stop the process.
+        """
+        if self.process.stdin is not None:
+            try:
+                self.process.stdin.close()
+            except BrokenPipeError:  # The process already exited
+                pass
+        try:
+            self.process.wait(timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        os.close(self.output_fd)
+
+
 class EOFParse:
     """evmone-eofparse binary."""
 
     binary: Path
+    use_sessions: bool
+    sessions: Dict[bool, EOFParseSession]
 
-    def __new__(cls):
+    def __new__(cls, binary: Optional[Path | str] = None):
         """Make EOF binary a singleton."""
         if not hasattr(cls, "instance"):
             cls.instance = super(EOFParse, cls).__new__(cls)
+            cls.instance.use_sessions = sys.platform != "win32"
+            cls.instance.sessions = {}
+            atexit.register(cls.instance.close)
         return cls.instance
 
     def __init__(
@@ -124,22 +216,102 @@ class EOFParse:
             raise FileNotFoundError(
                 "`evmone-eofparse` binary executable not found/not executable."
             )
+        if Path(binary) != getattr(self, "binary", None):
+            self.close()
         self.binary = Path(binary)
 
-    def run(self, *args: str, input: str | None = None) -> CompletedProcess:
-        """Run evmone with the given arguments"""
+    def run(self, *args: str, input: str | None = None, max_errors: int = 1) -> CompletedProcess:
+        """
+        Run evmone with the given arguments.
+
+        The return code of `evmone-eofparse` is the number of invalid containers of the input.
+        """
         result = subprocess.run(
             [self.binary, *args],
             capture_output=True,
             text=True,
             input=input,
         )
-        if result.returncode not in [0, 1]:
+        if result.returncode not in range(min(max_errors + 1, 256)):
             raise Exception(
                 f"`{self.binary.name}` call failed with return code {result.returncode}."
             )
         return result
 
+    def session(self, initcode: bool) -> EOFParseSession | None:
+        """
+        Return the long-lived process that validates the containers of the given kind, starting
+        it if needed, or None if sessions are not supported.
+        """
+        if not self.use_sessions:
+            return None
+        if initcode not in self.sessions:
+            try:
+                self.sessions[initcode] = EOFParseSession(
+                    self.binary, *(["--initcode"] if initcode else [])
+                )
+            except (ImportError, OSError):
+                self.use_sessions = False
+                return None
+        return self.sessions[initcode]
+
+    def close(self):
+        """
+        Stop the long-lived processes.
+        """
+        for session in self.sessions.values():
+            session.close()
+        self.sessions.clear()
+
+    def validate_batch(
+        self, containers: Sequence[Tuple[Bytes, ContainerKind | None]]
+    ) -> List[str]:
+        """
+        Validate a batch of containers and return the line output by `evmone-eofparse` for
+        each one.
+
+        The containers are streamed, one per line, through a long-lived process per container
+        kind. If the long-lived processes are not supported or fail, all the containers of each
+        kind are validated by a single call instead.
+        """
+        # `evmone-eofparse` skips empty lines, so there's no output for empty containers.
+        results = [""] * len(containers)
+        indexes_by_kind: Dict[bool, List[int]] = {}
+        for index, (code, kind) in enumerate(containers):
+            if len(code) > 0:
+                indexes_by_kind.setdefault(kind == ContainerKind.INITCODE, []).append(index)
+        for initcode, indexes in indexes_by_kind.items():
+            codes = [containers[index][0] for index in indexes]
+            for index, line in zip(indexes, self.validate_kind(codes, initcode=initcode)):
+                results[index] = line
+        return results
+
+    def validate_kind(self, codes: Sequence[Bytes], *, initcode: bool) -> List[str]:
+        """
+        Validate containers of the same kind and return the line output for each one.
+        """
+        session = self.session(initcode)
+        if session is not None:
+            try:
+                return [session.validate(code) for code in codes]
+            except (OSError, EOFError, TimeoutError) as e:
+                warnings.warn(
+                    f"{e} Falling back to one `evmone-eofparse` call per batch of containers."
+                )
+                self.close()
+                self.use_sessions = False
+        result = self.run(
+            *(["--initcode"] if initcode else []),
+            input="".join(f"{code}\n" for code in codes),
+            max_errors=len(codes),
+        )
+        lines = result.stdout.splitlines()
+        if len(lines) != len(codes):
+            raise Exception(
+                f"`{self.binary.name}` returned {len(lines)} results for {len(codes)} containers."
+            )
+        return [line.strip() for line in lines]
+
 
 class EOFTest(BaseTest):
     """
@@ -154,6 +326,13 @@ class EOFTest(BaseTest):
         EOFFixture,
     ]
 
+    cross_check_validation: ClassVar[bool] = False
+    """
+    Validate every container both in-process and with `evmone-eofparse`, and fail if the
+    results differ, instead of only running `evmone-eofparse` when the in-process validation
+    disagrees with the expected result.
+    """
+
     @model_validator(mode="before")
     @classmethod
     def check_container_exception(cls, data: Any) -> Any:
@@ -221,30 +400,58 @@ class EOFTest(BaseTest):
             )
         ]
         fixture = EOFFixture(vectors=dict(enumerate(vectors)))
+
+        # Vectors that are verified with `evmone-eofparse`, with the in-process validation
+        # message. In the common case, the in-process validation agrees with the expected
+        # result and no subprocess is needed.
+        parser = EvmoneExceptionMapper()
+        unverified_vectors: List[Tuple[Vector, Result, str]] = []
+        for vector in fixture.vectors.values():
+            expected_result = vector.results.get(fork.blockchain_test_network_name())
+            if expected_result is None:
+                raise Exception(f"EOF Fixture missing vector result for fork: {fork}")
+            validity_error = container_validity_error(
+                vector.code, initcode=vector.container_kind == ContainerKind.INITCODE
+            )
+            validator_message = (
+                "OK" if validity_error is None else parser.exception_to_message(validity_error)
+            )
+            if not self.cross_check_validation:
+                try:
+                    self.verify_result(validator_message, expected_result, vector.code)
+                    continue
+                except EOFBaseException:
+                    pass
+            unverified_vectors.append((vector, expected_result, validator_message))
+
+        if not unverified_vectors:
+            return fixture
         try:
             eof_parse = EOFParse()
         except FileNotFoundError as e:
             warnings.warn(f"{e} Skipping EOF fixture verification. Fixtures may be invalid!")
             return fixture
 
-        for _, vector in fixture.vectors.items():
-            expected_result = vector.results.get(fork.blockchain_test_network_name())
-            if expected_result is None:
-                raise Exception(f"EOF Fixture missing vector result for fork: {fork}")
-            args = []
-            if vector.container_kind == ContainerKind.INITCODE:
-                args.append("--initcode")
-            result = eof_parse.run(*args, input=str(vector.code))
-            self.verify_result(result, expected_result, vector.code)
+        results = eof_parse.validate_batch(
+            [(vector.code, vector.container_kind) for vector, _, _ in unverified_vectors]
+        )
+        for (vector, expected_result, validator_message), actual_message in zip(
+            unverified_vectors, results
+        ):
+            eofparse_message = "OK" if "OK" in actual_message else actual_message
+            if self.cross_check_validation and eofparse_message != validator_message:
+                raise EOFValidationMismatch(
+                    code=vector.code, validator=validator_message, eofparse=actual_message
+                )
+            self.verify_result(actual_message, expected_result, vector.code)
 
         return fixture
 
-    def verify_result(self, result: CompletedProcess, expected_result: Result, code: Bytes):
+    def verify_result(self, actual_message: str, expected_result: Result, code: Bytes):
         """
         Checks that the reported exception string matches the expected error.
         """
         parser = EvmoneExceptionMapper()
-        actual_message = result.stdout.strip()
         actual_exception = parser.message_to_exception(actual_message)
 
         if expected_result.exception is None:
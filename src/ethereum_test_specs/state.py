@@ -6,6 +6,7 @@ from typing import Any, Callable, ClassVar, Dict, Generator, List, Optional, Typ
 
 import pytest
 
+from ethereum_test_base_types import StageProfiler
 from ethereum_test_exceptions import EngineAPIError
 from ethereum_test_fixtures import (
     BaseFixture,
@@ -21,7 +22,7 @@ from ethereum_test_fixtures.state import (
     FixtureTransaction,
 )
 from ethereum_test_forks import EIP6800Transition, Fork
-from ethereum_test_types import Alloc, Environment, Transaction
+from ethereum_test_types import Alloc, Environment, Transaction, fork_pre_allocation
 from evm_transition_tool import TransitionTool
 
 from .base import BaseTest
@@ -126,13 +127,15 @@ class StateTest(BaseTest):
         fork = fork.fork_at(self.env.number, self.env.timestamp)
 
         env = self.env.set_fork_requirements(fork)
-        tx = self.tx.with_signature_and_sender(keep_secret_key=True)
-        pre_alloc = Alloc.merge(
-            Alloc.model_validate(fork.pre_allocation()),
-            self.pre,
-        )
-        if empty_accounts := pre_alloc.empty_accounts():
-            raise Exception(f"Empty accounts in pre state: {empty_accounts}")
+        with StageProfiler.stage(StageProfiler.TX_SIGNING):
+            tx = self.tx.with_signature_and_sender(keep_secret_key=True)
+        with StageProfiler.stage(StageProfiler.PRE_ALLOC):
+            pre_alloc = Alloc.merge(
+                fork_pre_allocation(fork),
+                self.pre,
+            )
+            if empty_accounts := pre_alloc.empty_accounts():
+                raise Exception(f"Empty accounts in pre state: {empty_accounts}")
 
         transition_tool_output = t8n.evaluate(
             alloc=pre_alloc,
@@ -146,7 +149,8 @@ class StateTest(BaseTest):
         )
 
         try:
-            self.post.verify_post_alloc(transition_tool_output.alloc)
+            with StageProfiler.stage(StageProfiler.POST_STATE_VERIFICATION):
+                self.post.verify_post_alloc(transition_tool_output.raw_alloc())
         except Exception as e:
             print_traces(t8n.get_traces())
             raise e
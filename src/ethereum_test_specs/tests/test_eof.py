@@ -0,0 +1,172 @@
+"""
+Test the validation of EOF containers with `evmone-eofparse`.
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Generator, List, Sequence, Tuple
+
+import pytest
+
+from ethereum_test_base_types import Bytes
+from ethereum_test_exceptions import EOFException
+from ethereum_test_forks import Prague
+from ethereum_test_types.eof.v1 import Container, ContainerKind
+from ethereum_test_vm import Opcodes as Op
+
+from .. import eof
+from ..eof import EOFParse, EOFTest, EOFValidationMismatch, ExpectedEOFException
+
+FAKE_EOFPARSE = f"""#!{sys.executable}
+import sys
+
+initcode = "--initcode" in sys.argv
+errors = 0
+while line := sys.stdin.readline():
+    line = line.strip()
+    if not line or line.startswith("#"):
+        continue
+    if bytes.fromhex(line.removeprefix("0x")).startswith(bytes.fromhex("ef00")):
+        print("OK " + ("initcode" if initcode else "runtime"))
+    else:
+        print("err: invalid_prefix")
+        errors += 1
+sys.exit(errors)
+"""
+
+
+@pytest.fixture
+def eof_parse(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[EOFParse, None, None]:
+    """
+    Return a new `EOFParse` instance that runs a fake `evmone-eofparse`.
+    """
+    binary = tmp_path / "evmone-eofparse"
+    binary.write_text(FAKE_EOFPARSE)
+    binary.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+    previous_instance = EOFParse.__dict__.get("instance")
+    if previous_instance is not None:
+        del EOFParse.instance
+    eof_parse = EOFParse(binary)
+    yield eof_parse
+    eof_parse.close()
+    del EOFParse.instance
+    if previous_instance is not None:
+        EOFParse.instance = previous_instance
+
+
+@pytest.fixture(autouse=True)
+def existing_tests(monkeypatch: pytest.MonkeyPatch):
+    """
+    Forget the EOF tests generated by other tests, which would be reported as duplicates.
+    """
+    monkeypatch.setattr(eof, "existing_tests", {})
+
+
+CONTAINERS = [
+    (Bytes("0xef0001"), None),
+    (Bytes("0x6001"), ContainerKind.RUNTIME),
+    (Bytes("0xef0002"), ContainerKind.INITCODE),
+    (Bytes(""), None),
+    (Bytes("0x00"), ContainerKind.INITCODE),
+]
+EXPECTED_RESULTS = [
+    "OK runtime",
+    "err: invalid_prefix",
+    "OK initcode",
+    "",
+    "err: invalid_prefix",
+]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Sessions require a pseudo-terminal")
+def test_validate_batch_session(eof_parse: EOFParse):
+    """
+    Test that the containers are validated by a long-lived process per kind.
+    """
+    assert eof_parse.validate_batch(CONTAINERS) == EXPECTED_RESULTS
+    assert eof_parse.use_sessions
+    sessions = dict(eof_parse.sessions)
+    assert sessions.keys() == {False, True}
+    assert eof_parse.validate_batch(CONTAINERS[::-1]) == EXPECTED_RESULTS[::-1]
+    assert eof_parse.sessions == sessions
+    assert all(session.process.poll() is None for session in sessions.values())
+
+    eof_parse.close()
+    assert all(session.process.poll() is not None for session in sessions.values())
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Sessions require a pseudo-terminal")
+def test_validate_batch_session_failure(eof_parse: EOFParse):
+    """
+    Test that the containers are validated by a single call if the long-lived process fails.
+    """
+    session = eof_parse.session(initcode=False)
+    assert session is not None
+    session.process.kill()
+    session.process.wait()
+    with pytest.warns(UserWarning, match="Falling back"):
+        assert eof_parse.validate_batch(CONTAINERS) == EXPECTED_RESULTS
+    assert not eof_parse.use_sessions
+    assert eof_parse.sessions == {}
+
+
+def test_validate_batch_without_sessions(eof_parse: EOFParse):
+    """
+    Test that all the containers of each kind are validated by a single call.
+    """
+    eof_parse.use_sessions = False
+    assert eof_parse.validate_batch(CONTAINERS) == EXPECTED_RESULTS
+    assert eof_parse.sessions == {}
+
+
+@pytest.mark.parametrize("cross_check", [False, True])
+def test_eof_test_validated_in_process(
+    eof_parse: EOFParse,
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+    cross_check: bool,
+):
+    """
+    Test that `evmone-eofparse` only validates the containers whose in-process validation
+    disagrees with the expected result, unless in cross-check mode.
+    """
+    monkeypatch.setattr(EOFTest, "cross_check_validation", cross_check)
+    batches: List[Sequence[Tuple[Bytes, ContainerKind | None]]] = []
+
+    def validate_batch(containers: Sequence[Tuple[Bytes, ContainerKind | None]]) -> List[str]:
+        batches.append(containers)
+        return EOFParse.validate_batch(eof_parse, containers)
+
+    monkeypatch.setattr(eof_parse, "validate_batch", validate_batch)
+    EOFTest(data=Container.Code(Op.PUSH0 + Op.POP + Op.STOP)).make_eof_test_fixture(
+        request=request, fork=Prague, eips=None
+    )
+    assert len(batches) == (1 if cross_check else 0)
+
+
+def test_eof_test_validated_by_eofparse(eof_parse: EOFParse, request: pytest.FixtureRequest):
+    """
+    Test that `evmone-eofparse` decides when the in-process validation disagrees with the
+    expected result.
+    """
+    with pytest.raises(ExpectedEOFException):
+        EOFTest(
+            data=Container.Code(Op.STOP), expect_exception=EOFException.STACK_UNDERFLOW
+        ).make_eof_test_fixture(request=request, fork=Prague, eips=None)
+
+
+def test_eof_test_cross_check_mismatch(
+    eof_parse: EOFParse, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test that a difference between the in-process validation and `evmone-eofparse` is reported
+    in cross-check mode.
+    """
+    monkeypatch.setattr(EOFTest, "cross_check_validation", True)
+    with pytest.raises(EOFValidationMismatch):
+        EOFTest(
+            data=Container.Code(Op.POP + Op.STOP),
+            expect_exception=EOFException.STACK_UNDERFLOW,
+        ).make_eof_test_fixture(request=request, fork=Prague, eips=None)
@@ -18,7 +18,7 @@ from ethereum_test_fixtures import (
     FixtureFormat,
     StateFixture,
 )
-from ethereum_test_fixtures.blockchain import FixtureCommon
+from ethereum_test_fixtures.blockchain import EngineFixture, FixtureCommon
 from ethereum_test_forks import Berlin, Fork, Istanbul, London, Paris, Shanghai
 from ethereum_test_types import Alloc, Environment, Transaction
 from ethereum_test_vm import Opcodes as Op
@@ -911,3 +911,37 @@ def test_fill_blockchain_invalid_txs(fork: Fork, check_hive: bool, expected_json
     assert fixture_name in fixture
     assert fixture_name in expected
     assert fixture[fixture_name] == expected[fixture_name]
+
+
+@pytest.mark.run_in_serial
+@pytest.mark.parametrize(
+    "blocks,expected_payloads",
+    [
+        ([Block(), Block(rlp="0xc0")], 1),
+        ([Block(rlp="0xc0")], 0),
+    ],
+    ids=["trailing_rlp_block", "only_rlp_blocks"],
+)
+def test_fill_blockchain_hive_rlp_blocks(blocks: List[Block], expected_payloads: int):
+    """
+    Test that the blocks with a hard-coded rlp are executed, but not sent as payloads, when
+    generating a `BlockchainEngineFixture`.
+    """
+    t8n = ExecutionSpecsTransitionTool()
+    generated_fixture = BlockchainTest(
+        pre={0xC0DE: Account(code=Op.STOP)},
+        post={},
+        blocks=blocks,
+    ).generate(
+        request=None,  # type: ignore
+        t8n=t8n,
+        fork=Shanghai,
+        fixture_format=BlockchainEngineFixture,
+    )
+    assert isinstance(generated_fixture, EngineFixture)
+    assert len(generated_fixture.payloads) == expected_payloads
+    # The last block is executed, so the chain head moves past the last payload.
+    assert generated_fixture.last_block_hash != generated_fixture.genesis.block_hash
+    if expected_payloads > 0:
+        last_payload = generated_fixture.payloads[-1].params[0]
+        assert generated_fixture.last_block_hash != last_payload.block_hash
@@ -2,7 +2,7 @@
 Code related utilities and classes.
 """
 from .generators import CalldataCase, Case, CodeGasMeasure, Conditional, Initcode, Switch
-from .yul import Solc, Yul, YulCompiler
+from .yul import Solc, Yul, YulCompilationCache, YulCompiler, compile_yul_sources
 
 __all__ = (
     "Case",
@@ -13,5 +13,7 @@ __all__ = (
     "Solc",
     "Switch",
     "Yul",
+    "YulCompilationCache",
     "YulCompiler",
+    "compile_yul_sources",
 )
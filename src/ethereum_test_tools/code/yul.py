@@ -2,13 +2,19 @@
 Yul frontend
 """
 
+import os
 import re
+import threading
 import warnings
-from functools import cached_property
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from hashlib import sha256
 from pathlib import Path
 from shutil import which
 from subprocess import CompletedProcess, run
-from typing import Optional, Type
+from typing import Dict, List, Optional, Sequence, Tuple, Type
 
 from semver import Version
 
@@ -17,6 +23,7 @@ from ethereum_test_vm import Bytecode
 
 DEFAULT_SOLC_ARGS = ("--assemble", "-")
 VERSION_PATTERN = re.compile(r"Version: (.*)")
+UNKNOWN_SOLC_VERSION = Version(0)
 
 
 class Solc:
@@ -58,7 +65,181 @@ class Solc:
                 solc_version_string = match.group(1).replace("g++", "gpp")
                 return Version.parse(solc_version_string)
         warnings.warn("Unable to determine solc version.")
-        return Version(0)
+        return UNKNOWN_SOLC_VERSION
+
+
+@lru_cache(maxsize=None)
+def get_solc(binary: Optional[Path | str] = None) -> Solc:
+    """
+    Return the `Solc` instance of the given binary, which is only looked up and queried for its
+    version once.
+    """
+    return Solc(binary)
+
+
+CACHE_FILE_SUFFIX = ".hex"
+
+
+@dataclass(kw_only=True)
+class YulCompilationCache:
+    """
+    Cache of the bytecode compiled from Yul sources, keyed by the hash of the solc version, the
+    EVM version and the source.
+
+    The most recently used entries are kept in memory. If a directory is given, every entry is
+    also written to it, atomically, so it can be shared between xdist workers and between fill
+    sessions.
+    """
+
+    directory: Path | None = None
+    max_entries: int = 4096
+    hits: int = 0
+    misses: int = 0
+    _entries: "OrderedDict[str, bytes]" = field(default_factory=OrderedDict, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self):
+        """
+        Create the cache directory if it doesn't exist.
+        """
+        if self.directory is not None:
+            self.directory = Path(self.directory)
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(*, solc_version: Version, evm_version: str | None, source: str) -> str:
+        """
+        Return the cache key of a Yul compilation.
+        """
+        hasher = sha256()
+        for part in (str(solc_version), evm_version or ""):
+            hasher.update(part.encode())
+            hasher.update(b"\x00")
+        hasher.update(source.encode())
+        return hasher.hexdigest()
+
+    def path(self, key: str) -> Path:
+        """
+        Return the path of the cache entry for the given key.
+        """
+        assert self.directory is not None
+        return self.directory / key[:2] / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the cached bytecode for the given key, or None if it's not in the cache.
+        """
+        with self._lock:
+            bytecode = self._entries.get(key)
+            if bytecode is not None:
+                self._entries.move_to_end(key)
+        if bytecode is None and self.directory is not None:
+            try:
+                bytecode = bytes.fromhex(self.path(key).read_text())
+            except (FileNotFoundError, ValueError):
+                pass
+            else:
+                self._remember(key, bytecode)
+        with self._lock:
+            if bytecode is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return bytecode
+
+    def put(self, key: str, bytecode: bytes) -> None:
+        """
+        Store the bytecode compiled from a Yul source in the cache.
+        """
+        self._remember(key, bytecode)
+        if self.directory is not None:
+            path = self.path(key)
+            path.parent.mkdir(exist_ok=True)
+            temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            temp_path.write_text(bytecode.hex())
+            os.replace(temp_path, path)
+
+    def _remember(self, key: str, bytecode: bytes) -> None:
+        """
+        Keep an entry in memory, evicting the least recently used one if the cache is full.
+        """
+        with self._lock:
+            self._entries[key] = bytecode
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the hit and miss counters of the cache.
+        """
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def compile_yul(
+    source: str,
+    evm_version: str | None = None,
+    binary: Optional[Path | str] = None,
+    cache: YulCompilationCache | None = None,
+) -> bytes:
+    """
+    Compile Yul source code into bytecode, or return it from the cache if it was already
+    compiled by the same solc version for the same EVM version.
+
+    Nothing is cached if the version of solc is unknown, since the compilations of different
+    binaries couldn't be told apart.
+    """
+    solc = get_solc(binary)
+    if cache is None:
+        cache = Yul.compilation_cache
+    key: str | None = None
+    if solc.version != UNKNOWN_SOLC_VERSION:
+        key = cache.key(solc_version=solc.version, evm_version=evm_version, source=source)
+        bytecode = cache.get(key)
+        if bytecode is not None:
+            return bytecode
+
+    solc_args = ("--evm-version", evm_version) if evm_version else ()
+
+    result = solc.run(*solc_args, *DEFAULT_SOLC_ARGS, input=source)
+
+    if result.returncode:
+        stderr_lines = result.stderr.splitlines()
+        stderr_message = "\n".join(line.strip() for line in stderr_lines)
+        raise Exception(f"failed to compile yul source:\n{stderr_message[7:]}")
+
+    lines = result.stdout.splitlines()
+
+    hex_str = lines[lines.index("Binary representation:") + 1]
+
+    bytecode = bytes.fromhex(hex_str)
+    if key is not None:
+        cache.put(key, bytecode)
+    return bytecode
+
+
+def compile_yul_sources(
+    sources: Sequence[Tuple[str, str | None]],
+    binary: Optional[Path | str] = None,
+    max_workers: int | None = None,
+) -> List[bytes | Exception]:
+    """
+    Compile a batch of (source, EVM version) pairs in parallel, to fill the compilation cache.
+
+    Returns the bytecode of each source, or the exception raised when compiling it.
+    """
+    # Resolve the binary and its version before starting the threads.
+    get_solc(binary).version
+
+    def compile_source(source_and_evm_version: Tuple[str, str | None]) -> bytes | Exception:
+        source, evm_version = source_and_evm_version
+        try:
+            return compile_yul(source, evm_version, binary)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(compile_source, sources))
 
 
 class Yul(Bytecode):
@@ -70,6 +251,11 @@ class Yul(Bytecode):
     source: str
     evm_version: str | None
 
+    compilation_cache: YulCompilationCache = YulCompilationCache()
+    """
+    Cache of the compiled Yul sources, which can be replaced with one backed by a directory.
+    """
+
     def __new__(
         cls,
         source: str,
@@ -79,23 +265,8 @@ class Yul(Bytecode):
         """
         Compile Yul source code into bytecode.
         """
-        solc = Solc(binary)
         evm_version = fork.solc_name() if fork else None
-
-        solc_args = ("--evm-version", evm_version) if evm_version else ()
-
-        result = solc.run(*solc_args, *DEFAULT_SOLC_ARGS, input=source)
-
-        if result.returncode:
-            stderr_lines = result.stderr.splitlines()
-            stderr_message = "\n".join(line.strip() for line in stderr_lines)
-            raise Exception(f"failed to compile yul source:\n{stderr_message[7:]}")
-
-        lines = result.stdout.splitlines()
-
-        hex_str = lines[lines.index("Binary representation:") + 1]
-
-        bytecode = bytes.fromhex(hex_str)
+        bytecode = compile_yul(source, evm_version, binary)
         instance = super().__new__(
             cls,
             bytecode,
@@ -0,0 +1,132 @@
+"""
+Test the cache of the bytecode compiled from Yul sources.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from ethereum_test_forks import Cancun, Shanghai
+
+from ..code import Yul, YulCompilationCache, compile_yul_sources
+
+FAKE_SOLC = f"""#!{sys.executable}
+import sys
+from pathlib import Path
+
+if "--version" in sys.argv:
+    print("Version: 0.8.24+commit.e11b9ed9.Linux.g++")
+    sys.exit(0)
+source = sys.stdin.read()
+with open(Path(sys.argv[0]).parent / "invocations", "a") as f:
+    f.write(source + "\\n")
+if "error" in source:
+    print("Error: invalid source", file=sys.stderr)
+    sys.exit(1)
+print("Binary representation:")
+print(len(source).to_bytes(2, "big").hex() + "00")
+"""
+
+
+@pytest.fixture
+def solc(tmp_path: Path) -> Path:
+    """
+    Return the path of a fake `solc` that records the sources it compiles.
+    """
+    binary = tmp_path / "solc"
+    binary.write_text(FAKE_SOLC)
+    binary.chmod(0o755)
+    return binary
+
+
+@pytest.fixture(autouse=True)
+def compilation_cache(monkeypatch: pytest.MonkeyPatch) -> YulCompilationCache:
+    """
+    Replace the cache of the compiled Yul sources with an empty one.
+    """
+    cache = YulCompilationCache()
+    monkeypatch.setattr(Yul, "compilation_cache", cache)
+    return cache
+
+
+def invocations(solc: Path) -> int:
+    """
+    Return the number of sources compiled by the fake `solc`.
+    """
+    path = solc.parent / "invocations"
+    return len(path.read_text().splitlines()) if path.exists() else 0
+
+
+def test_compilation_cache(solc: Path, compilation_cache: YulCompilationCache):
+    """
+    Test that a source is only compiled once per EVM version.
+    """
+    assert bytes(Yul("{ }", fork=Cancun, binary=solc)) == bytes.fromhex("000300")
+    assert bytes(Yul("{ }", fork=Cancun, binary=solc)) == bytes.fromhex("000300")
+    assert invocations(solc) == 1
+    Yul("{ }", fork=Shanghai, binary=solc)
+    Yul("{ sstore(0, 1) }", fork=Cancun, binary=solc)
+    assert invocations(solc) == 3
+    assert compilation_cache.stats() == {"hits": 1, "misses": 3}
+
+
+def test_compilation_cache_directory(solc: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that the compiled sources are shared through the cache directory.
+    """
+    monkeypatch.setattr(
+        Yul, "compilation_cache", YulCompilationCache(directory=tmp_path / "cache")
+    )
+    Yul("{ }", fork=Cancun, binary=solc)
+    monkeypatch.setattr(
+        Yul, "compilation_cache", YulCompilationCache(directory=tmp_path / "cache")
+    )
+    assert bytes(Yul("{ }", fork=Cancun, binary=solc)) == bytes.fromhex("000300")
+    assert invocations(solc) == 1
+    assert Yul.compilation_cache.stats() == {"hits": 1, "misses": 0}
+
+
+def test_compilation_cache_eviction():
+    """
+    Test that the least recently used entries are evicted from memory.
+    """
+    cache = YulCompilationCache(max_entries=2)
+    cache.put("a", b"\x01")
+    cache.put("b", b"\x02")
+    assert cache.get("a") == b"\x01"
+    cache.put("c", b"\x03")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"\x01"
+    assert cache.get("c") == b"\x03"
+
+
+def test_compile_yul_sources(solc: Path):
+    """
+    Test that a batch of sources is compiled into the cache, and that errors are returned.
+    """
+    sources = [("{ }", "cancun"), ("{ error }", "cancun"), ("{ }", "shanghai")]
+    results = compile_yul_sources(sources, binary=solc, max_workers=2)
+    assert results[0] == results[2] == bytes.fromhex("000300")
+    assert isinstance(results[1], Exception)
+    assert invocations(solc) == 3
+
+    Yul("{ }", fork=Cancun, binary=solc)
+    assert invocations(solc) == 3
+
+
+def test_compilation_cache_unknown_solc_version(
+    solc: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test that nothing is cached when the version of solc is unknown.
+    """
+    solc.write_text(FAKE_SOLC.replace("Version: 0.8.24+commit.e11b9ed9.Linux.g++", "unknown"))
+    cache = YulCompilationCache(directory=tmp_path / "cache")
+    monkeypatch.setattr(Yul, "compilation_cache", cache)
+    with pytest.warns(UserWarning, match="Unable to determine solc version"):
+        Yul("{ }", fork=Cancun, binary=solc)
+    Yul("{ }", fork=Cancun, binary=solc)
+    assert invocations(solc) == 2
+    assert cache.stats() == {"hits": 0, "misses": 0}
+    assert not any(path.is_file() for path in (tmp_path / "cache").rglob("*"))
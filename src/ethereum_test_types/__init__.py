@@ -30,7 +30,10 @@ from .types import (
     TransactionDefaults,
     Withdrawal,
     WithdrawalRequest,
+    fork_pre_allocation,
+    fork_pre_allocation_blockchain,
     keccak256,
+    signature_cache_stats,
 )
 from .verkle import VerkleTree, Witness, WitnessCheck
 
@@ -71,6 +74,9 @@ __all__ = (
     "copy_opcode_cost",
     "cost_memory_bytes",
     "eip_2028_transaction_data_cost",
+    "fork_pre_allocation",
+    "fork_pre_allocation_blockchain",
     "keccak256",
+    "signature_cache_stats",
     "to_json",
 )
@@ -5,7 +5,7 @@ EVM Object Format Version 1 Library to generate bytecode for testing purposes
 from dataclasses import dataclass
 from enum import Enum, IntEnum, auto
 from functools import cached_property
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
 from pydantic import Field, GetCoreSchemaHandler
 from pydantic_core.core_schema import (
@@ -32,6 +32,7 @@ from .constants import (
     TYPES_STACK_BYTE_LENGTH,
     VERSION_NUMBER_BYTES,
 )
+from .validation import compute_code_stack_values
 
 VERSION_MAX_SECTION_KIND = 3
 
@@ -220,13 +221,13 @@ class Section(CopyValidateModel):
                 auto_code_outputs,
                 auto_max_height,
             ) = compute_code_stack_values(self.data)
-            if self.auto_max_stack_height:
-                max_stack_height = auto_max_height
             if self.auto_code_inputs_outputs:
                 code_inputs, code_outputs = (
                     auto_code_inputs,
                     auto_code_outputs,
                 )
+            if self.auto_max_stack_height:
+                max_stack_height = auto_max_height - auto_code_inputs + code_inputs
 
         return (
             code_inputs.to_bytes(length=TYPES_INPUTS_BYTE_LENGTH, byteorder="big")
@@ -584,37 +585,3 @@ def count_sections(sections: List[Section], kind: SectionKind | int) -> int:
 
 
 OPCODE_MAP: Dict[int, Op] = {x.int(): x for x in Op}
-
-
-def compute_code_stack_values(code: bytes) -> Tuple[int, int, int]:
-    """
-    Computes the stack values for the given bytecode.
-
-    TODO: THIS DOES NOT WORK WHEN THE RJUMP* JUMPS BACKWARDS (and many other
-    things).
-    """
-    i = 0
-    stack_height = 0
-    min_stack_height = 0
-    max_stack_height = 0
-
-    # compute type annotation
-    while i < len(code):
-        op = OPCODE_MAP.get(code[i])
-        if op is None:
-            return (0, 0, 0)
-        elif op == Op.RJUMPV:
-            i += 1
-            if i < len(code):
-                count = code[i]
-                i += count * 2
-        else:
-            i += 1 + op.data_portion_length
-
-        stack_height -= op.popped_stack_items
-        min_stack_height = min(stack_height, min_stack_height)
-        stack_height += op.pushed_stack_items
-        max_stack_height = max(stack_height, max_stack_height)
-    if stack_height < 0:
-        stack_height = 0
-    return (abs(min_stack_height), stack_height, max_stack_height)
@@ -10,6 +10,10 @@ VERSION_NUMBER_BYTES = VERSION_NUMBER.to_bytes(VERSION_BYTE_LENGTH, "big")
 
 MAX_CODE_SECTIONS = 1024
 
+MAX_CONTAINER_SECTIONS = 256
+
+MAX_STACK_SIZE = 1024
+
 MAX_RETURN_STACK_HEIGHT = 1024
 
 MAX_OPERAND_STACK_HEIGHT = 1023
@@ -0,0 +1,613 @@
+"""
+EVM Object Format Version 1 container validation.
+
+Structural and code validation of EOF V1 containers, following the order of the checks of
+`evmone-eofparse` so that the first error found is the same one that evmone reports, which
+allows the validation of the containers of the tests without running a subprocess.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Tuple
+
+from ethereum_test_exceptions import EOFException
+from ethereum_test_vm import Opcodes as Op
+
+from ..constants import EOF_HEADER_TERMINATOR, EOF_MAGIC
+from .constants import (
+    MAX_CODE_INPUTS,
+    MAX_CODE_OUTPUTS,
+    MAX_CODE_SECTIONS,
+    MAX_CONTAINER_SECTIONS,
+    MAX_INITCODE_SIZE,
+    MAX_OPERAND_STACK_HEIGHT,
+    MAX_STACK_SIZE,
+    NON_RETURNING_SECTION,
+    VERSION_NUMBER,
+)
+
+LEGACY_ONLY_OPCODES: FrozenSet[Op] = frozenset(
+    {
+        Op.CODESIZE,
+        Op.SELFDESTRUCT,
+        Op.CREATE2,
+        Op.CODECOPY,
+        Op.EXTCODESIZE,
+        Op.EXTCODECOPY,
+        Op.EXTCODEHASH,
+        Op.JUMP,
+        Op.JUMPI,
+        Op.PC,
+        Op.GAS,
+        Op.CREATE,
+        Op.CALL,
+        Op.CALLCODE,
+        Op.DELEGATECALL,
+        Op.STATICCALL,
+    }
+)
+"""
+Opcodes that are defined in legacy code but are undefined in EOF code.
+"""
+
+# Values of the opcodes that are validated individually.
+CALLF = Op.CALLF.int()
+DATALOADN = Op.DATALOADN.int()
+DUPN = Op.DUPN.int()
+EOFCREATE = Op.EOFCREATE.int()
+EXCHANGE = Op.EXCHANGE.int()
+JUMPF = Op.JUMPF.int()
+RETF = Op.RETF.int()
+RETURN = Op.RETURN.int()
+RETURNCONTRACT = Op.RETURNCONTRACT.int()
+RJUMP = Op.RJUMP.int()
+RJUMPI = Op.RJUMPI.int()
+RJUMPV = Op.RJUMPV.int()
+STOP = Op.STOP.int()
+SWAPN = Op.SWAPN.int()
+
+EOF_OPCODES: Dict[int, Op] = {
+    op.int(): op for op in Op if op not in LEGACY_ONLY_OPCODES and op != Op.RJUMPV
+}
+"""
+Map of the opcodes that are valid in EOF code, except `RJUMPV`, whose immediate size is
+variable.
+"""
+
+IMMEDIATE_SIZES: Dict[int, int] = {
+    **{opcode: op.data_portion_length for opcode, op in EOF_OPCODES.items()},
+    EXCHANGE: 1,
+    RJUMPV: 1,
+}
+"""
+Size of the immediate argument of each EOF opcode. For `RJUMPV` it's the size of the jump
+table length, which is followed by the jump table.
+"""
+
+TERMINATING_OPCODES: FrozenSet[int] = frozenset(
+    op.int() for op in EOF_OPCODES.values() if op.terminating
+)
+
+STACK_EFFECTS: Dict[int, Tuple[int, int]] = {
+    opcode: (op.min_stack_height, op.pushed_stack_items - op.popped_stack_items)
+    for opcode, op in EOF_OPCODES.items()
+}
+"""
+Number of stack items required by each EOF opcode, and the change of the stack height after
+executing it, except for the opcodes whose effect depends on their immediates.
+"""
+
+TYPE_ENTRY_SIZE = 4
+
+SECTION_KIND_TYPE = 1
+SECTION_KIND_CODE = 2
+SECTION_KIND_CONTAINER = 3
+SECTION_KIND_DATA = 4
+
+NEXT_SECTION_KIND: Dict[int, int] = {
+    SECTION_KIND_TYPE: SECTION_KIND_CODE,
+    SECTION_KIND_CODE: SECTION_KIND_CONTAINER,
+    SECTION_KIND_CONTAINER: SECTION_KIND_DATA,
+    SECTION_KIND_DATA: EOF_HEADER_TERMINATOR[0],
+}
+"""
+Kind of the section header expected after each kind of section header.
+"""
+
+MISSING_SECTION_ERRORS: Dict[int, EOFException] = {
+    SECTION_KIND_TYPE: EOFException.MISSING_TYPE_HEADER,
+    SECTION_KIND_CODE: EOFException.MISSING_CODE_HEADER,
+    SECTION_KIND_DATA: EOFException.MISSING_DATA_SECTION,
+    EOF_HEADER_TERMINATOR[0]: EOFException.MISSING_TERMINATOR,
+}
+"""
+Error raised when the section header of each kind is missing.
+"""
+
+
+class ContainerValidationError(Exception):
+    """
+    Raised when an EOF container is invalid.
+    """
+
+    exception: EOFException
+
+    def __init__(self, exception: EOFException):
+        super().__init__(exception)
+        self.exception = exception
+
+
+@dataclass(kw_only=True)
+class CodeType:
+    """
+    Entry of the type section of a container.
+    """
+
+    inputs: int
+    outputs: int
+    max_stack_height: int
+
+
+@dataclass(kw_only=True)
+class ContainerHeader:
+    """
+    Parsed header of an EOF V1 container, with the offsets of the sections in the container.
+    """
+
+    types: List[CodeType] = field(default_factory=list)
+    code_offsets: List[int] = field(default_factory=list)
+    code_sizes: List[int] = field(default_factory=list)
+    container_offsets: List[int] = field(default_factory=list)
+    container_sizes: List[int] = field(default_factory=list)
+    data_offset: int = 0
+    data_size: int = 0
+
+
+def read_uint16(data: bytes, offset: int) -> int:
+    """
+    Read a big-endian unsigned 16-bit integer.
+    """
+    return int.from_bytes(data[offset : offset + 2], "big")
+
+
+def read_int16(data: bytes, offset: int) -> int:
+    """
+    Read a big-endian signed 16-bit integer.
+    """
+    return int.from_bytes(data[offset : offset + 2], "big", signed=True)
+
+
+def parse_header(container: bytes) -> ContainerHeader:
+    """
+    Parse and validate the header of an EOF V1 container, and read its type section.
+    """
+    if len(container) > MAX_INITCODE_SIZE:
+        raise ContainerValidationError(EOFException.CONTAINER_SIZE_ABOVE_LIMIT)
+    if len(container) < len(EOF_MAGIC) or not container.startswith(EOF_MAGIC):
+        raise ContainerValidationError(EOFException.INVALID_MAGIC)
+    if len(container) <= len(EOF_MAGIC) or container[len(EOF_MAGIC)] != VERSION_NUMBER:
+        raise ContainerValidationError(EOFException.INVALID_VERSION)
+
+    section_sizes: Dict[int, List[int]] = {
+        SECTION_KIND_TYPE: [],
+        SECTION_KIND_CODE: [],
+        SECTION_KIND_CONTAINER: [],
+        SECTION_KIND_DATA: [],
+    }
+    expected_kind = SECTION_KIND_TYPE
+    position = len(EOF_MAGIC) + 1
+    terminated = False
+    while position < len(container):
+        kind = container[position]
+        position += 1
+        # The container section is optional.
+        if kind != expected_kind and expected_kind == SECTION_KIND_CONTAINER:
+            expected_kind = SECTION_KIND_DATA
+        if kind == EOF_HEADER_TERMINATOR[0]:
+            for required_kind in (SECTION_KIND_TYPE, SECTION_KIND_CODE, SECTION_KIND_DATA):
+                if not section_sizes[required_kind]:
+                    raise ContainerValidationError(MISSING_SECTION_ERRORS[required_kind])
+            terminated = True
+            break
+        if kind != expected_kind:
+            raise ContainerValidationError(MISSING_SECTION_ERRORS[expected_kind])
+
+        section_count = 1
+        if kind in (SECTION_KIND_CODE, SECTION_KIND_CONTAINER):
+            if position + 2 > len(container):
+                raise ContainerValidationError(EOFException.INCOMPLETE_SECTION_NUMBER)
+            section_count = read_uint16(container, position)
+            position += 2
+            if section_count == 0:
+                raise ContainerValidationError(EOFException.ZERO_SECTION_SIZE)
+            if kind == SECTION_KIND_CODE and section_count > MAX_CODE_SECTIONS:
+                raise ContainerValidationError(EOFException.TOO_MANY_CODE_SECTIONS)
+            if kind == SECTION_KIND_CONTAINER and section_count > MAX_CONTAINER_SECTIONS:
+                raise ContainerValidationError(EOFException.TOO_MANY_CONTAINERS)
+        expected_kind = NEXT_SECTION_KIND[kind]
+
+        if position == len(container):
+            break
+        for _ in range(section_count):
+            if position + 2 > len(container):
+                raise ContainerValidationError(EOFException.INCOMPLETE_SECTION_SIZE)
+            section_size = read_uint16(container, position)
+            position += 2
+            if section_size == 0 and kind != SECTION_KIND_DATA:
+                raise ContainerValidationError(EOFException.ZERO_SECTION_SIZE)
+            section_sizes[kind].append(section_size)
+
+    if not terminated:
+        raise ContainerValidationError(EOFException.MISSING_HEADERS_TERMINATOR)
+
+    data_size = section_sizes[SECTION_KIND_DATA][0]
+    bodies_size_without_data = sum(sum(sizes) for sizes in section_sizes.values()) - data_size
+    # Only the data section can be truncated, which is checked after the types validation.
+    if len(container) - position < bodies_size_without_data:
+        raise ContainerValidationError(EOFException.INVALID_SECTION_BODIES_SIZE)
+
+    type_section_size = section_sizes[SECTION_KIND_TYPE][0]
+    if type_section_size != len(section_sizes[SECTION_KIND_CODE]) * TYPE_ENTRY_SIZE:
+        raise ContainerValidationError(EOFException.INVALID_TYPE_SECTION_SIZE)
+
+    header = ContainerHeader(data_size=data_size)
+    for type_offset in range(position, position + type_section_size, TYPE_ENTRY_SIZE):
+        header.types.append(
+            CodeType(
+                inputs=container[type_offset],
+                outputs=container[type_offset + 1],
+                max_stack_height=read_uint16(container, type_offset + 2),
+            )
+        )
+    offset = position + type_section_size
+    for code_size in section_sizes[SECTION_KIND_CODE]:
+        header.code_offsets.append(offset)
+        header.code_sizes.append(code_size)
+        offset += code_size
+    for container_size in section_sizes[SECTION_KIND_CONTAINER]:
+        header.container_offsets.append(offset)
+        header.container_sizes.append(container_size)
+        offset += container_size
+    header.data_offset = offset
+    return header
+
+
+def validate_types(header: ContainerHeader) -> None:
+    """
+    Validate the entries of the type section.
+    """
+    for index, code_type in enumerate(header.types):
+        if index == 0 and (code_type.inputs != 0 or code_type.outputs != NON_RETURNING_SECTION):
+            raise ContainerValidationError(EOFException.INVALID_FIRST_SECTION_TYPE)
+        if code_type.inputs > MAX_CODE_INPUTS or (
+            code_type.outputs > MAX_CODE_OUTPUTS and code_type.outputs != NON_RETURNING_SECTION
+        ):
+            raise ContainerValidationError(EOFException.INPUTS_OUTPUTS_NUM_ABOVE_LIMIT)
+        if code_type.max_stack_height > MAX_OPERAND_STACK_HEIGHT:
+            raise ContainerValidationError(EOFException.MAX_STACK_HEIGHT_ABOVE_LIMIT)
+
+
+def instruction_size(code: bytes, position: int) -> int:
+    """
+    Return the size of the instruction at the given position, including its immediates.
+    """
+    opcode = code[position]
+    if opcode == RJUMPV:
+        return 2 + (code[position + 1] + 1) * 2
+    return 1 + IMMEDIATE_SIZES.get(opcode, 0)
+
+
+def validate_instructions(
+    code: bytes,
+    *,
+    code_index: int,
+    header: ContainerHeader,
+    kind_is_initcode: bool,
+) -> Tuple[List[Tuple[int, int]], List[int]]:
+    """
+    Validate the instructions of a code section and return the subcontainers it references,
+    with the referencing opcode, and the other code sections it calls or jumps to.
+    """
+    subcontainer_references: List[Tuple[int, int]] = []
+    accessed_code_sections: List[int] = []
+    is_returning = False
+    position = 0
+    while position < len(code):
+        opcode = code[position]
+        if opcode not in IMMEDIATE_SIZES:
+            raise ContainerValidationError(EOFException.UNDEFINED_INSTRUCTION)
+        if position + IMMEDIATE_SIZES[opcode] >= len(code):
+            raise ContainerValidationError(EOFException.TRUNCATED_INSTRUCTION)
+        size = instruction_size(code, position)
+        if position + size > len(code):
+            raise ContainerValidationError(EOFException.TRUNCATED_INSTRUCTION)
+
+        if opcode in (CALLF, JUMPF):
+            target_index = read_uint16(code, position + 1)
+            if target_index >= len(header.types):
+                raise ContainerValidationError(EOFException.INVALID_CODE_SECTION_INDEX)
+            target_returning = header.types[target_index].outputs != NON_RETURNING_SECTION
+            if opcode == CALLF and not target_returning:
+                raise ContainerValidationError(EOFException.CALLF_TO_NON_RETURNING)
+            if opcode == JUMPF and target_returning:
+                # Jumping to a returning section makes the current section returning.
+                is_returning = True
+            if target_index != code_index:
+                accessed_code_sections.append(target_index)
+        elif opcode == RETF:
+            is_returning = True
+        elif opcode == DATALOADN:
+            if read_uint16(code, position + 1) + 32 > header.data_size:
+                raise ContainerValidationError(EOFException.INVALID_DATALOADN_INDEX)
+        elif opcode in (EOFCREATE, RETURNCONTRACT):
+            container_index = code[position + 1]
+            if container_index >= len(header.container_sizes):
+                raise ContainerValidationError(EOFException.INVALID_CONTAINER_SECTION_INDEX)
+            if opcode == RETURNCONTRACT and not kind_is_initcode:
+                raise ContainerValidationError(EOFException.INCOMPATIBLE_CONTAINER_KIND)
+            subcontainer_references.append((container_index, opcode))
+        elif opcode in (RETURN, STOP):
+            if kind_is_initcode:
+                raise ContainerValidationError(EOFException.INCOMPATIBLE_CONTAINER_KIND)
+        position += size
+
+    if is_returning != (header.types[code_index].outputs != NON_RETURNING_SECTION):
+        raise ContainerValidationError(EOFException.INVALID_NON_RETURNING_FLAG)
+    return subcontainer_references, accessed_code_sections
+
+
+def jump_targets(code: bytes, position: int) -> List[int]:
+    """
+    Return the targets of the relative jump instruction at the given position.
+    """
+    opcode = code[position]
+    next_position = position + instruction_size(code, position)
+    if opcode in (RJUMP, RJUMPI):
+        return [next_position + read_int16(code, position + 1)]
+    if opcode == RJUMPV:
+        return [
+            next_position + read_int16(code, position + 2 + 2 * entry)
+            for entry in range(code[position + 1] + 1)
+        ]
+    return []
+
+
+def validate_rjump_destinations(code: bytes) -> None:
+    """
+    Validate that all relative jumps target the start of an instruction in the code section.
+    """
+    instruction_starts = set()
+    targets = set()
+    position = 0
+    while position < len(code):
+        instruction_starts.add(position)
+        for target in jump_targets(code, position):
+            if not 0 <= target < len(code):
+                raise ContainerValidationError(EOFException.INVALID_RJUMP_DESTINATION)
+            targets.add(target)
+        position += instruction_size(code, position)
+    if not targets <= instruction_starts:
+        raise ContainerValidationError(EOFException.INVALID_RJUMP_DESTINATION)
+
+
+def stack_effect(code: bytes, position: int, types: List[CodeType] | None) -> Tuple[int, int]:
+    """
+    Return the number of stack items required by the instruction at the given position, and
+    the change of the stack height after executing it.
+
+    If the types of the code sections are not known, `CALLF` and `JUMPF` are assumed to have
+    no effect on the stack.
+    """
+    opcode = code[position]
+    if opcode == DUPN:
+        return code[position + 1] + 1, 1
+    if opcode == SWAPN:
+        return code[position + 1] + 2, 0
+    if opcode == EXCHANGE:
+        return (code[position + 1] >> 4) + (code[position + 1] & 0x0F) + 3, 0
+    if opcode == CALLF and types is not None:
+        target_type = types[read_uint16(code, position + 1)]
+        return target_type.inputs, target_type.outputs - target_type.inputs
+    if opcode == RJUMPV:
+        return 1, -1
+    return STACK_EFFECTS[opcode]
+
+
+def validate_stack(code: bytes, *, code_index: int, types: List[CodeType]) -> int:
+    """
+    Validate the stack heights of a code section, which can vary between a minimum and a
+    maximum at each instruction, and return the maximum stack height of the section.
+    """
+    code_type = types[code_index]
+    # Minimum and maximum stack height before each instruction, or None if not yet visited.
+    stack_heights: List[Tuple[int, int] | None] = [None] * len(code)
+    stack_heights[0] = (code_type.inputs, code_type.inputs)
+
+    def visit_successor(position: int, successor: int, heights: Tuple[int, int]) -> None:
+        successor_heights = stack_heights[successor]
+        if successor <= position:
+            # Backwards jumps must not change the stack heights of their target.
+            if successor_heights != heights:
+                raise ContainerValidationError(EOFException.STACK_HEIGHT_MISMATCH)
+        elif successor_heights is None:
+            stack_heights[successor] = heights
+        else:
+            stack_heights[successor] = (
+                min(heights[0], successor_heights[0]),
+                max(heights[1], successor_heights[1]),
+            )
+
+    position = 0
+    while position < len(code):
+        opcode = code[position]
+        heights = stack_heights[position]
+        if heights is None:
+            raise ContainerValidationError(EOFException.UNREACHABLE_INSTRUCTIONS)
+        required, change = stack_effect(code, position, types)
+
+        if opcode in (CALLF, JUMPF):
+            target_type = types[read_uint16(code, position + 1)]
+            if heights[1] + target_type.max_stack_height - target_type.inputs > MAX_STACK_SIZE:
+                raise ContainerValidationError(EOFException.STACK_OVERFLOW)
+            if opcode == JUMPF:
+                if target_type.outputs == NON_RETURNING_SECTION:
+                    required = target_type.inputs
+                else:
+                    if code_type.outputs < target_type.outputs:
+                        raise ContainerValidationError(
+                            EOFException.JUMPF_DESTINATION_INCOMPATIBLE_OUTPUTS
+                        )
+                    required = code_type.outputs + target_type.inputs - target_type.outputs
+                    if heights[1] > required:
+                        raise ContainerValidationError(EOFException.STACK_HIGHER_THAN_OUTPUTS)
+        elif opcode == RETF:
+            required = code_type.outputs
+            if heights[1] > required:
+                raise ContainerValidationError(EOFException.STACK_HIGHER_THAN_OUTPUTS)
+
+        if heights[0] < required:
+            raise ContainerValidationError(EOFException.STACK_UNDERFLOW)
+
+        next_heights = (heights[0] + change, heights[1] + change)
+        next_position = position + instruction_size(code, position)
+        if opcode not in TERMINATING_OPCODES and opcode != RJUMP:
+            if next_position >= len(code):
+                raise ContainerValidationError(EOFException.MISSING_STOP_OPCODE)
+            visit_successor(position, next_position, next_heights)
+        for target in jump_targets(code, position):
+            visit_successor(position, target, next_heights)
+        position = next_position
+
+    return max(heights[1] for heights in stack_heights if heights is not None)
+
+
+def compute_code_stack_values(code: bytes) -> Tuple[int, int, int]:
+    """
+    Compute the number of inputs, the number of outputs and the maximum stack height of a code
+    section, following all of its branches.
+
+    The number of outputs is `NON_RETURNING_SECTION` if the section never returns. `CALLF` and
+    `JUMPF` are assumed to have no effect on the stack, since the types of the other code
+    sections are unknown, and the computation stops at the first invalid instruction.
+    """
+    # Minimum and maximum stack height before each instruction, relative to the height at the
+    # start of the section, or None if not yet reached.
+    stack_heights: List[Tuple[int, int] | None] = [None] * len(code)
+    if code:
+        stack_heights[0] = (0, 0)
+    inputs = 0
+    max_stack_height = 0
+    output_stack_height: int | None = None
+    position = 0
+    while position < len(code):
+        opcode = code[position]
+        if opcode not in IMMEDIATE_SIZES or position + IMMEDIATE_SIZES[opcode] >= len(code):
+            break
+        next_position = position + instruction_size(code, position)
+        if next_position > len(code):
+            break
+        heights = stack_heights[position]
+        if heights is None:
+            position = next_position
+            continue
+        required, change = stack_effect(code, position, None)
+        inputs = max(inputs, required - heights[0])
+        max_stack_height = max(max_stack_height, heights[1] + change)
+        if opcode == RETF:
+            output_stack_height = heights[1]
+
+        successors = jump_targets(code, position)
+        if opcode not in TERMINATING_OPCODES and opcode != RJUMP:
+            successors.append(next_position)
+        for successor in successors:
+            # Backwards jumps don't change the stack heights of valid code.
+            if not position < successor < len(code):
+                continue
+            successor_heights = stack_heights[successor]
+            if successor_heights is None:
+                successor_heights = (heights[0] + change, heights[1] + change)
+            stack_heights[successor] = (
+                min(successor_heights[0], heights[0] + change),
+                max(successor_heights[1], heights[1] + change),
+            )
+        position = next_position
+
+    outputs = (
+        NON_RETURNING_SECTION if output_stack_height is None else output_stack_height + inputs
+    )
+    return inputs, outputs, max_stack_height + inputs
+
+
+def validate_container(container: bytes, *, initcode: bool = False) -> None:
+    """
+    Validate an EOF V1 container and all its subcontainers.
+
+    Raises `ContainerValidationError` with the first error found.
+    """
+    # Containers to validate, with whether they are initcode and whether they are top-level.
+    queue: List[Tuple[bytes, bool, bool]] = [(container, initcode, True)]
+    while queue:
+        container, initcode, top_level = queue.pop(0)
+        header = parse_header(container)
+        validate_types(header)
+        if len(container) > header.data_offset + header.data_size:
+            raise ContainerValidationError(EOFException.INVALID_SECTION_BODIES_SIZE)
+        if len(container) < header.data_offset + header.data_size:
+            if top_level:
+                raise ContainerValidationError(EOFException.TOPLEVEL_CONTAINER_TRUNCATED)
+            if initcode:
+                raise ContainerValidationError(EOFException.EOFCREATE_WITH_TRUNCATED_CONTAINER)
+
+        visited_code_sections = [False] * len(header.types)
+        code_sections_queue = [0]
+        referenced_by_eofcreate = [False] * len(header.container_sizes)
+        referenced_by_returncontract = [False] * len(header.container_sizes)
+        while code_sections_queue:
+            code_index = code_sections_queue.pop(0)
+            if visited_code_sections[code_index]:
+                continue
+            visited_code_sections[code_index] = True
+            code_offset = header.code_offsets[code_index]
+            code = container[code_offset : code_offset + header.code_sizes[code_index]]
+
+            subcontainer_references, accessed_code_sections = validate_instructions(
+                code, code_index=code_index, header=header, kind_is_initcode=initcode
+            )
+            for container_index, opcode in subcontainer_references:
+                if opcode == EOFCREATE:
+                    referenced_by_eofcreate[container_index] = True
+                else:
+                    referenced_by_returncontract[container_index] = True
+            code_sections_queue += accessed_code_sections
+
+            validate_rjump_destinations(code)
+            max_stack_height = validate_stack(code, code_index=code_index, types=header.types)
+            if max_stack_height != header.types[code_index].max_stack_height:
+                raise ContainerValidationError(EOFException.INVALID_MAX_STACK_HEIGHT)
+
+        if not all(visited_code_sections):
+            raise ContainerValidationError(EOFException.UNREACHABLE_CODE_SECTIONS)
+
+        for eofcreate, returncontract in zip(
+            referenced_by_eofcreate, referenced_by_returncontract
+        ):
+            if eofcreate and returncontract:
+                raise ContainerValidationError(EOFException.INCOMPATIBLE_CONTAINER_KIND)
+            if not eofcreate and not returncontract:
+                raise ContainerValidationError(EOFException.ORPHAN_SUBCONTAINER)
+
+        for container_offset, container_size, eofcreate in zip(
+            header.container_offsets, header.container_sizes, referenced_by_eofcreate
+        ):
+            subcontainer = container[container_offset : container_offset + container_size]
+            queue.append((subcontainer, eofcreate, False))
+
+
+def container_validity_error(container: bytes, *, initcode: bool = False) -> EOFException | None:
+    """
+    Return the first error found in an EOF V1 container, or None if the container is valid.
+    """
+    try:
+        validate_container(container, initcode=initcode)
+    except ContainerValidationError as e:
+        return e.exception
+    return None
@@ -0,0 +1,179 @@
+"""
+Test suite for `code.eof.v1.validation` module.
+"""
+
+import pytest
+
+from ethereum_test_exceptions import EOFException
+from ethereum_test_vm import Opcodes as Op
+
+from ..eof.v1 import Container, ContainerKind, Section
+from ..eof.v1.constants import NON_RETURNING_SECTION
+from ..eof.v1.validation import compute_code_stack_values, container_validity_error
+
+
+@pytest.mark.parametrize(
+    "container,expected_error",
+    [
+        pytest.param(Container.Code(Op.STOP), None, id="stop"),
+        pytest.param(
+            Container(
+                sections=[
+                    Section.Code(Op.CALLF[1] + Op.STOP, max_stack_height=1),
+                    Section.Code(Op.PUSH0 + Op.RETF, code_outputs=1, max_stack_height=1),
+                ],
+            ),
+            None,
+            id="callf",
+        ),
+        pytest.param(
+            Container.Code(Op.PUSH0 + Op.RJUMPI[-4] + Op.STOP, max_stack_height=1),
+            None,
+            id="rjumpi_backwards",
+        ),
+        pytest.param(
+            Container.Code(Op.PUSH0 + Op.RJUMPI[1] + Op.PUSH0 + Op.STOP, max_stack_height=1),
+            None,
+            id="variable_stack_height",
+        ),
+        pytest.param(
+            Container(
+                sections=[
+                    Section.Code(Op.PUSH0 * 4 + Op.EOFCREATE[0] + Op.STOP, max_stack_height=4),
+                    Section.Container(
+                        Container(
+                            sections=[
+                                Section.Code(Op.RETURNCONTRACT[0](0, 0), max_stack_height=2),
+                                Section.Container(Container.Code(Op.INVALID)),
+                            ],
+                        )
+                    ),
+                ],
+            ),
+            None,
+            id="eofcreate",
+        ),
+        pytest.param(b"\xef\x01", EOFException.INVALID_MAGIC, id="invalid_magic"),
+        pytest.param(
+            Container.Code(Op.PUSH0 + Op.STOP, max_stack_height=2),
+            EOFException.INVALID_MAX_STACK_HEIGHT,
+            id="invalid_max_stack_height",
+        ),
+        pytest.param(
+            Container.Code(Op.PUSH0 + Op.RJUMPI[-5] + Op.STOP, max_stack_height=1),
+            EOFException.INVALID_RJUMP_DESTINATION,
+            id="invalid_rjump_destination",
+        ),
+        pytest.param(
+            Container.Code(Op.PUSH0 + Op.RJUMP[-4], max_stack_height=1),
+            EOFException.STACK_HEIGHT_MISMATCH,
+            id="stack_height_mismatch",
+        ),
+        pytest.param(
+            Container.Code(Op.STOP + Op.STOP),
+            EOFException.UNREACHABLE_INSTRUCTIONS,
+            id="unreachable_instructions",
+        ),
+        pytest.param(
+            Container(
+                sections=[
+                    Section.Code(Op.CALLF[1] + Op.STOP),
+                    Section.Code(Op.STOP),
+                ],
+            ),
+            EOFException.CALLF_TO_NON_RETURNING,
+            id="callf_to_non_returning",
+        ),
+        pytest.param(
+            Container(
+                sections=[
+                    Section.Code(Op.STOP),
+                    Section.Container(Container.Code(Op.INVALID)),
+                ],
+            ),
+            EOFException.ORPHAN_SUBCONTAINER,
+            id="orphan_subcontainer",
+        ),
+    ],
+)
+def test_container_validity_error(container: Container | bytes, expected_error: EOFException):
+    """
+    Test the validation of containers.
+    """
+    assert container_validity_error(bytes(container)) == expected_error
+
+
+def test_container_validity_error_initcode():
+    """
+    Test that the kind of the container determines the terminating instructions it can use.
+    """
+    runtime_container = Container.Code(Op.INVALID)
+    initcode = Container(
+        sections=[
+            Section.Code(Op.RETURNCONTRACT[0](0, 0), max_stack_height=2),
+            Section.Container(runtime_container),
+        ],
+        kind=ContainerKind.INITCODE,
+    )
+    assert container_validity_error(bytes(initcode), initcode=True) is None
+    assert (
+        container_validity_error(bytes(initcode), initcode=False)
+        == EOFException.INCOMPATIBLE_CONTAINER_KIND
+    )
+    assert (
+        container_validity_error(bytes(Container.Code(Op.STOP)), initcode=True)
+        == EOFException.INCOMPATIBLE_CONTAINER_KIND
+    )
+
+
+@pytest.mark.parametrize(
+    "code,expected_values",
+    [
+        pytest.param(Op.STOP, (0, NON_RETURNING_SECTION, 0), id="stop"),
+        pytest.param(Op.ADD + Op.RETF, (2, 1, 2), id="add"),
+        pytest.param(Op.PUSH0 * 3 + Op.POP + Op.RETF, (0, 2, 3), id="push"),
+        pytest.param(
+            Op.PUSH0 + Op.RJUMPI[-4] + Op.PUSH0 * 2 + Op.STOP,
+            (0, NON_RETURNING_SECTION, 2),
+            id="rjumpi_backwards",
+        ),
+        pytest.param(
+            Op.RJUMPI[2] + Op.PUSH0 + Op.PUSH0 + Op.PUSH0 + Op.STOP,
+            (1, NON_RETURNING_SECTION, 3),
+            id="branches",
+        ),
+    ],
+)
+def test_compute_code_stack_values(code: bytes, expected_values: tuple):
+    """
+    Test the computation of the inputs, outputs and max stack height of code sections.
+    """
+    assert compute_code_stack_values(bytes(code)) == expected_values
+
+
+def test_auto_max_stack_height():
+    """
+    Test that the automatically computed max stack height of a section makes it valid.
+    """
+    code = Op.PUSH0 + Op.RJUMPI[-4] + Op.ADD + Op.RETF
+    container = Container(
+        sections=[
+            Section.Code(Op.PUSH0 * 2 + Op.CALLF[1] + Op.STOP, max_stack_height=2),
+            Section.Code(code, code_inputs=2, code_outputs=1, auto_max_stack_height=True),
+        ],
+    )
+    assert container_validity_error(bytes(container)) is None
+
+
+def test_auto_max_stack_height_includes_inputs():
+    """
+    Test that the automatically computed max stack height of a section with inputs and a
+    backwards jump counts the inputs, as required by the validation of the container.
+    """
+    section = Section.Code(
+        Op.PUSH0 + Op.RJUMPI[-4] + Op.ADD + Op.RETF,
+        code_inputs=2,
+        code_outputs=1,
+        auto_max_stack_height=True,
+    )
+    assert section.type_definition == bytes.fromhex("02010003")
@@ -6,7 +6,7 @@ from typing import Type
 
 import pytest
 
-from ethereum_test_base_types import Account
+from ethereum_test_base_types import Account, Storage
 from ethereum_test_types import Alloc
 
 
@@ -114,3 +114,44 @@ def test_verify_post_alloc(
     else:
         with pytest.raises(expected_exception_type) as _:
             post.verify_post_alloc(alloc)
+
+
+def test_diff_post_alloc():
+    """
+    Test that all the mismatches between the post state and the alloc are reported, both when
+    the alloc is validated and when it's the raw alloc returned by the transition tool.
+    """
+    post = Alloc.model_validate(
+        {
+            "0x01": Account(nonce=1, balance=2, storage={0: 1, 1: 0}),
+            "0x02": Account(code="0x00"),
+            "0x03": Account.NONEXISTENT,
+            "0x04": Account(),
+            "0x05": Account(storage={0: 1}),
+        }
+    )
+    raw_alloc = {
+        "0x0000000000000000000000000000000000000001": {
+            "nonce": "0x2",
+            "balance": "0x2",
+            "storage": {"0x00": "0x02", "0x02": "0x03"},
+        },
+        "0x0000000000000000000000000000000000000002": {"code": "0x01"},
+        "0x0000000000000000000000000000000000000003": {"balance": "0x01"},
+        "0x0000000000000000000000000000000000000005": {"storage": {"0x00": "0x01"}},
+        "0x0000000000000000000000000000000000000006": {"balance": "0x01"},
+    }
+    expected_mismatch_types = [
+        Account.NonceMismatch,
+        Storage.KeyValueMismatch,
+        Storage.KeyValueMismatch,
+        Account.CodeMismatch,
+        Alloc.UnexpectedAccount,
+        Alloc.MissingAccount,
+    ]
+    for got_alloc in (raw_alloc, Alloc.model_validate(raw_alloc)):
+        mismatches = post.diff_post_alloc(got_alloc)
+        assert [type(mismatch) for mismatch in mismatches] == expected_mismatch_types
+        with pytest.raises(Account.NonceMismatch) as error:
+            post.verify_post_alloc(got_alloc)
+        assert len(error.value.__notes__) == len(expected_mismatch_types)
@@ -6,7 +6,7 @@ from typing import Tuple
 
 import pytest
 
-from ..types import AccessList, Transaction
+from ..types import AccessList, Transaction, sign_hash, signature_cache_stats
 
 
 @pytest.mark.parametrize(
@@ -261,3 +261,26 @@ def test_transaction_signing(
     assert tx.sender is not None
     assert tx.sender.hex() == expected_sender
     assert (tx.rlp.hex()) == expected_serialized
+
+
+def test_transaction_signature_cache():
+    """
+    Test that re-signing the same transaction uses the signature cache and produces the same
+    signature and sender.
+    """
+    sign_hash.cache_clear()
+    txs = [Transaction(ty=2, nonce=nonce) for nonce in (0, 1, 0)]
+    misses = signature_cache_stats()["misses"]
+    signed_txs = Transaction.with_signatures_and_senders(txs)
+    assert signature_cache_stats()["misses"] - misses == 2
+
+    hits = signature_cache_stats()["hits"]
+    resigned_tx = Transaction(ty=2, nonce=1).with_signature_and_sender()
+    assert signature_cache_stats()["hits"] - hits == 1
+    assert (resigned_tx.v, resigned_tx.r, resigned_tx.s) == (
+        signed_txs[1].v,
+        signed_txs[1].r,
+        signed_txs[1].s,
+    )
+    assert resigned_tx.sender == signed_txs[1].sender
+    assert signed_txs[0].rlp == signed_txs[2].rlp
@@ -0,0 +1,131 @@
+"""
+Test suite for the Merkle Patricia Trie root computation.
+"""
+
+import random
+from typing import Dict
+
+import pytest
+from ethereum import rlp as eth_rlp
+from ethereum.frontier.fork_types import Account as FrontierAccount
+from ethereum.frontier.fork_types import Address as FrontierAddress
+from ethereum.frontier.state import State, set_account, set_storage, state_root
+from ethereum_types.numeric import U256, Uint
+from trie import HexaryTrie
+
+from ethereum_test_base_types import EmptyTrieRoot, Hash
+
+from ..trie import ordered_trie_root, trie_root
+from ..types import Account, Alloc
+
+
+@pytest.mark.parametrize("item_count", [0, 1, 2, 17, 300])
+@pytest.mark.parametrize("key_length", [1, 20, 32])
+def test_trie_root(item_count: int, key_length: int):
+    """
+    Test that the root matches the one of a trie built by inserting each item.
+    """
+    rng = random.Random(item_count * key_length)
+    items: Dict[bytes, bytes] = {
+        rng.randbytes(key_length): rng.randbytes(rng.choice([1, 4, 40])) for _ in range(item_count)
+    }
+    reference_trie = HexaryTrie(db={})
+    for key, value in items.items():
+        reference_trie.set(key, value)
+    assert trie_root(items) == reference_trie.root_hash
+
+
+def test_trie_root_prefix_keys():
+    """
+    Test the root of a trie in which some keys are prefixes of other keys.
+    """
+    rng = random.Random(0)
+    items: Dict[bytes, bytes] = {
+        rng.randbytes(rng.randrange(1, 4)): rng.randbytes(rng.choice([1, 40])) for _ in range(300)
+    }
+    reference_trie = HexaryTrie(db={})
+    for key, value in items.items():
+        reference_trie.set(key, value)
+    assert trie_root(items) == reference_trie.root_hash
+
+
+@pytest.mark.parametrize("item_count", [0, 1, 127, 128, 129, 500])
+def test_ordered_trie_root(item_count: int):
+    """
+    Test the root of a list of items keyed by the RLP encoding of their index.
+    """
+    rng = random.Random(item_count)
+    items = tuple(rng.randbytes(rng.choice([3, 50, 200])) for _ in range(item_count))
+    reference_trie = HexaryTrie(db={})
+    for i, item in enumerate(items):
+        reference_trie.set(eth_rlp.encode(Uint(i)), item)
+    assert ordered_trie_root(items) == reference_trie.root_hash
+
+
+def eels_state_root(alloc: Alloc) -> bytes:
+    """
+    Compute the state root of an allocation using the Frontier state of the execution specs.
+    """
+    state = State()
+    for address, account in alloc.root.items():
+        if account is None:
+            continue
+        set_account(
+            state=state,
+            address=FrontierAddress(address),
+            account=FrontierAccount(
+                nonce=Uint(account.nonce),
+                balance=U256(account.balance),
+                code=account.code,
+            ),
+        )
+        for key, value in account.storage.root.items():
+            set_storage(
+                state=state,
+                address=FrontierAddress(address),
+                key=Hash(key),
+                value=U256(value),
+            )
+    return state_root(state)
+
+
+def random_alloc(seed: int, account_count: int) -> Alloc:
+    """
+    Generate an allocation with random accounts, including empty accounts, accounts with
+    many storage slots and slots with a zero value.
+    """
+    rng = random.Random(seed)
+    return Alloc(
+        {
+            rng.randbytes(20): Account(
+                nonce=rng.randrange(3),
+                balance=rng.choice([0, rng.randrange(2**128)]),
+                code=rng.randbytes(rng.choice([0, 10, 100])),
+                storage={
+                    rng.choice([rng.randrange(16), rng.randrange(2**256)]): rng.randrange(3)
+                    for _ in range(rng.choice([0, 1, 10, 200]))
+                },
+            )
+            for _ in range(account_count)
+        }
+    )
+
+
+def test_empty_alloc_state_root():
+    """
+    Test the state root of an empty allocation.
+    """
+    assert Alloc().state_root() == EmptyTrieRoot
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("account_count", [1, 2, 50])
+def test_alloc_state_root(seed: int, account_count: int):
+    """
+    Test that the state root of an allocation matches the one computed by the execution
+    specs, also when the storage roots are memoized.
+    """
+    alloc = random_alloc(seed, account_count)
+    expected_state_root = eels_state_root(alloc)
+    assert alloc.state_root() == expected_state_root
+    assert alloc.state_root() == expected_state_root
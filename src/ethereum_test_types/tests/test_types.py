@@ -9,6 +9,7 @@ from pydantic import TypeAdapter
 
 from ethereum_test_base_types import Address, TestPrivateKey, to_json
 from ethereum_test_base_types.pydantic import CopyValidateModel
+from ethereum_test_forks import Prague
 
 from ..types import (
     AccessList,
@@ -20,6 +21,8 @@ from ..types import (
     Storage,
     Transaction,
     Withdrawal,
+    fork_pre_allocation,
+    fork_pre_allocation_blockchain,
 )
 
 
@@ -91,6 +94,51 @@ def test_storage():
     }
 
 
+@pytest.mark.parametrize(
+    "expected,actual,contains,equal_error",
+    [
+        pytest.param({1: 1, 2: 2}, {1: 1, 2: 2}, True, None, id="equal"),
+        pytest.param({1: 1, 2: 0}, {1: 1}, False, None, id="missing_zero"),
+        pytest.param({1: 1}, {1: 1, 2: 0}, True, None, id="extra_zero"),
+        pytest.param({1: 1}, {1: 1, 2: 2}, True, Storage.KeyValueMismatch, id="extra_value"),
+        pytest.param({1: 1, 2: 2}, {1: 1}, False, Storage.KeyValueMismatch, id="missing_value"),
+        pytest.param({1: 1, 2: 2}, {1: 1, 2: 3}, False, Storage.KeyValueMismatch, id="mismatch"),
+    ],
+)
+def test_storage_comparison(
+    expected: Dict, actual: Dict, contains: bool, equal_error: type[Exception] | None
+):
+    """
+    Test the comparison of storages, in which a missing key is equal to a key with a zero value.
+    """
+    expected_storage = Storage(expected)  # type: ignore
+    actual_storage = Storage(actual)  # type: ignore
+    assert actual_storage.contains(expected_storage) == contains
+    if equal_error is None:
+        expected_storage.must_be_equal(Address(1), actual_storage)
+    else:
+        with pytest.raises(equal_error):
+            expected_storage.must_be_equal(Address(1), actual_storage)
+    if contains or equal_error is None:
+        actual_storage.must_contain(Address(1), expected_storage)
+    else:
+        with pytest.raises((Storage.KeyValueMismatch, Storage.MissingKey)):
+            actual_storage.must_contain(Address(1), expected_storage)
+
+
+def test_storage_key_value_conversion():
+    """
+    Test that storage keys and values are converted to the same type from every input type.
+    """
+    s = Storage()
+    s[1] = 2**256 - 1
+    s[True] = 1
+    with pytest.raises(Exception):
+        s[2**256] = 1
+    assert s[1] == 1
+    assert type(next(iter(s))) is type(s[1]) is type(s["0x01"])
+
+
 @pytest.mark.parametrize(
     ["account"],
     [
@@ -885,3 +933,27 @@ def test_model_copy(model: CopyValidateModel):
     """
     assert to_json(model.copy()) == to_json(model)
     assert model.copy().model_fields_set == model.model_fields_set
+
+
+def test_fork_pre_allocation():
+    """
+    Test that the validated pre-allocation of a fork is shared, and not modified by a merge
+    or by the changes to the merged allocation.
+    """
+    pre_allocation = fork_pre_allocation_blockchain(Prague)
+    assert pre_allocation is fork_pre_allocation_blockchain(Prague)
+    assert pre_allocation == Alloc.model_validate(Prague.pre_allocation_blockchain())
+
+    address = Address(0x1234)
+    merged = Alloc.merge(pre_allocation, Alloc({address: Account(nonce=1)}))
+    assert address in merged
+    assert address not in pre_allocation
+    for system_address, account in pre_allocation.items():
+        merged_account = merged[system_address]
+        assert merged_account == account
+        assert merged_account is not account
+        assert merged_account is not None
+        merged_account.nonce = 0x100
+        merged_account.storage[1] = 2
+    assert pre_allocation == Alloc.model_validate(Prague.pre_allocation_blockchain())
+    assert fork_pre_allocation(Prague) == Alloc()
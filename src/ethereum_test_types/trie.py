@@ -0,0 +1,169 @@
+"""
+Merkle Patricia Trie root computation.
+
+Roots are computed directly from the sorted keys of the trie in a single recursive pass,
+without building the intermediate trie nodes of an incremental insertion.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+from Crypto.Hash import keccak
+from ethereum import rlp as eth_rlp
+
+from ethereum_test_base_types import EmptyTrieRoot, Hash
+
+SECURE_TRIE_KEY_CACHE_SIZE = 16384
+STORAGE_ROOT_CACHE_SIZE = 4096
+ORDERED_TRIE_ROOT_CACHE_SIZE = 1024
+
+
+def keccak256(data: bytes) -> bytes:
+    """
+    Calculates the keccak256 hash of the given data.
+    """
+    return keccak.new(digest_bits=256, data=data).digest()
+
+
+def encode_int(value: int) -> bytes:
+    """
+    Returns the minimal big-endian representation of an integer, as used by RLP.
+    """
+    return value.to_bytes((value.bit_length() + 7) // 8, "big")
+
+
+def hex_prefix(nibbles: str, is_leaf: bool) -> bytes:
+    """
+    Compacts a path of nibbles (given as a hex string) using hex-prefix encoding.
+    """
+    flag = 2 if is_leaf else 0
+    if len(nibbles) % 2:
+        return bytes.fromhex(f"{flag + 1:x}{nibbles}")
+    return bytes.fromhex(f"{flag:x}0{nibbles}")
+
+
+def encode_node(items: Sequence[Tuple[str, bytes]], depth: int) -> bytes | List:
+    """
+    Returns the node of the trie that contains the given items, as an RLP-encodable
+    structure.
+
+    The items are (key, value) pairs whose keys are sorted hex strings sharing their first
+    `depth` nibbles.
+    """
+    if len(items) == 1:
+        key, value = items[0]
+        return [hex_prefix(key[depth:], is_leaf=True), value]
+    # The keys are sorted, so the first and last keys share the prefix of all keys.
+    first_key, last_key = items[0][0], items[-1][0]
+    prefix_length = 0
+    max_prefix_length = min(len(first_key), len(last_key)) - depth
+    while (
+        prefix_length < max_prefix_length
+        and first_key[depth + prefix_length] == last_key[depth + prefix_length]
+    ):
+        prefix_length += 1
+    if prefix_length:
+        return [
+            hex_prefix(first_key[depth : depth + prefix_length], is_leaf=False),
+            encode_internal_node(items, depth + prefix_length),
+        ]
+    branches: List[bytes | List] = [b""] * 17
+    start = 0
+    if len(first_key) == depth:
+        # The shortest key, sorted first, ends at this branch.
+        branches[16] = items[0][1]
+        start = 1
+    for end in range(start + 1, len(items) + 1):
+        if end == len(items) or items[end][0][depth] != items[start][0][depth]:
+            branches[int(items[start][0][depth], 16)] = encode_internal_node(
+                items[start:end], depth + 1
+            )
+            start = end
+    return branches
+
+
+def encode_internal_node(items: Sequence[Tuple[str, bytes]], depth: int) -> bytes | List:
+    """
+    Returns the reference to a child node: the node itself if its encoding is shorter than
+    32 bytes, or the hash of its encoding otherwise.
+    """
+    node = encode_node(items, depth)
+    encoded = eth_rlp.encode(node)
+    if len(encoded) < 32:
+        return node
+    return keccak256(encoded)
+
+
+def trie_root(items: Mapping[bytes, bytes]) -> Hash:
+    """
+    Returns the root of the trie containing the given (key, value) pairs.
+    """
+    if not items:
+        return EmptyTrieRoot
+    sorted_items = sorted((key.hex(), value) for key, value in items.items())
+    return Hash(keccak256(eth_rlp.encode(encode_node(sorted_items, 0))))
+
+
+@lru_cache(maxsize=SECURE_TRIE_KEY_CACHE_SIZE)
+def secure_trie_key(key: bytes) -> bytes:
+    """
+    Returns the hash of an address or storage key, used as its key in the secure trie.
+
+    The keys are small and the same addresses are part of many allocations, so the hashes
+    are memoized.
+    """
+    return keccak256(key)
+
+
+def secure_trie_root(items: Mapping[bytes, bytes]) -> Hash:
+    """
+    Returns the root of the secure trie containing the given (key, value) pairs, i.e. the
+    trie in which the keys are the hashes of the given keys.
+    """
+    return trie_root({secure_trie_key(key): value for key, value in items.items()})
+
+
+@lru_cache(maxsize=ORDERED_TRIE_ROOT_CACHE_SIZE)
+def ordered_trie_root(items: Tuple[bytes, ...]) -> Hash:
+    """
+    Returns the root of the trie containing the given encoded items, keyed by the RLP
+    encoding of their index (e.g. the transactions, withdrawals or requests of a block).
+
+    The results are memoized, so that the roots of the same lists are only computed once
+    when a test is filled for several fixture formats.
+    """
+    return trie_root({eth_rlp.encode(encode_int(index)): item for index, item in enumerate(items)})
+
+
+@lru_cache(maxsize=STORAGE_ROOT_CACHE_SIZE)
+def storage_root(storage: Tuple[Tuple[int, int], ...]) -> Hash:
+    """
+    Returns the root of the storage trie of an account with the given (key, value) slots.
+
+    Slots with a zero value are not part of the trie. The results are memoized, so that
+    the storage roots of accounts that are part of several allocations (e.g. the genesis of
+    a test filled for several fixture formats and forks) are only computed once.
+    """
+    return secure_trie_root(
+        {
+            key.to_bytes(32, "big"): eth_rlp.encode(encode_int(value))
+            for key, value in storage
+            if value != 0
+        }
+    )
+
+
+def account_rlp(
+    *, nonce: int, balance: int, code: bytes, storage: Dict[int, int] | None = None
+) -> bytes:
+    """
+    Returns the RLP encoding of an account, as stored in the state trie.
+    """
+    return eth_rlp.encode(
+        [
+            encode_int(nonce),
+            encode_int(balance),
+            storage_root(tuple(sorted(storage.items()))) if storage else EmptyTrieRoot,
+            keccak256(code),
+        ]
+    )
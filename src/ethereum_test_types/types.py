@@ -3,15 +3,12 @@ Useful types for generating Ethereum tests.
 """
 
 from dataclasses import dataclass
-from functools import cached_property
-from typing import Any, ClassVar, Dict, Generic, List, Literal, Sequence, Tuple
+from functools import cached_property, lru_cache
+from typing import Any, ClassVar, Dict, Generic, List, Literal, Mapping, Sequence, Tuple
 
 from coincurve.keys import PrivateKey, PublicKey
 from ethereum import rlp as eth_rlp
-from ethereum.frontier.fork_types import Account as FrontierAccount
-from ethereum.frontier.fork_types import Address as FrontierAddress
-from ethereum.frontier.state import State, set_account, set_storage, state_root
-from ethereum_types.numeric import U256, Uint
+from ethereum_types.numeric import Uint
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -22,7 +19,6 @@ from pydantic import (
     model_serializer,
     model_validator,
 )
-from trie import HexaryTrie
 
 from ethereum_test_base_types import (
     Account,
@@ -50,6 +46,8 @@ from ethereum_test_exceptions import TransactionException
 from ethereum_test_forks import Fork
 from ethereum_test_vm import EVMCodeType
 
+from .trie import account_rlp, ordered_trie_root, secure_trie_root
+
 
 def keccak256(data: bytes) -> Hash:
     """
@@ -68,6 +66,95 @@ def int_to_bytes(value: int) -> bytes:
     return int_to_bytes(value // 256) + bytes([value % 256])
 
 
+SIGNATURE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=SIGNATURE_CACHE_SIZE)
+def private_key_to_address(secret_key: bytes) -> Address:
+    """
+    Returns the address of the account controlled by the given private key.
+    """
+    public_key = PrivateKey(secret=bytes(secret_key)).public_key
+    return Address(keccak256(public_key.format(compressed=False)[1:])[32 - 20 :])
+
+
+@lru_cache(maxsize=SIGNATURE_CACHE_SIZE)
+def sign_hash(signing_hash: bytes, secret_key: bytes) -> Tuple[int, int, int, Address]:
+    """
+    Signs a message hash with a private key and returns the recovery id, the `r` and `s`
+    values of the signature, and the address of the signer.
+
+    Signatures are deterministic (RFC 6979), so they are memoized: the same transactions
+    are signed again for every fixture format a test is filled for.
+    """
+    signature_bytes = PrivateKey(secret=bytes(secret_key)).sign_recoverable(
+        bytes(signing_hash), hasher=None
+    )
+    return (
+        signature_bytes[64],
+        int.from_bytes(signature_bytes[0:32], byteorder="big"),
+        int.from_bytes(signature_bytes[32:64], byteorder="big"),
+        private_key_to_address(secret_key),
+    )
+
+
+@lru_cache(maxsize=SIGNATURE_CACHE_SIZE)
+def recover_signer(signature_bytes: bytes, signing_hash: bytes) -> Address:
+    """
+    Returns the address of the signer of a message hash given its recoverable signature.
+    """
+    public_key = PublicKey.from_signature_and_message(
+        bytes(signature_bytes), bytes(signing_hash), hasher=None
+    )
+    return Address(keccak256(public_key.format(compressed=False)[1:])[32 - 20 :])
+
+
+def signature_cache_stats() -> Dict[str, int]:
+    """
+    Returns the hit and miss counters of the signing and signer recovery caches.
+    """
+    sign_info, recover_info = sign_hash.cache_info(), recover_signer.cache_info()
+    return {
+        "hits": sign_info.hits + recover_info.hits,
+        "misses": sign_info.misses + recover_info.misses,
+    }
+
+
+MISSING_ACCOUNT = object()
+
+
+class RawAllocView:
+    """
+    Read-only view of the raw allocation returned by a transition tool, that validates
+    the accounts as they are looked up by address.
+    """
+
+    def __init__(self, raw_alloc: Mapping[str, Mapping[str, Any] | None]):
+        """
+        Initialize the view.
+        """
+        self.raw_alloc = raw_alloc
+        self._addresses: Dict[Address, str] | None = None
+
+    def get(self, address: Address, default: Any = None) -> Any:
+        """
+        Returns the validated account at the given address, or the default if missing.
+        """
+        key = str(address)
+        if key not in self.raw_alloc:
+            # Transition tools return lowercase addresses, but fall back to parsing all
+            # the keys in case they don't.
+            if self._addresses is None:
+                self._addresses = {Address(key): key for key in self.raw_alloc}
+            if address not in self._addresses:
+                return default
+            key = self._addresses[address]
+        raw_account = self.raw_alloc[key]
+        if raw_account is None:
+            return None
+        return Account.model_validate(raw_account)
+
+
 # Sentinel classes
 class Removable:
     """
@@ -101,11 +188,7 @@ class EOA(Address):
         if address is None:
             if key is None:
                 raise ValueError("impossible to initialize EOA without address")
-            private_key = PrivateKey(Hash(key))
-            public_key = private_key.public_key
-            address = Address(
-                keccak256(public_key.format(compressed=False)[1:])[32 - 20 :]
-            )
+            address = private_key_to_address(Hash(key))
         elif isinstance(address, EOA):
             return address
         instance = super(EOA, cls).__new__(cls, address)
@@ -173,8 +256,25 @@ class Alloc(BaseAlloc):
     def merge(cls, alloc_1: "Alloc", alloc_2: "Alloc") -> "Alloc":
         """
         Returns the merged allocation of two sources.
-        """
-        merged = alloc_1.model_dump()
+
+        The accounts of `alloc_1` that are not in `alloc_2` are already validated, so they are
+        copied without being dumped and validated again. Only the storage of an account is
+        mutable in place, so it's the only part of the account that is copied.
+        """
+        merged: Dict[Address, Account | None] = {
+            address: (
+                account.model_copy(
+                    update={
+                        "storage": account.storage.model_copy(
+                            update={"root": account.storage.root.copy()}
+                        )
+                    }
+                )
+                if account is not None
+                else None
+            )
+            for address, account in alloc_1.root.items()
+        }
 
         for address, other_account in alloc_2.root.items():
             merged_account = Account.merge(merged.get(address, None), other_account)
@@ -251,52 +351,66 @@ class Alloc(BaseAlloc):
         """
         Returns the state root of the allocation.
         """
-        state = State()
-        for address, account in self.root.items():
-            if account is None:
-                continue
-            set_account(
-                state=state,
-                address=FrontierAddress(address),
-                account=FrontierAccount(
-                    nonce=Uint(account.nonce) if account.nonce is not None else Uint(0),
-                    balance=(
-                        U256(account.balance)
-                        if account.balance is not None
-                        else U256(0)
-                    ),
+        return secure_trie_root(
+            {
+                address: account_rlp(
+                    nonce=account.nonce if account.nonce is not None else 0,
+                    balance=account.balance if account.balance is not None else 0,
                     code=account.code if account.code is not None else b"",
-                ),
-            )
-            if account.storage is not None:
-                for key, value in account.storage.root.items():
-                    set_storage(
-                        state=state,
-                        address=FrontierAddress(address),
-                        key=Hash(key),
-                        value=U256(value),
-                    )
-        return state_root(state)
+                    storage=(
+                        account.storage.root if account.storage is not None else None
+                    ),
+                )
+                for address, account in self.root.items()
+                if account is not None
+            }
+        )
 
-    def verify_post_alloc(self, got_alloc: "Alloc"):
+    def verify_post_alloc(
+        self, got_alloc: "Alloc | Mapping[str, Mapping[str, Any] | None]"
+    ):
         """
         Verify that the allocation matches the expected post in the test.
         Raises exception on unexpected values.
+
+        The first mismatch is raised, with all the other mismatches found added as notes.
+        """
+        mismatches = self.diff_post_alloc(got_alloc)
+        if mismatches:
+            error = mismatches[0]
+            if len(mismatches) > 1:
+                error.add_note(f"{len(mismatches) - 1} more post-state mismatches:")
+                for mismatch in mismatches[1:]:
+                    error.add_note(f"  {mismatch}")
+            raise error
+
+    def diff_post_alloc(
+        self, got_alloc: "Alloc | Mapping[str, Mapping[str, Any] | None]"
+    ) -> List[Exception]:
+        """
+        Returns all the differences between the allocation and the expected post in the
+        test, in the order of the accounts of the expected post.
+
+        `got_alloc` can also be the raw allocation returned by the transition tool, keyed
+        by address, in which case only the accounts of the expected post are validated.
         """
-        assert isinstance(got_alloc, Alloc), f"got_alloc is not an Alloc: {got_alloc}"
+        if isinstance(got_alloc, BaseAlloc):
+            got_accounts: Mapping[Any, Any] = got_alloc.root
+        else:
+            got_accounts = RawAllocView(got_alloc)
+        mismatches: List[Exception] = []
         for address, account in self.root.items():
+            got_account = got_accounts.get(address, MISSING_ACCOUNT)
             if account is None:
                 # Account must not exist
-                if address in got_alloc.root and got_alloc.root[address] is not None:
-                    raise Alloc.UnexpectedAccount(address, got_alloc.root[address])
+                if got_account is not MISSING_ACCOUNT and got_account is not None:
+                    mismatches.append(Alloc.UnexpectedAccount(address, got_account))
+            elif got_account is MISSING_ACCOUNT:
+                mismatches.append(Alloc.MissingAccount(address))
             else:
-                if address in got_alloc.root:
-                    got_account = got_alloc.root[address]
-                    assert isinstance(got_account, Account)
-                    assert isinstance(account, Account)
-                    account.check_alloc(address, got_account)
-                else:
-                    raise Alloc.MissingAccount(address)
+                assert isinstance(got_account, Account)
+                mismatches.extend(account.diff_alloc(address, got_account))
+        return mismatches
 
     def deploy_contract(
         self,
@@ -328,6 +442,13 @@ class Alloc(BaseAlloc):
         """
         raise NotImplementedError("fund_eoa is not implemented in the base class")
 
+    def fund_eoas(self, amount_of_eoas: int, amount: NumberConvertible | None = None) -> List[EOA]:
+        """
+        Add `amount_of_eoas` previously unused EOAs to the pre-alloc, each with the balance
+        specified by `amount`.
+        """
+        raise NotImplementedError("fund_eoas is not implemented in the base class")
+
     def fund_address(self, address: Address, amount: NumberConvertible):
         """
         Fund an address with a given amount.
@@ -338,6 +459,28 @@ class Alloc(BaseAlloc):
         raise NotImplementedError("fund_address is not implemented in the base class")
 
 
+@lru_cache(maxsize=None)
+def fork_pre_allocation(fork: Fork) -> Alloc:
+    """
+    Returns the validated pre-allocation of accounts required by the fork for any kind of test.
+
+    The allocation is shared between all the tests filled for the fork, so it must not be
+    modified; `Alloc.merge` always returns a new allocation.
+    """
+    return Alloc.model_validate(fork.pre_allocation())
+
+
+@lru_cache(maxsize=None)
+def fork_pre_allocation_blockchain(fork: Fork) -> Alloc:
+    """
+    Returns the validated pre-allocation of accounts required by the fork for blockchain tests.
+
+    The allocation is shared between all the tests filled for the fork, so it must not be
+    modified; `Alloc.merge` always returns a new allocation.
+    """
+    return Alloc.model_validate(fork.pre_allocation_blockchain())
+
+
 class WithdrawalGeneric(CamelModel, Generic[NumberBoundTypeVar]):
     """
     Withdrawal generic type, used as a parent class for `Withdrawal` and `FixtureWithdrawal`.
@@ -365,10 +508,9 @@ class WithdrawalGeneric(CamelModel, Generic[NumberBoundTypeVar]):
         """
         Returns the withdrawals root of a list of withdrawals.
         """
-        t = HexaryTrie(db={})
-        for i, w in enumerate(withdrawals):
-            t.set(eth_rlp.encode(Uint(i)), eth_rlp.encode(w.to_serializable_list()))
-        return t.root_hash
+        return ordered_trie_root(
+            tuple(eth_rlp.encode(w.to_serializable_list()) for w in withdrawals)
+        )
 
 
 class Withdrawal(WithdrawalGeneric[HexNumber]):
@@ -894,36 +1036,17 @@ class Transaction(TransactionGeneric[HexNumber], TransactionTransitionToolConver
             if self.sender is not None:
                 return self
 
-            public_key = PublicKey.from_signature_and_message(
-                self.signature_bytes, self.signing_bytes.keccak256(), hasher=None
-            )
-            updated_values["sender"] = Address(
-                keccak256(public_key.format(compressed=False)[1:])[32 - 20 :]
+            updated_values["sender"] = recover_signer(
+                self.signature_bytes, self.signing_bytes.keccak256()
             )
             return self.copy(**updated_values)
 
         if self.secret_key is None:
             raise ValueError("secret_key must be set to sign a transaction")
 
-        # Get the signing bytes
-        signing_hash = self.signing_bytes.keccak256()
+        v, r, s, sender = sign_hash(self.signing_bytes.keccak256(), self.secret_key)
+        updated_values["sender"] = sender
 
-        # Sign the bytes
-        signature_bytes = PrivateKey(secret=self.secret_key).sign_recoverable(
-            signing_hash, hasher=None
-        )
-        public_key = PublicKey.from_signature_and_message(
-            signature_bytes, signing_hash, hasher=None
-        )
-
-        sender = keccak256(public_key.format(compressed=False)[1:])[32 - 20 :]
-        updated_values["sender"] = Address(sender)
-
-        v, r, s = (
-            signature_bytes[64],
-            int.from_bytes(signature_bytes[0:32], byteorder="big"),
-            int.from_bytes(signature_bytes[32:64], byteorder="big"),
-        )
         if self.ty == 0:
             if self.protected:
                 v += 35 + (self.chain_id * 2)
@@ -943,6 +1066,20 @@ class Transaction(TransactionGeneric[HexNumber], TransactionTransitionToolConver
             updated_tx.secret_key = self.secret_key
         return updated_tx
 
+    @staticmethod
+    def with_signatures_and_senders(
+        txs: Sequence["Transaction"], *, keep_secret_key: bool = False
+    ) -> List["Transaction"]:
+        """
+        Returns signed versions of a list of transactions.
+
+        Each transaction is signed with `with_signature_and_sender`, whose signatures are
+        memoized by `sign_hash`.
+        """
+        return [
+            tx.with_signature_and_sender(keep_secret_key=keep_secret_key) for tx in txs
+        ]
+
     @cached_property
     def signing_envelope(self) -> List[Any]:
         """
@@ -1168,10 +1305,7 @@ class Transaction(TransactionGeneric[HexNumber], TransactionTransitionToolConver
         """
         Returns the transactions root of a list of transactions.
         """
-        t = HexaryTrie(db={})
-        for i, tx in enumerate(input_txs):
-            t.set(eth_rlp.encode(Uint(i)), tx.rlp)
-        return Hash(t.root_hash)
+        return ordered_trie_root(tuple(tx.rlp for tx in input_txs))
 
     @staticmethod
     def list_blob_versioned_hashes(input_txs: List["Transaction"]) -> List[Hash]:
@@ -1356,13 +1490,7 @@ class Requests(
         """
         Returns the root hash of the requests.
         """
-        t = HexaryTrie(db={})
-        for i, r in enumerate(self.root):
-            t.set(
-                eth_rlp.encode(Uint(i)),
-                r.type_byte() + eth_rlp.encode(r.to_serializable_list()),
-            )
-        return Hash(t.root_hash)
+        return ordered_trie_root(tuple(self.to_serializable_list()))
 
     def deposit_requests(self) -> List[DepositRequest]:
         """
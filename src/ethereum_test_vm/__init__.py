@@ -5,7 +5,15 @@ Ethereum Virtual Machine related definitions and utilities.
 from .bytecode import Bytecode
 from .evm_types import EVMCodeType
 from .helpers import call_return_code
-from .opcode import Macro, Macros, Opcode, OpcodeCallArg, Opcodes, UndefinedOpcodes
+from .opcode import (
+    Macro,
+    Macros,
+    Opcode,
+    OpcodeCallArg,
+    Opcodes,
+    UndefinedOpcodes,
+    stack_arguments_cache_stats,
+)
 
 __all__ = (
     "Bytecode",
@@ -17,4 +25,5 @@ __all__ = (
     "Opcodes",
     "UndefinedOpcodes",
     "call_return_code",
+    "stack_arguments_cache_stats",
 )
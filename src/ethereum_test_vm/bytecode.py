@@ -1,10 +1,13 @@
 """
 Ethereum Virtual Machine bytecode primitives and utilities.
 """
-from typing import SupportsBytes
+from typing import List, SupportsBytes, Tuple
 
 from ethereum_test_base_types import Bytes, Hash
 
+# Concatenations shorter than this are copied right away instead of being deferred.
+ROPE_MIN_LENGTH = 256
+
 
 class Bytecode:
     """
@@ -14,6 +17,10 @@ class Bytecode:
     objects. The stack height is not guaranteed to be correct, so the user must take this into
     consideration.
 
+    Long concatenations are represented as a binary tree of the concatenated bytecode objects
+    (a rope), whose byte representation is only built once, when it's first required, to avoid
+    copying the whole bytecode on each addition.
+
     Parameters
     ----------
     - popped_stack_items: number of items the bytecode pops from the stack
@@ -23,7 +30,9 @@ class Bytecode:
     """
 
     _name_: str = ""
-    _bytes_: bytes
+    _bytes_: bytes | None
+    _parts_: "Tuple[Bytecode, Bytecode] | None" = None
+    _length_: int
 
     popped_stack_items: int
     pushed_stack_items: int
@@ -49,6 +58,7 @@ class Bytecode:
         if bytes_or_byte_code_base is None:
             instance = super().__new__(cls)
             instance._bytes_ = b""
+            instance._length_ = 0
             instance.popped_stack_items = 0
             instance.pushed_stack_items = 0
             instance.min_stack_height = 0
@@ -62,6 +72,8 @@ class Bytecode:
             # parameter.
             obj = super().__new__(cls)
             obj._bytes_ = bytes_or_byte_code_base._bytes_
+            obj._parts_ = bytes_or_byte_code_base._parts_
+            obj._length_ = bytes_or_byte_code_base._length_
             obj.popped_stack_items = bytes_or_byte_code_base.popped_stack_items
             obj.pushed_stack_items = bytes_or_byte_code_base.pushed_stack_items
             obj.min_stack_height = bytes_or_byte_code_base.min_stack_height
@@ -73,6 +85,7 @@ class Bytecode:
         if isinstance(bytes_or_byte_code_base, bytes):
             obj = super().__new__(cls)
             obj._bytes_ = bytes_or_byte_code_base
+            obj._length_ = len(bytes_or_byte_code_base)
             assert popped_stack_items is not None
             assert pushed_stack_items is not None
             obj.popped_stack_items = popped_stack_items
@@ -95,13 +108,32 @@ class Bytecode:
         """
         Return the opcode byte representation.
         """
+        if self._bytes_ is None:
+            # Iterate the leaves of the rope without recursion, since the ropes built by
+            # repeated additions are as deep as the number of additions.
+            leaves: List[bytes] = []
+            pending: List[Bytecode] = [self]
+            while pending:
+                node = pending.pop()
+                if node._bytes_ is not None:
+                    leaves.append(node._bytes_)
+                else:
+                    assert node._parts_ is not None
+                    pending.extend(reversed(node._parts_))
+            self._bytes_ = b"".join(leaves)
+            self._parts_ = None
         return self._bytes_
 
     def __len__(self) -> int:
         """
         Return the length of the opcode byte representation.
+
+        The length of the byte representation is used once it's built, since subclasses may
+        assign `_bytes_` directly.
         """
-        return len(self._bytes_)
+        if self._bytes_ is not None:
+            return len(self._bytes_)
+        return self._length_
 
     def __str__(self) -> str:
         """
@@ -178,14 +210,27 @@ class Bytecode:
         # spot where B reached b_max, after A had completed.
         c_max = max(c_min + a_max - a_min, c_min - a_pop + a_push + b_max - b_min)
 
-        return Bytecode(
-            bytes(self) + bytes(other),
+        if len(self) + len(other) < ROPE_MIN_LENGTH:
+            return Bytecode(
+                bytes(self) + bytes(other),
+                popped_stack_items=c_pop,
+                pushed_stack_items=c_push,
+                min_stack_height=c_min,
+                max_stack_height=c_max,
+                terminating=other.terminating,
+            )
+        output = Bytecode(
+            b"",
             popped_stack_items=c_pop,
             pushed_stack_items=c_push,
             min_stack_height=c_min,
             max_stack_height=c_max,
             terminating=other.terminating,
         )
+        output._bytes_ = None
+        output._parts_ = (self, other)
+        output._length_ = len(self) + len(other)
+        return output
 
     def __radd__(self, other: "Bytecode | int | None") -> "Bytecode":
         """
@@ -205,9 +250,16 @@ class Bytecode:
             raise ValueError("Cannot multiply by a negative number")
         if other == 0:
             return Bytecode()
-        output = self
-        for _ in range(other - 1):
-            output += self
+        # Addition is associative, so the output is built by doubling, in O(log(other)) steps.
+        output = None
+        power = self
+        while True:
+            if other & 1:
+                output = power if output is None else output + power
+            other >>= 1
+            if other == 0:
+                break
+            power = power + power
         return output
 
     def hex(self) -> str:
@@ -220,4 +272,4 @@ class Bytecode:
         """
         Return the keccak256 hash of the opcode byte representation.
         """
-        return Bytes(self._bytes_).keccak256()
+        return Bytes(bytes(self)).keccak256()
@@ -8,7 +8,8 @@ to @ThreeHrSleep for integrating it in the docstrings.
 """
 
 from enum import Enum
-from typing import Any, Callable, Iterable, List, Mapping, Optional, SupportsBytes
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, SupportsBytes, Tuple
 
 from ethereum_test_base_types import to_bytes
 
@@ -44,6 +45,8 @@ def _stack_argument_to_bytecode(
     # We are going to push a constant to the stack.
     data_size = 0
     if isinstance(arg, int):
+        if 0 <= arg < len(_small_int_pushes):
+            return _small_int_pushes[arg]
         signed = arg < 0
         data_size = _get_int_size(arg)
         if data_size > 32:
@@ -69,6 +72,87 @@ def _stack_argument_to_bytecode(
     return new_opcode
 
 
+STACK_ARGUMENTS_CACHE_SIZE = 16384
+STACK_ARGUMENT_BYTECODE_MAX_LENGTH = 64
+
+StackArgumentKey = int | str | bytes | Tuple[bytes, int, int, int, int]
+
+
+def _stack_argument_key(arg: Any) -> StackArgumentKey | None:
+    """
+    Returns a hashable key that determines the bytecode that sets up a stack argument, or None
+    if the argument can't be cached.
+
+    Values are normalized to the built-in types, because the equality operators of some of their
+    subclasses (e.g. `Address`) raise when comparing against other types.
+    """
+    if isinstance(arg, Bytecode):
+        if len(arg) > STACK_ARGUMENT_BYTECODE_MAX_LENGTH:
+            return None
+        return (
+            bytes(arg),
+            arg.popped_stack_items,
+            arg.pushed_stack_items,
+            arg.min_stack_height,
+            arg.max_stack_height,
+        )
+    if isinstance(arg, int):
+        return int(arg)
+    if isinstance(arg, bytes):
+        return bytes(arg)
+    if isinstance(arg, str):
+        return str(arg)
+    return None
+
+
+@lru_cache(maxsize=STACK_ARGUMENTS_CACHE_SIZE)
+def _cached_stack_arguments_to_bytecode(keys: Tuple[StackArgumentKey, ...]) -> Bytecode:
+    """
+    Returns the bytecode that pushes the stack arguments identified by the given keys, in the
+    order they are given.
+    """
+    bytecode = Bytecode()
+    for key in keys:
+        if isinstance(key, tuple):
+            code, popped_stack_items, pushed_stack_items, min_stack_height, max_stack_height = key
+            bytecode += Bytecode(
+                code,
+                popped_stack_items=popped_stack_items,
+                pushed_stack_items=pushed_stack_items,
+                min_stack_height=min_stack_height,
+                max_stack_height=max_stack_height,
+            )
+        else:
+            bytecode += _stack_argument_to_bytecode(key)
+    return bytecode
+
+
+def _stack_arguments_to_bytecode(args: Iterable[Any]) -> Bytecode:
+    """
+    Converts the stack arguments of an opcode or macro to the bytecode that pushes them, in the
+    order they are given.
+
+    Opcodes with the same arguments are called many times while the tests are collected, so the
+    bytecode is memoized for arguments that are hashable.
+    """
+    args = list(args)
+    keys = [_stack_argument_key(arg) for arg in args]
+    if any(key is None for key in keys):
+        bytecode = Bytecode()
+        for arg in args:
+            bytecode += _stack_argument_to_bytecode(arg)
+        return bytecode
+    return _cached_stack_arguments_to_bytecode(tuple(keys))  # type: ignore
+
+
+def stack_arguments_cache_stats() -> Dict[str, int]:
+    """
+    Returns the hit and miss counters of the stack arguments bytecode cache.
+    """
+    cache_info = _cached_stack_arguments_to_bytecode.cache_info()
+    return {"hits": cache_info.hits, "misses": cache_info.misses}
+
+
 class Opcode(Bytecode):
     """
     Represents a single Opcode instruction in the EVM, with extra metadata useful to parametrize
@@ -268,10 +352,7 @@ class Opcode(Bytecode):
                 f"{len(args)} were provided. Use 'unchecked=True' parameter to ignore this check."
             )
 
-        pre_opcode_bytecode = Bytecode()
-        while len(args) > 0:
-            pre_opcode_bytecode += _stack_argument_to_bytecode(args.pop())
-        return pre_opcode_bytecode + self
+        return _stack_arguments_to_bytecode(reversed(args)) + self
 
     def __lt__(self, other: "Opcode") -> bool:
         """
@@ -334,10 +415,7 @@ class Macro(Bytecode):
         if self.lambda_operation is not None:
             return self.lambda_operation(*args_t)
 
-        pre_opcode_bytecode = Bytecode()
-        for arg in args_t:
-            pre_opcode_bytecode += _stack_argument_to_bytecode(arg)
-        return pre_opcode_bytecode + self
+        return _stack_arguments_to_bytecode(args_t) + self
 
 
 #  Constants
@@ -5709,6 +5787,9 @@ _push_opcodes_byte_list: List[Opcode] = [
     Opcodes.PUSH32,
 ]
 
+# PUSH1 opcodes of the integers that fit in one byte, which are the most common stack arguments.
+_small_int_pushes: List[Opcode] = [Opcodes.PUSH1[i] for i in range(256)]
+
 
 def _mstore_operation(data: OpcodeCallArg = b"", offset: OpcodeCallArg = 0) -> Bytecode:
     """
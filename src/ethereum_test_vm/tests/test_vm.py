@@ -9,6 +9,7 @@ from ethereum_test_base_types import Address
 from ..opcode import Bytecode
 from ..opcode import Macros as Om
 from ..opcode import Opcodes as Op
+from ..opcode import stack_arguments_cache_stats
 
 
 @pytest.mark.parametrize(
@@ -424,3 +425,81 @@ def test_opcode_comparison():
     assert Op.ADD == Op.ADD
     assert Op.ADD != Op.STOP
     assert Op.ADD > Op.STOP
+
+
+@pytest.mark.parametrize("bytecode", [Op.JUMPDEST, Op.PUSH1[1], Op.SSTORE(0, 1), Op.POP + Op.DUP2])
+@pytest.mark.parametrize("count", [1, 2, 3, 255, 256, 1000])
+def test_bytecode_multiplication(bytecode: Bytecode, count: int):
+    """
+    Test that multiplying a bytecode is equivalent to adding it repeatedly.
+    """
+    expected = bytecode
+    for _ in range(count - 1):
+        expected = expected + bytecode
+    multiplied = bytecode * count
+    assert bytes(multiplied) == bytes(bytecode) * count
+    assert len(multiplied) == len(bytecode) * count
+    assert multiplied.popped_stack_items == expected.popped_stack_items
+    assert multiplied.pushed_stack_items == expected.pushed_stack_items
+    assert multiplied.max_stack_height == expected.max_stack_height
+    assert multiplied.min_stack_height == expected.min_stack_height
+
+
+def test_bytecode_long_concatenation():
+    """
+    Test the bytes and the length of a bytecode built by many additions, in both orders.
+    """
+    appended = Bytecode()
+    prepended = Bytecode()
+    for i in range(5000):
+        appended += Op.PUSH2[i]
+        prepended = Op.PUSH2[4999 - i] + prepended
+    expected = b"".join(bytes(Op.PUSH2[i]) for i in range(5000))
+    assert len(appended) == len(prepended) == len(expected)
+    assert bytes(appended) == bytes(prepended) == expected
+    assert appended == prepended
+    assert appended.keccak256() == prepended.keccak256()
+
+
+def test_bytecode_bytes_assignment():
+    """
+    Test that the length of a bytecode follows a direct assignment of its byte representation.
+    """
+    bytecode = Op.SSTORE(0, 1)
+    bytecode._bytes_ = b""
+    assert len(bytecode) == 0
+    bytecode._bytes_ = bytes(Op.STOP)
+    assert len(bytecode) == 1
+    assert len(bytecode + Op.STOP) == 2
+
+
+@pytest.mark.parametrize(
+    "args,expected,cached",
+    [
+        pytest.param((0, 1), "6001600052", True, id="small_ints"),
+        pytest.param(
+            (0x1234, -1, 2**255),
+            "7f8" + "0" * 63 + "7f" + "ff" * 32 + "61123452",
+            True,
+            id="large_ints",
+        ),
+        pytest.param(
+            ("0x01", b"\x00\x02", Address(3)), "60036002600152", True, id="bytes_strings"
+        ),
+        pytest.param((Op.GAS, Op.ADDRESS + Op.BALANCE), "30315a52", True, id="bytecode"),
+        pytest.param(([1, 2], 3), "6003610102" + "52", False, id="unhashable"),
+    ],
+)
+def test_opcode_call_cache(args: tuple, expected: str, cached: bool):
+    """
+    Test that calling an opcode with the same stack arguments twice produces the same bytecode,
+    reusing the memoized bytecode of the arguments if they are hashable.
+    """
+    first = Op.MSTORE(*args, unchecked=True)
+    hits = stack_arguments_cache_stats()["hits"]
+    second = Op.MSTORE(*args, unchecked=True)
+    assert stack_arguments_cache_stats()["hits"] - hits == (1 if cached else 0)
+    for bytecode in (first, second):
+        assert bytes(bytecode) == bytes.fromhex(expected)
+        assert bytecode.popped_stack_items == 0
+        assert bytecode.pushed_stack_items == len(args) - 2
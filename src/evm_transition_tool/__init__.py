@@ -8,6 +8,7 @@ from .evmone import EvmOneTransitionTool
 from .execution_specs import ExecutionSpecsTransitionTool
 from .geth import GethTransitionTool
 from .nimbus import NimbusTransitionTool
+from .result_cache import TransitionToolResultCache
 from .transition_tool import TransitionTool, TransitionToolNotFoundInPath, UnknownTransitionTool
 from .types import Result, TransitionToolOutput
 
@@ -23,6 +24,7 @@ __all__ = (
     "Result",
     "TransitionTool",
     "TransitionToolOutput",
+    "TransitionToolResultCache",
     "TransitionToolNotFoundInPath",
     "UnknownTransitionTool",
 )
@@ -10,10 +10,9 @@ import tempfile
 import textwrap
 from pathlib import Path
 from re import compile
-from typing import Any, List, Optional
-
-import requests
+from typing import Any, Dict, List, Optional
 
+from ethereum_test_base_types import StageProfiler, json_dumps
 from ethereum_test_forks import Fork
 from ethereum_test_types import Alloc, Environment, Transaction
 
@@ -33,6 +32,7 @@ class BesuTransitionTool(TransitionTool):
     trace: bool
     process: Optional[subprocess.Popen] = None
     server_url: str
+    server_timeout: float = 5
     besu_trace_dir: Optional[tempfile.TemporaryDirectory]
 
     def __init__(
@@ -86,6 +86,7 @@ class BesuTransitionTool(TransitionTool):
         """
         Stops the t8n-server process if it was started
         """
+        super().shutdown()
         if self.process:
             self.process.kill()
         if self.besu_trace_dir:
@@ -94,7 +95,7 @@ class BesuTransitionTool(TransitionTool):
     def evaluate(
         self,
         *,
-        alloc: Alloc,
+        alloc: Alloc | Dict[str, Any],
         txs: List[Transaction],
         env: Environment,
         fork: Fork,
@@ -117,11 +118,11 @@ class BesuTransitionTool(TransitionTool):
         if eips is not None:
             fork_name = "+".join([fork_name] + [str(eip) for eip in eips])
 
-        input_json = TransitionToolInput(
+        input_contents = TransitionToolInput(
             alloc=alloc,
             txs=txs,
             env=env,
-        ).model_dump(mode="json", **model_dump_config)
+        )
 
         state_json = {
             "fork": fork_name,
@@ -129,10 +130,18 @@ class BesuTransitionTool(TransitionTool):
             "reward": reward,
         }
 
-        post_data = {"state": state_json, "input": input_json}
+        with StageProfiler.stage(StageProfiler.T8N_SERIALIZATION):
+            post_data = (
+                b'{"state":'
+                + json_dumps(state_json)
+                + b',"input":'
+                + input_contents.model_dump_json(**model_dump_config).encode()
+                + b"}"
+            )
 
         if debug_output_path:
-            post_data_string = json.dumps(post_data, indent=4)
+            input_json = input_contents.model_dump(mode="json", **model_dump_config)
+            post_data_string = json.dumps({"state": state_json, "input": input_json}, indent=4)
             additional_indent = " " * 16  # for pretty indentation in t8n.sh
             indented_post_data_string = "{\n" + "\n".join(
                 additional_indent + line for line in post_data_string[1:].splitlines()
@@ -157,9 +166,18 @@ class BesuTransitionTool(TransitionTool):
                 },
             )
 
-        response = requests.post(self.server_url, json=post_data, timeout=5)
+        with StageProfiler.stage(StageProfiler.T8N_EXECUTION):
+            response = self.get_server_session().post(
+                self.server_url,
+                data=post_data,
+                headers={"Content-Type": "application/json"},
+                timeout=self.server_timeout,
+            )
         response.raise_for_status()  # exception visible in pytest failure output
-        output: TransitionToolOutput = TransitionToolOutput.model_validate(response.json())
+        with StageProfiler.stage(StageProfiler.T8N_OUTPUT_VALIDATION):
+            output: TransitionToolOutput = TransitionToolOutput.from_trusted_json(
+                response.content, strict=self.t8n_strict_output
+            )
 
         if debug_output_path:
             dump_files_to_directory(
@@ -87,6 +87,7 @@ class ExecutionSpecsTransitionTool(TransitionTool):
         """
         Stops the t8n-server process if it was started.
         """
+        super().shutdown()
         if self.process:
             self.process.terminate()
         if self.server_dir:
@@ -5,17 +5,26 @@ Methods to work with the filesystem and json
 import os
 import stat
 from json import dump
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, RootModel
 
+from ethereum_test_base_types import json_dumps
 
-def write_json_file(data: Dict[str, Any], file_path: str) -> None:
+
+def write_json_file(data: Dict[str, Any], file_path: str, indent: Optional[int] = 4) -> None:
     """
     Write a JSON file to the given path.
+
+    If `indent` is None, the file is written in its most compact form, which is
+    considerably faster for large files.
     """
+    if indent is None:
+        with open(file_path, "wb") as f:
+            f.write(json_dumps(data))
+        return
     with open(file_path, "w") as f:
-        dump(data, f, ensure_ascii=False, indent=4)
+        dump(data, f, ensure_ascii=False, indent=indent)
 
 
 def dump_files_to_directory(output_path: str, files: Dict[str, Any]) -> None:
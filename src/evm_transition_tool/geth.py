@@ -44,6 +44,7 @@ class GethTransitionTool(TransitionTool):
     cached_version: Optional[str] = None
     trace: bool
     t8n_use_stream = True
+    t8n_stream_prespawn = True
 
     def __init__(
         self,
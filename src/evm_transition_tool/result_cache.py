@@ -0,0 +1,141 @@
+"""
+Content-addressed, on-disk cache of transition tool results.
+
+Results are stored as one JSON file per evaluation, named after the hash of everything that
+determines the output of the transition tool: its version, the fork (including any EIPs),
+the chain ID, the block reward and the full input (alloc, txs, env and verkle tree).
+
+The cache directory can be shared between xdist workers and between fill sessions: entries
+are written atomically and the eviction of the least recently used entries, once the
+configured size is exceeded, is serialized with a file lock.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from filelock import FileLock
+from pydantic import ValidationError
+
+from .types import TransitionToolOutput
+
+CACHE_FILE_SUFFIX = ".json"
+
+
+@dataclass(kw_only=True)
+class TransitionToolResultCache:
+    """
+    Size-bounded LRU cache of transition tool outputs, keyed by the hash of their inputs.
+    """
+
+    directory: Path
+    max_size_bytes: int
+    eviction_interval: int = 256
+    hits: int = 0
+    misses: int = 0
+    _writes_since_eviction: int = field(default=0, repr=False)
+
+    def __post_init__(self):
+        """
+        Create the cache directory if it doesn't exist.
+        """
+        self.directory = Path(self.directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(
+        *,
+        t8n_version: str,
+        fork_name: str,
+        chain_id: int,
+        reward: int,
+        input_json: bytes,
+    ) -> str:
+        """
+        Return the cache key of a transition tool evaluation.
+        """
+        hasher = sha256()
+        for part in (t8n_version, fork_name, str(chain_id), str(reward)):
+            hasher.update(part.encode())
+            hasher.update(b"\x00")
+        hasher.update(input_json)
+        return hasher.hexdigest()
+
+    def path(self, key: str) -> Path:
+        """
+        Return the path of the cache entry for the given key.
+        """
+        return self.directory / key[:2] / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def get(self, key: str, *, strict: bool = False) -> Optional[TransitionToolOutput]:
+        """
+        Return the cached output for the given key, or None if it's not in the cache.
+
+        The output is parsed like the output of the transition tool, so unless `strict` is
+        set its fields are only validated when accessed.
+        """
+        path = self.path(key)
+        try:
+            contents = path.read_bytes()
+            output = TransitionToolOutput.from_trusted_json(contents, strict=strict)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (json.JSONDecodeError, ValidationError):
+            # Corrupt or outdated entry, remove it and re-evaluate.
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        try:
+            # Mark the entry as recently used for the LRU eviction.
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.hits += 1
+        return output
+
+    def put(self, key: str, output: TransitionToolOutput) -> None:
+        """
+        Store the output of a transition tool evaluation in the cache.
+        """
+        path = self.path(key)
+        path.parent.mkdir(exist_ok=True)
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        temp_path.write_bytes(output.dump_json())
+        os.replace(temp_path, path)
+        self._writes_since_eviction += 1
+        if self._writes_since_eviction >= self.eviction_interval:
+            self._writes_since_eviction = 0
+            self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits in its maximum size.
+        """
+        with FileLock(self.directory / "eviction.lock"):
+            entries: List[Tuple[float, int, Path]] = []
+            total_size = 0
+            for path in self.directory.glob(f"*/*{CACHE_FILE_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total_size += stat.st_size
+            if total_size <= self.max_size_bytes:
+                return
+            entries.sort()
+            for _, size, path in entries:
+                path.unlink(missing_ok=True)
+                total_size -= size
+                if total_size <= self.max_size_bytes:
+                    break
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the hit and miss counters of the cache.
+        """
+        return {"hits": self.hits, "misses": self.misses}
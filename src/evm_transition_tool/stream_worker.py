@@ -0,0 +1,121 @@
+"""
+Pool of pre-spawned transition tool processes used in stream mode.
+
+Stream-mode tools such as geth's `evm t8n` read a single request from stdin, write the
+response to stdout and exit, so a process can't be re-used for several evaluations.
+Instead, the pool keeps a spare process running for each recently used set of arguments:
+the process start-up and runtime initialization of the next call then overlap with the
+Python-side work in-between calls, and only the evaluation itself is left on the critical
+path.
+"""
+
+import subprocess
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+
+@dataclass(kw_only=True)
+class StreamWorkerStats:
+    """
+    Per-call latency statistics of the stream workers.
+    """
+
+    calls: int = 0
+    prespawned_calls: int = 0
+    restarts: int = 0
+    total_seconds: float = 0.0
+
+    def record(self, elapsed: float, prespawned: bool) -> None:
+        """
+        Record the latency of a single call.
+        """
+        self.calls += 1
+        if prespawned:
+            self.prespawned_calls += 1
+        self.total_seconds += elapsed
+
+    def counters(self) -> Dict[str, int]:
+        """
+        Return the statistics as integer counters that can be added up across workers.
+        """
+        return {
+            "calls": self.calls,
+            "prespawned_calls": self.prespawned_calls,
+            "restarts": self.restarts,
+            "total_microseconds": round(self.total_seconds * 1_000_000),
+        }
+
+
+@dataclass(kw_only=True)
+class StreamWorkerPool:
+    """
+    Keeps up to `max_spare_processes` idle transition tool processes alive, one per
+    distinct command line, ready to receive their input on stdin.
+    """
+
+    max_spare_processes: int = 4
+    stats: StreamWorkerStats = field(default_factory=StreamWorkerStats)
+    _spares: "OrderedDict[Tuple[str, ...], subprocess.Popen]" = field(default_factory=OrderedDict)
+
+    @staticmethod
+    def _spawn(args: Tuple[str, ...]) -> subprocess.Popen:
+        return subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    @staticmethod
+    def _kill(process: subprocess.Popen) -> None:
+        if process.poll() is None:
+            process.kill()
+        process.communicate()
+
+    def _take(self, args: Tuple[str, ...]) -> Tuple[subprocess.Popen, bool]:
+        """
+        Return a process for the given arguments, re-using the spare one if it's still alive.
+        """
+        process = self._spares.pop(args, None)
+        if process is not None:
+            if process.poll() is None:
+                return process, True
+            # The spare process died while waiting for its input, start a fresh one.
+            self.stats.restarts += 1
+            process.communicate()
+        return self._spawn(args), False
+
+    def _replenish(self, args: Tuple[str, ...]) -> None:
+        """
+        Start a spare process for the given arguments, evicting the least recently used
+        spare if the pool is full.
+        """
+        while len(self._spares) >= self.max_spare_processes:
+            _, evicted = self._spares.popitem(last=False)
+            self._kill(evicted)
+        self._spares[args] = self._spawn(args)
+
+    def run(self, args: List[str], input: bytes) -> subprocess.CompletedProcess:
+        """
+        Feed `input` to a transition tool process started with `args` and wait for it to
+        finish, leaving a spare process with the same arguments for the next call.
+        """
+        key = tuple(args)
+        start = time.perf_counter()
+        process, prespawned = self._take(key)
+        self._replenish(key)
+        stdout, stderr = process.communicate(input=input)
+        self.stats.record(time.perf_counter() - start, prespawned)
+        return subprocess.CompletedProcess(
+            args=args, returncode=process.returncode, stdout=stdout, stderr=stderr
+        )
+
+    def shutdown(self) -> None:
+        """
+        Kill all spare processes.
+        """
+        while self._spares:
+            _, process = self._spares.popitem()
+            self._kill(process)
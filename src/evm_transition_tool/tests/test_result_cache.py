@@ -0,0 +1,121 @@
+"""
+Test the transition tool result cache.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from evm_transition_tool import TransitionToolOutput, TransitionToolResultCache
+
+
+@pytest.fixture
+def output() -> TransitionToolOutput:
+    """
+    Minimal transition tool output.
+    """
+    return TransitionToolOutput.model_validate(
+        {
+            "alloc": {
+                "0x0000000000000000000000000000000000000100": {
+                    "nonce": "0x1",
+                    "balance": "0x10",
+                    "storage": {"0x01": "0x02"},
+                },
+            },
+            "result": {
+                "stateRoot": "0x" + "01" * 32,
+                "sha3Uncles": "0x" + "02" * 32,
+                "txRoot": "0x" + "03" * 32,
+                "receiptsRoot": "0x" + "04" * 32,
+                "logsHash": "0x" + "05" * 32,
+                "logsBloom": "0x" + "00" * 256,
+                "receipts": [],
+                "gasUsed": "0x0",
+            },
+            "body": "0xc0",
+        }
+    )
+
+
+def cache_key(input_json: bytes = b"{}", **kwargs) -> str:
+    """
+    Return a cache key with default values for the unspecified parameters.
+    """
+    key_parameters = {"t8n_version": "evm 1.0", "fork_name": "Cancun", "chain_id": 1, "reward": 0}
+    key_parameters.update(kwargs)
+    return TransitionToolResultCache.key(input_json=input_json, **key_parameters)
+
+
+def test_key():
+    """
+    Test that every parameter of an evaluation is part of the cache key.
+    """
+    assert cache_key() == cache_key()
+    assert cache_key() != cache_key(input_json=b'{"alloc": {}}')
+    assert cache_key() != cache_key(t8n_version="evm 1.1")
+    assert cache_key() != cache_key(fork_name="Prague")
+    assert cache_key() != cache_key(chain_id=2)
+    assert cache_key() != cache_key(reward=-1)
+
+
+def test_get_put(tmp_path: Path, output: TransitionToolOutput):
+    """
+    Test that a stored output is returned unchanged and that hits and misses are counted.
+    """
+    cache = TransitionToolResultCache(directory=tmp_path, max_size_bytes=1024 * 1024)
+    key = cache_key()
+    assert cache.get(key) is None
+    cache.put(key, output)
+    cached_output = cache.get(key)
+    assert cached_output is not None
+    assert cached_output.model_dump_json() == output.model_dump_json()
+    assert cache.stats() == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.parametrize("strict", [False, True])
+def test_get_validation(tmp_path: Path, output: TransitionToolOutput, strict: bool):
+    """
+    Test that the fields of a cached output are only validated on access unless `strict` is
+    set.
+    """
+    cache = TransitionToolResultCache(directory=tmp_path, max_size_bytes=1024 * 1024)
+    key = cache_key()
+    cache.put(key, output)
+    cached_output = cache.get(key, strict=strict)
+    assert cached_output is not None
+    assert ("alloc" in cached_output.__dict__) == strict
+
+
+def test_corrupt_entry(tmp_path: Path, output: TransitionToolOutput):
+    """
+    Test that a corrupt entry is treated as a miss and removed.
+    """
+    cache = TransitionToolResultCache(directory=tmp_path, max_size_bytes=1024 * 1024)
+    key = cache_key()
+    cache.put(key, output)
+    cache.path(key).write_text("{")
+    assert cache.get(key) is None
+    assert not cache.path(key).exists()
+    cache.put(key, output)
+    cache.path(key).write_text("{}")
+    assert cache.get(key) is None
+    assert not cache.path(key).exists()
+
+
+def test_evict(tmp_path: Path, output: TransitionToolOutput):
+    """
+    Test that the least recently used entries are evicted first.
+    """
+    cache = TransitionToolResultCache(directory=tmp_path, max_size_bytes=1024 * 1024)
+    keys = [cache_key(input_json=str(i).encode()) for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, output)
+        os.utime(cache.path(key), (i, i))
+    entry_size = cache.path(keys[0]).stat().st_size
+    cache.max_size_bytes = 2 * entry_size
+    cache.evict()
+    assert not cache.path(keys[0]).exists()
+    assert cache.path(keys[1]).exists()
+    assert cache.path(keys[2]).exists()
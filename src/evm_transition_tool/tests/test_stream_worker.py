@@ -0,0 +1,62 @@
+"""
+Test the pool of pre-spawned stream-mode transition tool processes.
+"""
+
+import shutil
+
+import pytest
+
+from evm_transition_tool.stream_worker import StreamWorkerPool
+
+pytestmark = pytest.mark.skipif(shutil.which("cat") is None, reason="`cat` is not available")
+
+
+def test_stream_worker_pool_reuses_spare_process():
+    """
+    Test that consecutive calls with the same arguments use the pre-spawned process.
+    """
+    pool = StreamWorkerPool()
+    try:
+        for i in range(3):
+            result = pool.run(["cat"], input=f"request {i}".encode())
+            assert result.returncode == 0
+            assert result.stdout == f"request {i}".encode()
+        assert pool.stats.calls == 3
+        assert pool.stats.prespawned_calls == 2
+        assert pool.stats.restarts == 0
+        counters = pool.stats.counters()
+        assert counters["calls"] == 3
+        assert counters["total_microseconds"] > 0
+    finally:
+        pool.shutdown()
+    assert not pool._spares
+
+
+def test_stream_worker_pool_restarts_dead_process():
+    """
+    Test that a spare process that exited before receiving its input is replaced.
+    """
+    pool = StreamWorkerPool()
+    try:
+        pool.run(["cat"], input=b"")
+        pool._spares[("cat",)].kill()
+        pool._spares[("cat",)].wait()
+        result = pool.run(["cat"], input=b"request")
+        assert result.stdout == b"request"
+        assert pool.stats.restarts == 1
+        assert pool.stats.prespawned_calls == 0
+    finally:
+        pool.shutdown()
+
+
+def test_stream_worker_pool_evicts_least_recently_used():
+    """
+    Test that the number of spare processes is bounded.
+    """
+    pool = StreamWorkerPool(max_spare_processes=2)
+    try:
+        for args in (["cat"], ["cat", "-"], ["cat", "-u"]):
+            pool.run(args, input=b"request")
+        assert list(pool._spares.keys()) == [("cat", "-"), ("cat", "-u")]
+    finally:
+        pool.shutdown()
@@ -0,0 +1,117 @@
+"""
+Test the transition tool output types.
+"""
+
+import json
+from typing import Any, Dict
+
+import pytest
+from pydantic import ValidationError
+
+from ethereum_test_base_types import Address, Hash
+from ethereum_test_types import Account, Alloc, Environment
+from evm_transition_tool import TransitionToolOutput
+from evm_transition_tool.types import TransitionToolInput
+
+RAW_OUTPUT: Dict[str, Any] = {
+    "alloc": {
+        "0x0000000000000000000000000000000000000100": {
+            "nonce": "0x1",
+            "balance": "0x10",
+            "storage": {"0x01": "0x02"},
+        },
+    },
+    "result": {
+        "stateRoot": "0x" + "01" * 32,
+        "sha3Uncles": "0x" + "02" * 32,
+        "txRoot": "0x" + "03" * 32,
+        "receiptsRoot": "0x" + "04" * 32,
+        "logsHash": "0x" + "05" * 32,
+        "logsBloom": "0x" + "00" * 256,
+        "receipts": [],
+        "gasUsed": "0x0",
+    },
+    "body": "0xc0",
+}
+
+
+def test_lazy_output():
+    """
+    Test that the fields of a lazily parsed output are validated on first access, and that
+    the validated output is the same as the one parsed in strict mode.
+    """
+    output = TransitionToolOutput.from_trusted_json(json.dumps(RAW_OUTPUT))
+    assert output.__dict__ == {}
+    assert output.result.state_root == Hash("0x" + "01" * 32)
+    assert list(output.__dict__) == ["result"]
+    assert output.vkt is None
+    assert output.alloc[Address(0x100)] == Account(nonce=1, balance=0x10, storage={1: 2})
+
+    strict_output = TransitionToolOutput.from_trusted_json(json.dumps(RAW_OUTPUT), strict=True)
+    assert output.model_dump_json() == strict_output.model_dump_json()
+    assert output.model_fields_set == strict_output.model_fields_set
+
+
+def test_lazy_output_raw_alloc():
+    """
+    Test that the raw alloc is returned until the alloc is validated, and that the expected
+    post can be verified against it.
+    """
+    output = TransitionToolOutput.from_trusted_json(json.dumps(RAW_OUTPUT))
+    assert output.raw_alloc() == RAW_OUTPUT["alloc"]
+    Alloc({Address(0x100): Account(nonce=1)}).verify_post_alloc(output.raw_alloc())
+    assert "alloc" not in output.__dict__
+
+    assert isinstance(output.alloc, Alloc)
+    assert output.raw_alloc() is output.alloc
+
+    strict_output = TransitionToolOutput.from_trusted_json(json.dumps(RAW_OUTPUT), strict=True)
+    assert strict_output.raw_alloc() is strict_output.alloc
+
+
+def test_input_raw_alloc():
+    """
+    Test that the raw alloc of an output is passed to the next evaluation as it is, without
+    being validated, and that a validated alloc is kept as it is.
+    """
+    output = TransitionToolOutput.from_trusted_json(json.dumps(RAW_OUTPUT))
+    raw_input = TransitionToolInput(alloc=output.raw_alloc(), txs=[], env=Environment())
+    assert not isinstance(raw_input.alloc, Alloc)
+    assert json.loads(raw_input.model_dump_json())["alloc"] == RAW_OUTPUT["alloc"]
+    assert "alloc" not in output.__dict__
+
+    validated_input = TransitionToolInput(alloc=output.alloc, txs=[], env=Environment())
+    assert validated_input.alloc is output.alloc
+
+
+def test_lazy_output_invalid_field():
+    """
+    Test that an invalid field is only reported when accessed, unless in strict mode.
+    """
+    raw_output = RAW_OUTPUT | {"body": "0xzz"}
+    output = TransitionToolOutput.from_trusted_json(json.dumps(raw_output))
+    assert output.result.gas_used == 0
+    with pytest.raises(ValidationError):
+        output.body
+    with pytest.raises(ValidationError):
+        TransitionToolOutput.from_trusted_json(json.dumps(raw_output), strict=True)
+
+
+def test_lazy_output_missing_field():
+    """
+    Test that a missing required field is reported when the output is parsed.
+    """
+    with pytest.raises(ValidationError):
+        TransitionToolOutput.from_trusted_json(json.dumps({"alloc": RAW_OUTPUT["alloc"]}))
+
+
+@pytest.mark.parametrize("strict", [False, True])
+def test_dump_json(strict: bool):
+    """
+    Test that the dumped output can be validated again.
+    """
+    output = TransitionToolOutput.from_trusted_json(json.dumps(RAW_OUTPUT), strict=strict)
+    assert (
+        TransitionToolOutput.model_validate_json(output.dump_json()).model_dump_json()
+        == output.model_dump_json()
+    )
@@ -8,22 +8,31 @@ import shutil
 import subprocess
 import tempfile
 import textwrap
+import time
 from abc import abstractmethod
 from dataclasses import dataclass, field
 from itertools import groupby
 from pathlib import Path
 from re import Pattern
-from typing import Dict, List, Mapping, Optional, Tuple, Type
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type
 
 from requests_unixsocket import Session  # type: ignore
 
-from ethereum_test_base_types import Address, Alloc, ZeroPaddedHexNumber
+from ethereum_test_base_types import (
+    Address,
+    Alloc,
+    StageProfiler,
+    ZeroPaddedHexNumber,
+    json_dumps,
+)
 from ethereum_test_fixtures import FixtureFormat, FixtureVerifier
 from ethereum_test_forks import Fork
 from ethereum_test_types import Environment, Transaction
 from ethereum_test_types.verkle import StateDiff, Stem, VerkleTree, WitnessCheck
 
 from .file_utils import dump_files_to_directory, write_json_file
+from .result_cache import TransitionToolResultCache
+from .stream_worker import StreamWorkerPool
 from .types import TransactionReceipt, TransitionToolInput, TransitionToolOutput
 
 
@@ -66,9 +75,17 @@ class TransitionTool(FixtureVerifier):
     verkle_subcommand: Optional[str] = None
     cached_version: Optional[str] = None
     t8n_use_stream: bool = False
+    t8n_stream_prespawn: bool = False
+    stream_workers: Optional[StreamWorkerPool] = None
+    result_cache: Optional[TransitionToolResultCache] = None
+    t8n_strict_output: bool = False
 
     t8n_use_server: bool = False
     server_url: str
+    server_timeout: float = 20
+    server_session: Optional[Session] = None
+    scratch_base_dir: Optional[Path] = None
+    scratch_dir: Optional[tempfile.TemporaryDirectory] = None
     process: Optional[subprocess.Popen] = None
 
     # Abstract methods that each tool must implement
@@ -211,7 +228,24 @@ class TransitionTool(FixtureVerifier):
         """
         Perform any cleanup tasks related to the tested tool.
         """
-        pass
+        if self.stream_workers is not None:
+            self.stream_workers.shutdown()
+            self.stream_workers = None
+        if self.server_session is not None:
+            self.server_session.close()
+            self.server_session = None
+        if self.scratch_dir is not None:
+            self.scratch_dir.cleanup()
+            self.scratch_dir = None
+
+    def get_server_session(self) -> Session:
+        """
+        Returns the session used to send requests to the t8n-server, which keeps the
+        connections to the server open between evaluations.
+        """
+        if self.server_session is None:
+            self.server_session = Session()
+        return self.server_session
 
     def reset_traces(self):
         """
@@ -263,7 +297,7 @@ class TransitionTool(FixtureVerifier):
         Transition tool files and data to pass between methods
         """
 
-        alloc: Alloc
+        alloc: Alloc | Dict[str, Any]
         txs: List[Transaction]
         env: Environment
         fork_name: str
@@ -279,29 +313,56 @@ class TransitionTool(FixtureVerifier):
                 alloc=self.alloc, txs=self.txs, env=self.env, vkt=self.vkt
             )
 
+    def reset_scratch_dir(self) -> tempfile.TemporaryDirectory:
+        """
+        Returns an empty directory, containing only empty `input` and `output`
+        sub-directories, to be used by the transition tool in filesystem mode.
+
+        The same directory is re-used by all evaluations of the tool instance, and is
+        created in `scratch_base_dir` (e.g. a tmpfs such as `/dev/shm`) if it's set.
+        """
+        if self.scratch_dir is None:
+            self.scratch_dir = tempfile.TemporaryDirectory(
+                prefix="t8n-", dir=self.scratch_base_dir
+            )
+        for entry in os.scandir(self.scratch_dir.name):
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.remove(entry.path)
+        os.mkdir(os.path.join(self.scratch_dir.name, "input"))
+        os.mkdir(os.path.join(self.scratch_dir.name, "output"))
+        return self.scratch_dir
+
     def _evaluate_filesystem(
         self,
         *,
         t8n_data: TransitionToolData,
+        input_json: bytes | None = None,
         debug_output_path: str = "",
     ) -> TransitionToolOutput:
         """
         Executes a transition tool using the filesystem for its inputs and outputs.
         """
-        temp_dir = tempfile.TemporaryDirectory()
-        os.mkdir(os.path.join(temp_dir.name, "input"))
-        os.mkdir(os.path.join(temp_dir.name, "output"))
+        temp_dir = self.reset_scratch_dir()
 
-        input_contents = t8n_data.to_input().model_dump(
-            mode="json", **model_dump_config
-        )
+        with StageProfiler.stage(StageProfiler.T8N_SERIALIZATION):
+            if input_json is not None:
+                input_contents = json.loads(input_json)
+            else:
+                input_contents = t8n_data.to_input().model_dump(
+                    mode="json", **model_dump_config
+                )
 
-        input_paths = {
-            k: os.path.join(temp_dir.name, "input", f"{k}.json")
-            for k in input_contents.keys()
-        }
-        for key, file_path in input_paths.items():
-            write_json_file(input_contents[key], file_path)
+            input_paths = {
+                k: os.path.join(temp_dir.name, "input", f"{k}.json")
+                for k in input_contents.keys()
+            }
+            # Only indent the input files if they are going to be copied to the debug
+            # output.
+            indent = 4 if debug_output_path else None
+            for key, file_path in input_paths.items():
+                write_json_file(input_contents[key], file_path, indent=indent)
 
         output_paths = {
             output: os.path.join("output", f"{output}.json")
@@ -355,11 +416,12 @@ class TransitionTool(FixtureVerifier):
         if self.trace:
             args.append("--trace")
 
-        result = subprocess.run(
-            args,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        with StageProfiler.stage(StageProfiler.T8N_EXECUTION):
+            result = subprocess.run(
+                args,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
 
         if debug_output_path:
             if os.path.exists(debug_output_path):
@@ -402,44 +464,49 @@ class TransitionTool(FixtureVerifier):
         for key, file_path in output_paths.items():
             output_paths[key] = os.path.join(temp_dir.name, file_path)
 
-        output_contents = {}
-        for key, file_path in output_paths.items():
-            if "txs.rlp" in file_path:
-                continue
-            with open(file_path, "r+") as file:
-                output_contents[key] = json.load(file)
-        output = TransitionToolOutput(**output_contents)
+        # Join the raw outputs into a single json document to validate it in one pass.
+        with StageProfiler.stage(StageProfiler.T8N_OUTPUT_VALIDATION):
+            output_contents: List[bytes] = []
+            for key, file_path in output_paths.items():
+                if "txs.rlp" in file_path:
+                    continue
+                with open(file_path, "rb") as file:
+                    output_contents.append(b'"' + key.encode() + b'":' + file.read())
+            output = TransitionToolOutput.from_trusted_json(
+                b"{" + b",".join(output_contents) + b"}", strict=self.t8n_strict_output
+            )
         if self.trace:
             self.collect_traces(output.result.receipts, temp_dir, debug_output_path)
 
-        temp_dir.cleanup()
-
         return output
 
     def _evaluate_server(
         self,
         *,
         t8n_data: TransitionToolData,
+        input_json: bytes | None = None,
         debug_output_path: str = "",
     ) -> TransitionToolOutput:
         """
         Executes the transition tool sending inputs and outputs via a server.
         """
-        input_contents = t8n_data.to_input()
-        input_json = input_contents.model_dump(mode="json", **model_dump_config)
-        post_data = {
-            "state": {
-                "fork": t8n_data.fork_name,
-                "chainid": t8n_data.chain_id,
-                "reward": t8n_data.reward,
-            },
-            "input": input_json,
-        }
+        with StageProfiler.stage(StageProfiler.T8N_SERIALIZATION):
+            input_contents = t8n_data.to_input()
+            state_json = json_dumps(
+                {
+                    "fork": t8n_data.fork_name,
+                    "chainid": t8n_data.chain_id,
+                    "reward": t8n_data.reward,
+                }
+            )
+            if input_json is None:
+                input_json = input_contents.model_dump_json(**model_dump_config).encode()
+            post_data = b'{"state":' + state_json + b',"input":' + input_json + b"}"
 
         if debug_output_path:
             request_info = (
                 f"Server URL: {self.server_url}\n\n"
-                f"Request Data:\n{json.dumps(post_data, indent=2)}\n"
+                f"Request Data:\n{json.dumps(json.loads(post_data), indent=2)}\n"
             )
             dump_files_to_directory(
                 debug_output_path,
@@ -454,7 +521,13 @@ class TransitionTool(FixtureVerifier):
                 },
             )
 
-        response = Session().post(self.server_url, json=post_data, timeout=20)
+        with StageProfiler.stage(StageProfiler.T8N_EXECUTION):
+            response = self.get_server_session().post(
+                self.server_url,
+                data=post_data,
+                headers={"Content-Type": "application/json"},
+                timeout=self.server_timeout,
+            )
         response.raise_for_status()  # exception visible in pytest failure output
         if response.status_code != 200:
             raise Exception(
@@ -462,9 +535,10 @@ class TransitionTool(FixtureVerifier):
                 f"response: {response.text}"
             )
 
-        output: TransitionToolOutput = TransitionToolOutput.model_validate(
-            response.json()
-        )
+        with StageProfiler.stage(StageProfiler.T8N_OUTPUT_VALIDATION):
+            output: TransitionToolOutput = TransitionToolOutput.from_trusted_json(
+                response.content, strict=self.t8n_strict_output
+            )
 
         if debug_output_path:
             response_info = (
@@ -488,6 +562,7 @@ class TransitionTool(FixtureVerifier):
         self,
         *,
         t8n_data: TransitionToolData,
+        input_json: bytes | None = None,
         debug_output_path: str = "",
     ) -> TransitionToolOutput:
         """
@@ -496,29 +571,47 @@ class TransitionTool(FixtureVerifier):
         temp_dir = tempfile.TemporaryDirectory()
         args = self.construct_args_stream(t8n_data, temp_dir)
 
-        stdin = t8n_data.to_input()
+        with StageProfiler.stage(StageProfiler.T8N_SERIALIZATION):
+            stdin = t8n_data.to_input()
+            stdin_bytes = (
+                input_json
+                if input_json is not None
+                else stdin.model_dump_json(**model_dump_config).encode()
+            )
 
-        result = subprocess.run(
-            args,
-            input=stdin.model_dump_json(**model_dump_config).encode(),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        start_time = time.perf_counter()
+        with StageProfiler.stage(StageProfiler.T8N_EXECUTION):
+            # Traces are written to a per-call directory, so the arguments can't be known
+            # before the call and the process can't be started in advance.
+            if self.t8n_stream_prespawn and not self.trace:
+                if self.stream_workers is None:
+                    self.stream_workers = StreamWorkerPool()
+                result = self.stream_workers.run(args, input=stdin_bytes)
+            else:
+                result = subprocess.run(
+                    args,
+                    input=stdin_bytes,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                )
+        elapsed_time = time.perf_counter() - start_time
 
         self.dump_debug_stream(debug_output_path, temp_dir, stdin, args, result)
 
         if result.returncode != 0:
             raise Exception("failed to evaluate: " + result.stderr.decode())
 
-        output: TransitionToolOutput = TransitionToolOutput.model_validate_json(
-            result.stdout
-        )
+        with StageProfiler.stage(StageProfiler.T8N_OUTPUT_VALIDATION):
+            output: TransitionToolOutput = TransitionToolOutput.from_trusted_json(
+                result.stdout, strict=self.t8n_strict_output
+            )
 
         if debug_output_path:
             files_to_dump = {
                 "output/alloc.json": output.alloc,
                 "output/result.json": output.result,
                 "output/txs.rlp": str(output.body),
+                "time_elapsed_seconds.txt": str(elapsed_time),
             }
             # Only dump verkle if present
             if output.vkt:
@@ -623,7 +716,7 @@ class TransitionTool(FixtureVerifier):
     def evaluate(
         self,
         *,
-        alloc: Alloc,
+        alloc: Alloc | Dict[str, Any],
         txs: List[Transaction],
         env: Environment,
         fork: Fork,
@@ -638,10 +731,10 @@ class TransitionTool(FixtureVerifier):
 
         If a client's `t8n` tool varies from the default behavior, this method
         can be overridden.
-        """
-        if not self.process:
-            self.start_server()
 
+        If a result cache is configured, the tool is only executed if the same inputs were
+        not evaluated before by the same tool version.
+        """
         fork_name = fork.transition_tool_name(
             block_number=env.number,
             timestamp=env.timestamp,
@@ -660,18 +753,57 @@ class TransitionTool(FixtureVerifier):
             reward=reward,
         )
 
+        # Traces and debug output are only produced by actually running the tool.
+        if self.result_cache is None or self.trace or debug_output_path:
+            return self._evaluate_t8n_data(
+                t8n_data=t8n_data, debug_output_path=debug_output_path
+            )
+
+        with StageProfiler.stage(StageProfiler.T8N_SERIALIZATION):
+            input_json = t8n_data.to_input().model_dump_json(**model_dump_config).encode()
+        cache_key = self.result_cache.key(
+            t8n_version=self.version(),
+            fork_name=t8n_data.fork_name,
+            chain_id=t8n_data.chain_id,
+            reward=t8n_data.reward,
+            input_json=input_json,
+        )
+        with StageProfiler.stage(StageProfiler.T8N_OUTPUT_VALIDATION):
+            output = self.result_cache.get(cache_key, strict=self.t8n_strict_output)
+        if output is None:
+            # The input is not serialized again for the tool.
+            output = self._evaluate_t8n_data(t8n_data=t8n_data, input_json=input_json)
+            self.result_cache.put(cache_key, output)
+        return output
+
+    def _evaluate_t8n_data(
+        self,
+        *,
+        t8n_data: TransitionToolData,
+        input_json: bytes | None = None,
+        debug_output_path: str = "",
+    ) -> TransitionToolOutput:
+        """
+        Executes the transition tool using the interaction mode supported by the tool.
+
+        `input_json` is the already serialized input of `t8n_data`, if available.
+        """
+        if not self.process:
+            self.start_server()
+
         if self.t8n_use_server:
             return self._evaluate_server(
-                t8n_data=t8n_data, debug_output_path=debug_output_path
+                t8n_data=t8n_data, input_json=input_json, debug_output_path=debug_output_path
             )
 
         if self.t8n_use_stream:
             return self._evaluate_stream(
-                t8n_data=t8n_data, debug_output_path=debug_output_path
+                t8n_data=t8n_data, input_json=input_json, debug_output_path=debug_output_path
             )
 
         return self._evaluate_filesystem(
             t8n_data=t8n_data,
+            input_json=input_json,
             debug_output_path=debug_output_path,
         )
 
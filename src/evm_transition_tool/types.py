@@ -2,11 +2,21 @@
 Types used in the transition tool interactions.
 """
 
-from typing import List
-
-from pydantic import Field
-
-from ethereum_test_base_types import Address, Bloom, Bytes, CamelModel, Hash, HexNumber
+import json
+from typing import Any, Dict, List
+
+from pydantic import Field, PrivateAttr
+
+from ethereum_test_base_types import (
+    Address,
+    Bloom,
+    Bytes,
+    CamelModel,
+    Hash,
+    HexNumber,
+    StageProfiler,
+    json_dumps,
+)
 from ethereum_test_types import (
     Alloc,
     ConsolidationRequest,
@@ -117,9 +127,12 @@ class Result(CamelModel):
 class TransitionToolInput(CamelModel):
     """
     Transition tool input
+
+    The alloc can also be the raw alloc of a previous transition tool output, which is passed
+    to the tool without being validated.
     """
 
-    alloc: Alloc
+    alloc: Dict[str, Any] | Alloc = Field(..., union_mode="left_to_right")
     txs: List[Transaction]
     env: Environment
     vkt: VerkleTree | None = None
@@ -128,6 +141,9 @@ class TransitionToolInput(CamelModel):
 class TransitionToolOutput(CamelModel):
     """
     Transition tool output
+
+    Outputs parsed with `from_trusted_json` keep the decoded JSON and only validate each
+    field the first time it's accessed.
     """
 
     alloc: Alloc
@@ -135,3 +151,98 @@ class TransitionToolOutput(CamelModel):
     body: Bytes | None = None
     vkt: VerkleTree | None = None
     witness: Witness | None = None
+
+    _raw_output: Dict[str, Any] | None = PrivateAttr(None)
+
+    @classmethod
+    def from_trusted_json(
+        cls, json_data: str | bytes, *, strict: bool = False
+    ) -> "TransitionToolOutput":
+        """
+        Parse the output of a transition tool.
+
+        Unless `strict` is set, the JSON is only decoded, and the fields are validated on
+        first access, which skips the validation of the large parts of the output that are
+        never used (e.g. the accounts of the alloc that are not part of the expected post).
+        """
+        if strict:
+            return cls.model_validate_json(json_data)
+        raw_output = json.loads(json_data)
+        if not isinstance(raw_output, dict) or any(
+            cls.field_key(name) not in raw_output
+            for name, field_info in cls.model_fields.items()
+            if field_info.is_required()
+        ):
+            # Let pydantic describe what's wrong with the output.
+            return cls.model_validate(raw_output)
+        output = cls.model_construct()
+        output.__dict__.clear()
+        output._raw_output = raw_output
+        return output
+
+    @classmethod
+    def field_key(cls, name: str) -> str:
+        """
+        Return the key of the given field in the JSON output of the transition tool.
+        """
+        field_info = cls.model_fields[name]
+        if isinstance(field_info.validation_alias, str):
+            return field_info.validation_alias
+        return field_info.alias or name
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Validate a field of a lazily parsed output the first time it's accessed.
+        """
+        if name not in type(self).model_fields or self._raw_output is None:
+            return super().__getattr__(name)  # type: ignore[misc]
+        key = self.field_key(name)
+        if key not in self._raw_output:
+            self.__dict__[name] = type(self).model_fields[name].get_default()
+        else:
+            with StageProfiler.stage(StageProfiler.T8N_OUTPUT_VALIDATION):
+                self.__pydantic_validator__.validate_assignment(self, name, self._raw_output[key])
+        return self.__dict__[name]
+
+    def validate_fields(self) -> "TransitionToolOutput":
+        """
+        Validate all the fields of a lazily parsed output that haven't been accessed yet.
+        """
+        if self._raw_output is not None:
+            # Keep the fields in the order in which they are declared, as when validated.
+            fields = {name: getattr(self, name) for name in type(self).model_fields}
+            self.__dict__.clear()
+            self.__dict__.update(fields)
+        return self
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Dump the output, validating the fields of a lazily parsed output first.
+        """
+        return super(TransitionToolOutput, self.validate_fields()).model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """
+        Dump the output as JSON, validating the fields of a lazily parsed output first.
+        """
+        return super(TransitionToolOutput, self.validate_fields()).model_dump_json(**kwargs)
+
+    def raw_alloc(self) -> "Alloc | Dict[str, Any]":
+        """
+        Return the output alloc as decoded from the JSON output if it hasn't been validated,
+        e.g. to verify the post state validating only the expected accounts.
+        """
+        if self._raw_output is None or "alloc" in self.__dict__:
+            return self.alloc
+        return self._raw_output[self.field_key("alloc")]
+
+    def dump_json(self) -> bytes:
+        """
+        Serialize the output so that it can be parsed again, without validating the fields
+        of a lazily parsed output.
+        """
+        if self._raw_output is not None:
+            return json_dumps(self._raw_output)
+        # Fields are dumped by name instead of alias because not all aliases of the output
+        # models can be used for validation (e.g. `Result.ommers_hash`).
+        return self.model_dump_json(exclude_none=True).encode()
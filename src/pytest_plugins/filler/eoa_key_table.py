@@ -0,0 +1,127 @@
+"""
+Table of the private keys and addresses of the EOAs allocated by the tests.
+
+The address of each EOA is derived from its private key, which requires an elliptic curve
+multiplication and a hash. Since the keys of the EOAs returned by the pre-alloc are the same
+in every test, their addresses are computed once, in chunks, and can be persisted to a
+directory shared by the xdist workers and between fill sessions.
+"""
+
+import os
+from hashlib import sha256
+from itertools import count
+from pathlib import Path
+from typing import Iterator, List
+
+from coincurve.keys import PrivateKey
+from filelock import FileLock
+
+from ethereum_test_base_types import Address, Bytes, Hash, TestPrivateKey, TestPrivateKey2
+from ethereum_test_types import EOA
+
+ADDRESS_SIZE = 20
+
+
+class EOAKeyTable:
+    """
+    Lazily-built table of the (private key, address) pairs of the pre-alloc EOAs.
+
+    The private key of the EOA at index `i` is `TestPrivateKey + i`, except for the EOA at
+    index 1, whose key is `TestPrivateKey2`.
+    """
+
+    cache_file: Path | None
+    chunk_size: int
+    _addresses: bytearray
+
+    def __init__(self, *, cache_dir: Path | None = None, chunk_size: int = 256):
+        """
+        Initialize the table, optionally backed by a file in `cache_dir`.
+        """
+        self.chunk_size = chunk_size
+        self._addresses = bytearray()
+        self.cache_file = None
+        if cache_dir is not None:
+            cache_dir = Path(cache_dir)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # The file is named after the keys it's derived from, to never reuse a stale table.
+            key_derivation = sha256(Hash(TestPrivateKey) + Hash(TestPrivateKey2)).hexdigest()
+            self.cache_file = cache_dir / f"eoa_addresses_{key_derivation[:16]}.bin"
+
+    def __len__(self) -> int:
+        """
+        Return the number of EOAs whose address has been computed or loaded.
+        """
+        return len(self._addresses) // ADDRESS_SIZE
+
+    @staticmethod
+    def key(index: int) -> Hash:
+        """
+        Return the private key of the EOA at the given index.
+        """
+        return Hash(TestPrivateKey + index if index != 1 else TestPrivateKey2)
+
+    @staticmethod
+    def compute_address(key: Hash) -> Address:
+        """
+        Derive the address of an account from its private key.
+        """
+        public_key = PrivateKey(secret=bytes(key)).public_key.format(compressed=False)
+        return Address(Bytes(public_key[1:]).keccak256()[32 - ADDRESS_SIZE :])
+
+    def _extend(self, addresses: bytearray, eoa_count: int) -> None:
+        """
+        Append the addresses of the EOAs up to index `eoa_count` to the given buffer.
+        """
+        for index in range(len(addresses) // ADDRESS_SIZE, eoa_count):
+            addresses += self.compute_address(self.key(index))
+
+    def ensure(self, eoa_count: int) -> None:
+        """
+        Make sure that the addresses of the first `eoa_count` EOAs are in the table, loading them
+        from the cache file or computing them, rounded up to a whole number of chunks.
+        """
+        if len(self) >= eoa_count:
+            return
+        eoa_count = -(-eoa_count // self.chunk_size) * self.chunk_size
+        if self.cache_file is None:
+            self._extend(self._addresses, eoa_count)
+            return
+        with FileLock(self.cache_file.with_suffix(".lock")):
+            addresses = bytearray()
+            if self.cache_file.exists():
+                addresses = bytearray(self.cache_file.read_bytes())
+                # Drop a trailing partial record, if any.
+                del addresses[len(addresses) - len(addresses) % ADDRESS_SIZE :]
+            if len(addresses) < eoa_count * ADDRESS_SIZE:
+                self._extend(addresses, eoa_count)
+                temp_file = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+                temp_file.write_bytes(addresses)
+                os.replace(temp_file, self.cache_file)
+        self._addresses = addresses
+
+    def address(self, index: int) -> Address:
+        """
+        Return the address of the EOA at the given index.
+        """
+        self.ensure(index + 1)
+        return Address(bytes(self._addresses[index * ADDRESS_SIZE : (index + 1) * ADDRESS_SIZE]))
+
+    def eoa(self, index: int) -> EOA:
+        """
+        Return a new EOA instance, with a nonce of zero, for the given index.
+        """
+        return EOA(self.address(index), key=self.key(index), nonce=0)
+
+    def eoas(self, start: int, eoa_count: int) -> List[EOA]:
+        """
+        Return new EOA instances, with a nonce of zero, for a range of indexes.
+        """
+        self.ensure(start + eoa_count)
+        return [self.eoa(index) for index in range(start, start + eoa_count)]
+
+    def iterate(self) -> Iterator[EOA]:
+        """
+        Return an iterator over new EOA instances, starting at index zero.
+        """
+        return (self.eoa(index) for index in count())
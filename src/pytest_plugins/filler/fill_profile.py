@@ -0,0 +1,109 @@
+"""
+Aggregation and reporting of the per-test stage timings recorded with `--profile-fill`.
+
+Each profiled test item is described by a plain dictionary (so that it can be sent from the
+xdist workers to the controller) with the keys:
+
+- `nodeid`: The pytest node ID of the test item.
+- `duration`: The wall-clock time spent in setup, call and teardown of the item (seconds).
+- `stages`: The time spent in each stage of the filling pipeline (seconds).
+
+The time spent in module- or session-scoped fixture teardown (e.g. completing and verifying the
+fixture files of a module) is attributed to the last test item of the scope.
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+from ethereum_test_base_types import StageProfiler
+
+FILL_PROFILE_FILE_NAME = "fill_profile"
+UNPROFILED_STAGE = "other"
+
+
+def profiled_stages(profiles: List[Dict[str, Any]]) -> List[str]:
+    """
+    Return the names of all stages recorded in the profiles, in pipeline order.
+    """
+    stages = list(StageProfiler.STAGES)
+    for profile in profiles:
+        for stage in profile["stages"]:
+            if stage not in stages:
+                stages.append(stage)
+    return stages
+
+
+def unprofiled_seconds(profile: Dict[str, Any]) -> float:
+    """
+    Return the time of a test item that was not spent in any of the profiled stages.
+    """
+    return max(profile["duration"] - sum(profile["stages"].values()), 0.0)
+
+
+def summarize_fill_profile(profiles: List[Dict[str, Any]], top: int) -> Dict[str, Any]:
+    """
+    Aggregate the stage timings of all test items and select the slowest items.
+    """
+    stages: Dict[str, Dict[str, Any]] = {}
+    for stage in profiled_stages(profiles) + [UNPROFILED_STAGE]:
+        if stage == UNPROFILED_STAGE:
+            timings = [unprofiled_seconds(profile) for profile in profiles]
+        else:
+            timings = [
+                profile["stages"][stage] for profile in profiles if stage in profile["stages"]
+            ]
+        stages[stage] = {
+            "items": len(timings),
+            "total_seconds": sum(timings),
+            "mean_seconds": sum(timings) / len(timings) if timings else 0.0,
+            "max_seconds": max(timings, default=0.0),
+        }
+    slowest = sorted(profiles, key=lambda profile: profile["duration"], reverse=True)[:top]
+    return {
+        "items": len(profiles),
+        "total_seconds": sum(profile["duration"] for profile in profiles),
+        "stages": stages,
+        "slowest_tests": slowest,
+    }
+
+
+def write_fill_profile(profiles: List[Dict[str, Any]], output_metadata_dir: Path, top: int):
+    """
+    Write the aggregated report as JSON and the per-item timings as CSV to the metadata
+    directory.
+    """
+    output_metadata_dir.mkdir(parents=True, exist_ok=True)
+    with open(output_metadata_dir / f"{FILL_PROFILE_FILE_NAME}.json", "w") as f:
+        json.dump(summarize_fill_profile(profiles, top), f, indent=4)
+
+    stages = profiled_stages(profiles)
+    with open(output_metadata_dir / f"{FILL_PROFILE_FILE_NAME}.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["nodeid", "duration"] + stages + [UNPROFILED_STAGE])
+        for profile in sorted(profiles, key=lambda profile: profile["nodeid"]):
+            writer.writerow(
+                [profile["nodeid"], f"{profile['duration']:.6f}"]
+                + [f"{profile['stages'].get(stage, 0.0):.6f}" for stage in stages]
+                + [f"{unprofiled_seconds(profile):.6f}"]
+            )
+
+
+def format_fill_profile(profiles: List[Dict[str, Any]], top: int) -> List[str]:
+    """
+    Return the lines of a human-readable version of the aggregated report.
+    """
+    summary = summarize_fill_profile(profiles, top)
+    total_seconds = summary["total_seconds"]
+    lines = [f"{summary['items']} test items, {total_seconds:.2f}s in total"]
+    for stage, timing in summary["stages"].items():
+        share = timing["total_seconds"] / total_seconds if total_seconds else 0.0
+        lines.append(
+            f"  {stage:<24} {timing['total_seconds']:>10.2f}s {share:>6.1%} "
+            f"(mean: {timing['mean_seconds']:.4f}s, max: {timing['max_seconds']:.4f}s)"
+        )
+    lines.append("slowest test items:")
+    for profile in summary["slowest_tests"]:
+        lines.append(f"  {profile['duration']:>10.2f}s {profile['nodeid']}")
+    return lines
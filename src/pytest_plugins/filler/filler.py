@@ -5,35 +5,50 @@ Top-level pytest configuration file providing:
 and that modifies pytest hooks in order to fill test specs for all tests and
 writes the generated fixtures to file.
 """
+import ast
 import configparser
 import datetime
 import os
 import tarfile
+import time
 import warnings
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Type
+from typing import Any, Dict, Generator, List, Set, Type
 
 import pytest
 from filelock import FileLock
 from pytest_metadata.plugin import metadata_key  # type: ignore
 
 from cli.gen_index import generate_fixtures_index
-from ethereum_test_base_types import Alloc, ReferenceSpec
-from ethereum_test_fixtures import FIXTURE_FORMATS, BaseFixture, FixtureCollector, TestInfo
+from ethereum_test_base_types import Alloc, ReferenceSpec, StageProfiler
+from ethereum_test_fixtures import (
+    FIXTURE_FORMATS,
+    BaseFixture,
+    FixtureCollector,
+    FixtureFile,
+    TestInfo,
+)
 from ethereum_test_forks import (
     Fork,
+    fork_method_cache_stats,
     get_closest_fork_with_solc_support,
     get_forks_with_solc_support,
 )
-from ethereum_test_specs import SPEC_TYPES, BaseTest
+from ethereum_test_specs import SPEC_TYPES, BaseTest, EOFTest
 from ethereum_test_tools import Yul
+from ethereum_test_tools.code import compile_yul_sources
 from ethereum_test_tools.utility.versioning import (
     generate_github_url,
     get_current_commit_hash_or_tag,
 )
-from evm_transition_tool import TransitionTool
+from ethereum_test_types import signature_cache_stats
+from ethereum_test_vm import stack_arguments_cache_stats
+from evm_transition_tool import TransitionTool, TransitionToolResultCache
 from pytest_plugins.spec_version_checker.spec_version_checker import EIPSpecTestItem
 
+from .fill_profile import format_fill_profile, write_fill_profile
+
 
 def default_output_directory() -> str:
     """
@@ -51,6 +66,37 @@ def default_html_report_file_path() -> str:
     return ".meta/report_fill.html"
 
 
+cache_stats_key = pytest.StashKey[Dict[str, Dict[str, int]]]()
+
+
+def add_cache_stats(config: pytest.Config, cache_name: str, stats: Dict[str, int]) -> None:
+    """
+    Add the hit and miss counters of a cache to the session's totals.
+    """
+    totals = config.stash.setdefault(cache_stats_key, {}).setdefault(cache_name, {})
+    for counter, value in stats.items():
+        totals[counter] = totals.get(counter, 0) + value
+
+
+def format_cache_stats(stats: Dict[str, int]) -> str:
+    """
+    Format the counters of a cache, or of the stream workers, for the terminal summary.
+    """
+    if "total_microseconds" in stats:
+        calls = stats.get("calls", 0)
+        mean_seconds = stats["total_microseconds"] / calls / 1_000_000 if calls else 0.0
+        return (
+            f"calls: {calls}, prespawned: {stats.get('prespawned_calls', 0)}, "
+            f"restarts: {stats.get('restarts', 0)}, mean latency: {mean_seconds:.4f}s"
+        )
+    hits, misses = stats.get("hits", 0), stats.get("misses", 0)
+    hit_rate = hits / (hits + misses) if hits + misses else 0.0
+    return f"hits: {hits}, misses: {misses}, hit rate: {hit_rate:.1%}"
+
+
+fill_profile_key = pytest.StashKey[List[Dict[str, Any]]]()
+
+
 def strip_output_tarball_suffix(output: Path) -> Path:
     """
     Strip the '.tar.gz' suffix from the output path.
@@ -113,6 +159,96 @@ def pytest_addoption(parser: pytest.Parser):
             "Default: The first (geth) 'evm' entry in PATH."
         ),
     )
+    evm_group.addoption(
+        "--verify-fixtures-workers",
+        action="store",
+        dest="verify_fixtures_workers",
+        type=int,
+        default=4,
+        help=(
+            "Maximum number of fixture files verified concurrently by each pytest process "
+            "(i.e., per xdist worker). Default: 4."
+        ),
+    )
+    evm_group.addoption(
+        "--verify-fixtures-at-session-end",
+        action="store_true",
+        dest="verify_fixtures_at_session_end",
+        default=False,
+        help=(
+            "Verify all fixture files written by a pytest process (i.e., per xdist worker) at "
+            "the end of the session instead of after each test module, to verify more files in "
+            "parallel."
+        ),
+    )
+    evm_group.addoption(
+        "--t8n-server-timeout",
+        action="store",
+        dest="t8n_server_timeout",
+        type=float,
+        default=None,
+        help=(
+            "Timeout in seconds of each request sent to a t8n-server. "
+            "Default: The transition tool's default (20s for ethereum-spec-evm-resolver)."
+        ),
+    )
+    evm_group.addoption(
+        "--t8n-scratch-dir",
+        action="store",
+        dest="t8n_scratch_dir",
+        type=Path,
+        default=None,
+        help=(
+            "Directory in which transition tools that exchange inputs and outputs via files "
+            "(e.g. evmone) write them, for example a tmpfs such as `/dev/shm`. "
+            "Default: The system's temporary directory."
+        ),
+    )
+    evm_group.addoption(
+        "--t8n-cache-dir",
+        action="store",
+        dest="t8n_cache_dir",
+        type=Path,
+        default=None,
+        help=(
+            "Path to a directory used to cache transition tool results across workers and fill "
+            "sessions. The cache is keyed by the t8n version, fork and t8n input; it's bypassed "
+            "when collecting traces or dumping t8n debug output. Default: No cache."
+        ),
+    )
+    evm_group.addoption(
+        "--t8n-cache-size",
+        action="store",
+        dest="t8n_cache_size",
+        type=int,
+        default=1024,
+        help=(
+            "Maximum size of the transition tool result cache in MiB; the least recently used "
+            "results are evicted first. Default: 1024."
+        ),
+    )
+    evm_group.addoption(
+        "--t8n-strict-output",
+        action="store_true",
+        dest="t8n_strict_output",
+        default=False,
+        help=(
+            "Validate the whole transition tool output as soon as it's received, instead of "
+            "validating each part of it the first time it's used. Useful to debug transition "
+            "tools that return malformed outputs."
+        ),
+    )
+    evm_group.addoption(
+        "--eof-cross-check",
+        action="store_true",
+        dest="eof_cross_check",
+        default=False,
+        help=(
+            "Validate every EOF container both in-process and with `evmone-eofparse`, and fail "
+            "if the results differ. By default, `evmone-eofparse` only validates the containers "
+            "whose in-process validation disagrees with the expected result."
+        ),
+    )
 
     test_group = parser.getgroup("tests", "Arguments defining filler location and output")
     test_group.addoption(
@@ -188,6 +324,26 @@ def pytest_addoption(parser: pytest.Parser):
         default="",
         help="Path to dump the transition tool debug output.",
     )
+    debug_group.addoption(
+        "--profile-fill",
+        action="store_true",
+        dest="profile_fill",
+        default=False,
+        help=(
+            "Record the time spent in each stage of filling every test (pre-alloc construction, "
+            "transaction signing, t8n serialization, execution and output validation, post-state "
+            "verification, fixture serialization and verification) and write the aggregated "
+            "report to the output directory's .meta folder (fill_profile.json/.csv)."
+        ),
+    )
+    debug_group.addoption(
+        "--profile-fill-top",
+        action="store",
+        dest="profile_fill_top",
+        type=int,
+        default=20,
+        help="Number of slowest tests listed in the --profile-fill report. Default: 20.",
+    )
 
 
 @pytest.hookimpl(tryfirst=True)
@@ -221,6 +377,9 @@ def pytest_configure(config):
     )
     if config.option.collectonly:
         return
+    if config.getoption("profile_fill"):
+        StageProfiler.enabled = True
+    EOFTest.cross_check_validation = config.getoption("eof_cross_check")
     if not config.getoption("disable_html") and config.getoption("htmlpath") is None:
         # generate an html report by default, unless explicitly disabled
         config.option.htmlpath = (
@@ -281,6 +440,85 @@ def pytest_report_teststatus(report, config: pytest.Config):
         return report.outcome, "", report.outcome.upper()
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem: pytest.Item | None):
+    """
+    Record the time spent in each stage of filling the test item if `--profile-fill` is set.
+    """
+    if not StageProfiler.enabled:
+        yield
+        return
+    StageProfiler.pop_stage_seconds()  # Discard time spent outside of any test item.
+    start = time.perf_counter()
+    yield
+    item.config.stash.setdefault(fill_profile_key, []).append(
+        {
+            "nodeid": item.nodeid,
+            "duration": time.perf_counter() - start,
+            "stages": StageProfiler.pop_stage_seconds(),
+        }
+    )
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int):
+    """
+    Send the cache counters and the fill profile of an xdist worker to the controller, or
+    write the fill profile report if this is the controller.
+    """
+    config = session.config
+    if StageProfiler.enabled:
+        add_cache_stats(config, "transaction signature cache", signature_cache_stats())
+        add_cache_stats(config, "opcode stack arguments cache", stack_arguments_cache_stats())
+        add_cache_stats(config, "yul compilation cache", Yul.compilation_cache.stats())
+        add_cache_stats(config, "fork method cache", fork_method_cache_stats())
+    if hasattr(config, "workeroutput"):
+        if cache_stats_key in config.stash:
+            config.workeroutput["cache_stats"] = config.stash[cache_stats_key]
+        if fill_profile_key in config.stash:
+            config.workeroutput["fill_profile"] = config.stash[fill_profile_key]
+        return
+    if fill_profile_key in config.stash and not is_output_stdout(config.getoption("output")):
+        write_fill_profile(
+            config.stash[fill_profile_key],
+            strip_output_tarball_suffix(config.getoption("output")) / ".meta",
+            config.getoption("profile_fill_top"),
+        )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    Collect the cache counters and the fill profile of a finished xdist worker.
+    """
+    workeroutput = getattr(node, "workeroutput", {})
+    for cache_name, stats in workeroutput.get("cache_stats", {}).items():
+        add_cache_stats(node.config, cache_name, stats)
+    if profiles := workeroutput.get("fill_profile"):
+        node.config.stash.setdefault(fill_profile_key, []).extend(profiles)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus: int, config: pytest.Config):
+    """
+    Report the cache hits and misses, and the fill profile.
+
+    Nothing is reported when the fixtures are written to stdout, to keep the output a
+    valid JSON document.
+    """
+    if hasattr(config, "workeroutput"):
+        return
+    if is_output_stdout(config.getoption("output")):
+        return
+    for cache_name, stats in config.stash.get(cache_stats_key, {}).items():
+        terminalreporter.write_sep("-", cache_name)
+        terminalreporter.write_line(format_cache_stats(stats))
+    if fill_profile_key in config.stash:
+        terminalreporter.write_sep("-", "fill profile")
+        for line in format_fill_profile(
+            config.stash[fill_profile_key], config.getoption("profile_fill_top")
+        ):
+            terminalreporter.write_line(line)
+
+
 def pytest_metadata(metadata):
     """
     Add or remove metadata to/from the pytest report.
@@ -395,8 +633,22 @@ def t8n(request: pytest.FixtureRequest, evm_bin: Path) -> Generator[TransitionTo
     t8n = TransitionTool.from_binary_path(
         binary_path=evm_bin, trace=request.config.getoption("evm_collect_traces")
     )
+    if t8n_server_timeout := request.config.getoption("t8n_server_timeout"):
+        t8n.server_timeout = t8n_server_timeout
+    if t8n_scratch_dir := request.config.getoption("t8n_scratch_dir"):
+        t8n.scratch_base_dir = t8n_scratch_dir
+    t8n.t8n_strict_output = request.config.getoption("t8n_strict_output")
+    if t8n_cache_dir := request.config.getoption("t8n_cache_dir"):
+        t8n.result_cache = TransitionToolResultCache(
+            directory=t8n_cache_dir,
+            max_size_bytes=request.config.getoption("t8n_cache_size") * 1024 * 1024,
+        )
     yield t8n
+    if StageProfiler.enabled and t8n.stream_workers is not None:
+        add_cache_stats(request.config, "t8n stream workers", t8n.stream_workers.stats.counters())
     t8n.shutdown()
+    if t8n.result_cache is not None:
+        add_cache_stats(request.config, "t8n result cache", t8n.result_cache.stats())
 
 
 @pytest.fixture(scope="session")
@@ -441,6 +693,30 @@ def evm_fixture_verification(
     evm_fixture_verification.shutdown()
 
 
+@pytest.fixture(scope="session")
+def deferred_fixture_files(
+    request: pytest.FixtureRequest,
+    do_fixture_verification: bool,
+    evm_fixture_verification: TransitionTool | None,
+) -> Generator[List[FixtureFile] | None, None, None]:
+    """
+    Returns the list of written fixture files to verify at the end of the session, or None
+    if each module's fixture files are verified when the module is finished.
+    """
+    if not do_fixture_verification or not request.config.getoption(
+        "verify_fixtures_at_session_end"
+    ):
+        yield None
+        return
+    fixture_files: List[FixtureFile] = []
+    yield fixture_files
+    assert evm_fixture_verification is not None
+    with StageProfiler.stage(StageProfiler.FIXTURE_VERIFICATION):
+        evm_fixture_verification.verify_fixture_files(
+            fixture_files, max_workers=request.config.getoption("verify_fixtures_workers")
+        )
+
+
 @pytest.fixture(scope="session")
 def base_dump_dir(request: pytest.FixtureRequest) -> Path | None:
     """
@@ -598,6 +874,7 @@ def fixture_collector(
     request: pytest.FixtureRequest,
     do_fixture_verification: bool,
     evm_fixture_verification: TransitionTool,
+    deferred_fixture_files: List[FixtureFile] | None,
     filler_path: Path,
     base_dump_dir: Path | None,
     output_dir: Path,
@@ -634,7 +911,15 @@ def fixture_collector(
     yield fixture_collector
     fixture_collector.dump_fixtures()
     if do_fixture_verification:
-        fixture_collector.verify_fixture_files(evm_fixture_verification)
+        if deferred_fixture_files is not None:
+            deferred_fixture_files.extend(
+                fixture_collector.get_verifiable_fixture_files(evm_fixture_verification)
+            )
+        else:
+            fixture_collector.verify_fixture_files(
+                evm_fixture_verification,
+                max_workers=request.config.getoption("verify_fixtures_workers"),
+            )
 
     fixture_collector_count = 0
     if session_temp_folder is not None:
@@ -671,6 +956,81 @@ def eips():
     return []
 
 
+def get_yul_target_fork(config: pytest.Config, node: pytest.Item, fork: Fork) -> Fork:
+    """
+    Return the fork whose EVM version is used to compile the Yul code of a test: the fork of
+    the `compile_yul_with` marker, if any, or the closest fork supported by solc.
+    """
+    solc_target_fork: Fork | None
+    marker = node.get_closest_marker("compile_yul_with")
+    if marker:
+        if not marker.args[0]:
+            pytest.fail(f"{node.name}: Expected one argument in 'compile_yul_with' marker.")
+        for solc_target_fork in config.forks:  # type: ignore
+            if solc_target_fork.name() == marker.args[0]:
+                break
+        else:
+            pytest.fail(f"{node.name}: Fork {marker.args[0]} not found in forks list.")
+        assert solc_target_fork in get_forks_with_solc_support(config.solc_version)  # type: ignore
+    else:
+        solc_target_fork = get_closest_fork_with_solc_support(
+            fork, config.solc_version  # type: ignore
+        )
+        assert solc_target_fork is not None, "No fork supports provided solc version."
+    return solc_target_fork
+
+
+def find_yul_sources(path: Path) -> List[str]:
+    """
+    Return the string literals passed as the first argument of the `yul` fixture or of `Yul`
+    in a test module. Sources built at runtime, such as f-strings, are not found.
+    """
+    sources: List[str] = []
+    for node in ast.walk(ast.parse(path.read_text(), filename=str(path))):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id in ("yul", "Yul")
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str)
+        ):
+            sources.append(node.args[0].value)
+    return sources
+
+
+def precompile_yul_sources(config: pytest.Config, items: List[pytest.Item]) -> None:
+    """
+    Compile the literal Yul sources of the modules of the collected tests, for the EVM versions
+    of the tests, in parallel, to fill the Yul compilation cache.
+    """
+    evm_versions: Dict[Path, Set[str]] = {}
+    for item in items:
+        if "yul" not in item.fixturenames:  # type: ignore
+            continue
+        fork: Fork = item.callspec.params["fork"]  # type: ignore
+        evm_versions.setdefault(item.path, set()).add(
+            get_yul_target_fork(config, item, fork).solc_name()
+        )
+    sources = [
+        (source, evm_version)
+        for path, path_evm_versions in evm_versions.items()
+        for source in find_yul_sources(path)
+        for evm_version in sorted(path_evm_versions)
+    ]
+    if not sources:
+        return
+    cache_directory = Yul.compilation_cache.directory
+    # Only one xdist worker compiles the sources if the cache is shared, the others then read
+    # them from the cache directory.
+    lock = FileLock(cache_directory / "precompile.lock") if cache_directory else nullcontext()
+    with lock:
+        try:
+            compile_yul_sources(sources)
+        except Exception as e:
+            warnings.warn(f"Skipping the precompilation of the Yul sources: {e}")
+
+
 @pytest.fixture
 def yul(fork: Fork, request):
     """
@@ -684,25 +1044,13 @@ def yul(fork: Fork, request):
     Test cases can override the default value by specifying a fixed version
     with the @pytest.mark.compile_yul_with(FORK) marker.
     """
-    solc_target_fork: Fork | None
-    marker = request.node.get_closest_marker("compile_yul_with")
-    if marker:
-        if not marker.args[0]:
-            pytest.fail(
-                f"{request.node.name}: Expected one argument in 'compile_yul_with' marker."
-            )
-        for fork in request.config.forks:
-            if fork.name() == marker.args[0]:
-                solc_target_fork = fork
-                break
-        else:
-            pytest.fail(f"{request.node.name}: Fork {marker.args[0]} not found in forks list.")
-        assert solc_target_fork in get_forks_with_solc_support(request.config.solc_version)
-    else:
-        solc_target_fork = get_closest_fork_with_solc_support(fork, request.config.solc_version)
-        assert solc_target_fork is not None, "No fork supports provided solc version."
-        if solc_target_fork != fork and request.config.getoption("verbose") >= 1:
-            warnings.warn(f"Compiling Yul for {solc_target_fork.name()}, not {fork.name()}.")
+    solc_target_fork = get_yul_target_fork(request.config, request.node, fork)
+    if (
+        request.node.get_closest_marker("compile_yul_with") is None
+        and solc_target_fork != fork
+        and request.config.getoption("verbose") >= 1
+    ):
+        warnings.warn(f"Compiling Yul for {solc_target_fork.name()}, not {fork.name()}.")
 
     class YulWrapper(Yul):
         def __new__(cls, *args, **kwargs):
@@ -883,6 +1231,8 @@ def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item
                 break
         if "yul" in item.fixturenames:  # type: ignore
             item.add_marker(pytest.mark.yul_test)
+    if config.getoption("yul_precompile"):
+        precompile_yul_sources(config, items)
 
 
 def pytest_make_parametrize_id(config, val, argname):
@@ -4,9 +4,9 @@ Pre-alloc specifically conditioned for test filling.
 
 import inspect
 from enum import IntEnum
-from functools import cache
-from itertools import count
-from typing import Iterator, Literal
+from itertools import count, islice
+from pathlib import Path
+from typing import Iterator, List, Literal
 
 import pytest
 from pydantic import PrivateAttr
@@ -17,8 +17,6 @@ from ethereum_test_base_types import (
     Number,
     Storage,
     StorageRootType,
-    TestPrivateKey,
-    TestPrivateKey2,
     ZeroPaddedHexNumber,
 )
 from ethereum_test_base_types.conversions import (
@@ -31,6 +29,8 @@ from ethereum_test_types import Alloc as BaseAlloc
 from ethereum_test_types.eof.v1 import Container
 from ethereum_test_vm import Bytecode, EVMCodeType, Opcodes
 
+from .eoa_key_table import EOAKeyTable
+
 CONTRACT_START_ADDRESS_DEFAULT = 0x1000
 CONTRACT_ADDRESS_INCREMENTS_DEFAULT = 0x100
 
@@ -77,6 +77,18 @@ def pytest_addoption(parser: pytest.Parser):
         choices=list(EVMCodeType),
         help="Type of EVM code to deploy in each test by default.",
     )
+    pre_alloc_group.addoption(
+        "--eoa-cache-dir",
+        action="store",
+        dest="eoa_cache_dir",
+        type=Path,
+        default=None,
+        help=(
+            "Path to a directory used to store the addresses of the EOAs funded by the tests, "
+            "shared across workers and fill sessions. Default: Addresses are computed in memory "
+            "by each worker."
+        ),
+    )
 
 
 class AllocMode(IntEnum):
@@ -232,6 +244,22 @@ class Alloc(BaseAlloc):
             super().__setitem__(eoa, account)
         return eoa
 
+    def fund_eoas(self, amount_of_eoas: int, amount: NumberConvertible | None = None) -> List[EOA]:
+        """
+        Add `amount_of_eoas` previously unused EOAs to the pre-alloc, each with the balance
+        specified by `amount`.
+
+        If amount is 0, nothing will be added to the pre-alloc but `amount_of_eoas` new and
+        unique EOAs will be returned.
+        """
+        eoas = list(islice(self._eoa_iterator, amount_of_eoas))
+        if amount is None:
+            amount = self._eoa_fund_amount_default
+        if Number(amount) > 0:
+            for eoa in eoas:
+                super().__setitem__(eoa, Account(nonce=0, balance=amount))
+        return eoas
+
     def fund_address(self, address: Address, amount: NumberConvertible):
         """
         Fund an address with a given amount.
@@ -287,20 +315,20 @@ def contract_address_iterator(
     )
 
 
-@cache
-def eoa_by_index(i: int) -> EOA:
+@pytest.fixture(scope="session")
+def eoa_key_table(request: pytest.FixtureRequest) -> EOAKeyTable:
     """
-    Returns an EOA by index.
+    Returns the table of the keys and addresses of the EOAs, shared by all tests.
     """
-    return EOA(key=TestPrivateKey + i if i != 1 else TestPrivateKey2, nonce=0)
+    return EOAKeyTable(cache_dir=request.config.getoption("eoa_cache_dir", default=None))
 
 
 @pytest.fixture(scope="function")
-def eoa_iterator() -> Iterator[EOA]:
+def eoa_iterator(eoa_key_table: EOAKeyTable) -> Iterator[EOA]:
     """
-    Returns an iterator over EOAs copies.
+    Returns an iterator over new EOA instances.
     """
-    return iter(eoa_by_index(i).copy() for i in count())
+    return eoa_key_table.iterate()
 
 
 @pytest.fixture(autouse=True)
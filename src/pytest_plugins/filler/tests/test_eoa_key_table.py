@@ -0,0 +1,35 @@
+"""
+Test the table of the keys and addresses of the pre-alloc EOAs.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from ethereum_test_base_types import TestAddress, TestAddress2, TestPrivateKey, TestPrivateKey2
+from ethereum_test_types import EOA
+
+from ..eoa_key_table import EOAKeyTable
+
+
+@pytest.mark.parametrize("use_cache_dir", [False, True])
+def test_eoa_key_table(tmp_path: Path, use_cache_dir: bool):
+    """
+    Test that the table returns the same EOAs as deriving the address of each key, also when
+    the addresses are loaded from the cache file written by another table.
+    """
+    cache_dir = tmp_path if use_cache_dir else None
+    eoas = EOAKeyTable(cache_dir=cache_dir, chunk_size=8).eoas(0, 20)
+    assert eoas[0] == TestAddress
+    assert eoas[0].key == TestPrivateKey
+    assert eoas[1] == TestAddress2
+    assert eoas[1].key == TestPrivateKey2
+    for i, eoa in enumerate(eoas):
+        assert eoa == EOA(key=TestPrivateKey + i if i != 1 else TestPrivateKey2)
+        assert eoa.nonce == 0
+
+    table = EOAKeyTable(cache_dir=cache_dir, chunk_size=8)
+    if use_cache_dir:
+        table.ensure(1)
+        assert len(table) == 24
+    assert table.eoas(10, 20) == eoas[10:] + table.eoas(20, 10)
@@ -0,0 +1,49 @@
+"""
+Test the aggregation of the per-test stage timings recorded with `--profile-fill`.
+"""
+
+import csv
+import json
+from pathlib import Path
+
+from ..fill_profile import FILL_PROFILE_FILE_NAME, summarize_fill_profile, write_fill_profile
+
+profiles = [
+    {"nodeid": "test_a", "duration": 1.0, "stages": {"tx_signing": 0.25, "t8n_execution": 0.5}},
+    {"nodeid": "test_b", "duration": 3.0, "stages": {"t8n_execution": 2.0}},
+    {"nodeid": "test_c", "duration": 2.0, "stages": {"custom_stage": 1.0}},
+]
+
+
+def test_summarize_fill_profile():
+    """
+    Test that the stage timings of all items are aggregated and the slowest items selected.
+    """
+    summary = summarize_fill_profile(profiles, top=2)
+    assert summary["items"] == 3
+    assert summary["total_seconds"] == 6.0
+    assert summary["stages"]["t8n_execution"] == {
+        "items": 2,
+        "total_seconds": 2.5,
+        "mean_seconds": 1.25,
+        "max_seconds": 2.0,
+    }
+    assert summary["stages"]["custom_stage"]["total_seconds"] == 1.0
+    assert summary["stages"]["fixture_verification"]["items"] == 0
+    assert summary["stages"]["other"]["total_seconds"] == 2.25
+    assert [profile["nodeid"] for profile in summary["slowest_tests"]] == ["test_b", "test_c"]
+
+
+def test_write_fill_profile(tmp_path: Path):
+    """
+    Test that the JSON report and the per-item CSV are written to the metadata directory.
+    """
+    write_fill_profile(profiles, tmp_path / ".meta", top=1)
+    with open(tmp_path / ".meta" / f"{FILL_PROFILE_FILE_NAME}.json") as f:
+        assert json.load(f)["slowest_tests"] == [profiles[1]]
+    with open(tmp_path / ".meta" / f"{FILL_PROFILE_FILE_NAME}.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["nodeid"] for row in rows] == ["test_a", "test_b", "test_c"]
+    assert float(rows[0]["tx_signing"]) == 0.25
+    assert float(rows[0]["other"]) == 0.25
+    assert float(rows[2]["custom_stage"]) == 1.0
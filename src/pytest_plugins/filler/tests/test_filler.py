@@ -11,7 +11,11 @@ from pathlib import Path
 
 import pytest
 
-from pytest_plugins.filler.filler import default_output_directory
+from pytest_plugins.filler.filler import (
+    default_output_directory,
+    find_yul_sources,
+    format_cache_stats,
+)
 
 
 # flake8: noqa
@@ -574,3 +578,39 @@ def test_fixture_output_based_on_command_line_args(
         assert "build" in properties
         build_name = args[args.index("--build-name") + 1]
         assert properties["build"] == build_name
+
+
+def test_find_yul_sources(tmp_path: Path):
+    """
+    Test that only the literal Yul sources passed to `yul` or `Yul` are found.
+    """
+    module = tmp_path / "test_module.py"
+    module.write_text(
+        textwrap.dedent(
+            """
+            def test_yul(yul, fork, slot):
+                yul("{ sstore(0, 1) }")
+                Yul("{ stop() }", fork=fork)
+                yul(f"{{ sstore({slot}, 1) }}")
+                compile("{ invalid() }")
+            """
+        )
+    )
+    assert find_yul_sources(module) == ["{ sstore(0, 1) }", "{ stop() }"]
+
+
+@pytest.mark.parametrize(
+    "stats,expected",
+    [
+        ({"hits": 3, "misses": 1}, "hits: 3, misses: 1, hit rate: 75.0%"),
+        (
+            {"calls": 4, "prespawned_calls": 3, "restarts": 1, "total_microseconds": 10_000},
+            "calls: 4, prespawned: 3, restarts: 1, mean latency: 0.0025s",
+        ),
+    ],
+)
+def test_format_cache_stats(stats: dict, expected: str):
+    """
+    Test the summary of the cache and stream worker counters.
+    """
+    assert format_cache_stats(stats) == expected
@@ -15,12 +15,14 @@ from ..pre_alloc import (
     AllocMode,
     contract_address_iterator,
     eoa_iterator,
+    eoa_key_table,
     pre,
 )
 
 globals()["pre"] = pre
 globals()["contract_address_iterator"] = contract_address_iterator
 globals()["eoa_iterator"] = eoa_iterator
+globals()["eoa_key_table"] = eoa_key_table
 
 pytestmark = [
     pytest.mark.parametrize("alloc_mode", [AllocMode.STRICT, AllocMode.PERMISSIVE]),
@@ -77,3 +79,21 @@ def test_alloc_fund_sender(pre: Alloc):
     assert pre_sender_2 is not None
     assert pre_sender_1.balance == 10**18
     assert pre_sender_2.balance == 10**18
+
+
+def test_alloc_fund_eoas(pre: Alloc):
+    """
+    Test `Alloc.fund_eoas` functionallity.
+    """
+    sender = pre.fund_eoa(10**18)
+    senders = pre.fund_eoas(300, 10**18)
+    unfunded_senders = pre.fund_eoas(2, 0)
+    assert Address(sender) == TestAddress
+    assert Address(senders[0]) == TestAddress2
+    assert len(set(senders + unfunded_senders + [sender])) == 303
+    for eoa in senders:
+        pre_sender = pre[eoa]
+        assert pre_sender is not None
+        assert pre_sender.balance == 10**18
+    for eoa in unfunded_senders:
+        assert eoa not in pre
@@ -3,6 +3,7 @@ Pytest plugin for configuring and installing the solc compiler.
 """
 
 from argparse import ArgumentTypeError
+from pathlib import Path
 from shutil import which
 
 import pytest
@@ -11,7 +12,7 @@ from pytest_metadata.plugin import metadata_key  # type: ignore
 from semver import Version
 
 from ethereum_test_forks import Frontier
-from ethereum_test_tools.code import Solc
+from ethereum_test_tools.code import Solc, Yul, YulCompilationCache
 
 DEFAULT_SOLC_VERSION = "0.8.24"
 
@@ -39,6 +40,30 @@ def pytest_addoption(parser: pytest.Parser):
         default=None,
         help=f"Version of the solc compiler to use. Default: {DEFAULT_SOLC_VERSION}.",
     )
+    solc_group.addoption(
+        "--yul-cache-dir",
+        action="store",
+        dest="yul_cache_dir",
+        type=Path,
+        default=None,
+        help=(
+            "Path to a directory used to cache the bytecode compiled from Yul sources across "
+            "workers and fill sessions. The cache is keyed by the solc version, the EVM version "
+            "and the source. Default: Only cache in memory."
+        ),
+    )
+    solc_group.addoption(
+        "--yul-precompile",
+        action="store_true",
+        dest="yul_precompile",
+        default=False,
+        help=(
+            "Compile the literal Yul sources of the collected tests in parallel after the "
+            "collection, instead of one at a time when each test runs. The compiled sources are "
+            "shared through the --yul-cache-dir directory, or the pytest cache directory if "
+            "it's not set."
+        ),
+    )
 
 
 @pytest.hookimpl(tryfirst=True)
@@ -95,6 +120,27 @@ def pytest_configure(config: pytest.Config):
     config.solc_version = solc_version_semver  # type: ignore
 
 
+def pytest_sessionstart(session: pytest.Session):
+    """
+    Set up the cache of the bytecode compiled from Yul sources.
+
+    This is done once the pytest cache is available, which is the default location of the
+    cache when the sources are compiled after the collection.
+    """
+    config = session.config
+    yul_cache_dir = config.getoption("yul_cache_dir")
+    if yul_cache_dir is None and config.getoption("yul_precompile"):
+        # The sources compiled after the collection can only be shared with the xdist workers
+        # through a directory.
+        if getattr(config, "cache", None) is None:
+            raise pytest.UsageError(
+                "--yul-precompile requires --yul-cache-dir when the pytest cache is disabled."
+            )
+        yul_cache_dir = config.cache.mkdir("yul-compilation-cache")  # type: ignore
+    if yul_cache_dir:
+        Yul.compilation_cache = YulCompilationCache(directory=yul_cache_dir)
+
+
 @pytest.fixture(autouse=True, scope="session")
 def solc_bin(request: pytest.FixtureRequest):
     """